@@ -0,0 +1,75 @@
+"""Benchmark of the yaml loading throughput of large integration files.
+
+Compares the pure python yaml loader with the loader used by tools.yaml_safe_load (libyaml based when available),
+on a unified integration with an embedded base64 image, or on the given yml files.
+
+Usage:
+    python benchmarks/yaml_loading_benchmark.py [yml file paths]
+"""
+import base64
+import os
+import sys
+import tempfile
+import timeit
+
+import yaml
+from demisto_sdk.commands.common import tools
+from demisto_sdk.commands.common.git_tools import git_path
+
+INTEGRATION_PATH = os.path.join(git_path(), 'demisto_sdk', 'tests', 'test_files', 'integration-test.yml')
+IMAGE_SIZE = 1024 * 1024
+SCRIPT_REPETITIONS = 200
+RUNS = 5
+
+
+def create_unified_integration(output_dir):
+    """Creates a large unified integration, with an embedded base64 image and a long script.
+
+    Args:
+        output_dir (str): the directory to create the integration in.
+
+    Returns:
+        str. the path of the created integration.
+    """
+    with open(INTEGRATION_PATH) as integration_file:
+        integration = yaml.safe_load(integration_file)
+    integration['image'] = 'data:image/png;base64,' + base64.b64encode(os.urandom(IMAGE_SIZE)).decode()
+    integration['script']['script'] = '\n'.join(f'def command_{i}(client, args):\n    return client.get("{i}")\n'
+                                                for i in range(SCRIPT_REPETITIONS * 10))
+
+    unified_path = os.path.join(output_dir, 'integration-Unified.yml')
+    with open(unified_path, 'w') as unified_file:
+        yaml.safe_dump(integration, unified_file)
+    return unified_path
+
+
+def benchmark_file(file_path):
+    """Prints the loading throughput of a yml file, with each of the loaders.
+
+    Args:
+        file_path (str): the yml file path.
+    """
+    with open(file_path) as yml_file:
+        content = yml_file.read()
+    size_mb = len(content.encode()) / (1024 * 1024)
+    print(f'{file_path} ({size_mb:.2f} MB)')
+
+    loaders = [('yaml.safe_load', yaml.safe_load),
+               (f'tools.yaml_safe_load ({tools.YAML_SAFE_LOADER.__name__})', tools.yaml_safe_load)]
+    for loader_name, load in loaders:
+        seconds = min(timeit.repeat(lambda: load(content), number=1, repeat=RUNS))
+        print(f'    {loader_name:<45} {seconds * 1000:8.1f} ms {size_mb / seconds:8.2f} MB/s')
+
+
+def main(file_paths):
+    if file_paths:
+        for file_path in file_paths:
+            benchmark_file(file_path)
+        return
+
+    with tempfile.TemporaryDirectory() as output_dir:
+        benchmark_file(create_unified_integration(output_dir))
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
@@ -283,6 +283,9 @@ def unify(**kwargs):
 @click.option(
     '--skip-pack-dependencies', is_flag=True,
     help='Skip validation of pack dependencies.')
+@click.option(
+    '-w', '--workers', type=click.IntRange(min=1), default=1, show_default=True,
+    help='The number of worker processes to run the validations with, in -a and -g modes.')
 @pass_config
 def validate(config, **kwargs):
     sys.path.append(config.configuration.env_dir)
@@ -309,7 +312,8 @@ def validate(config, **kwargs):
             silence_init_prints=kwargs['silence_init_prints'],
             skip_dependencies=kwargs['skip_pack_dependencies'],
             id_set_path=kwargs.get('id_set_path'),
-            staged=kwargs['staged']
+            staged=kwargs['staged'],
+            workers=kwargs['workers']
         )
         return validator.run_validation()
     except (git.InvalidGitRepositoryError, git.NoSuchPathError, FileNotFoundError):
@@ -332,6 +336,9 @@ def validate(config, **kwargs):
               type=click.Path(file_okay=False, resolve_path=True))
 @click.option('--zip/--no-zip', help='Zip content artifacts folders', default=True)
 @click.option('--packs', help='Create only content_packs artifacts.', is_flag=True)
+@click.option('--zip-packs', help='Zip each pack of content_packs to uploadable_packs/<pack>.zip.', is_flag=True)
+@click.option('--incremental', help='Reuse the artifacts of the previous run in the same artifacts path for packs and '
+                                    'objects which were not changed since.', is_flag=True)
 @click.option('-v', '--content_version', help='The content version in CommonServerPython.', default='0.0.0')
 @click.option('-s', '--suffix', help='Suffix to add all yaml/json/yml files in the created artifacts.')
 @click.option('--cpus',
@@ -415,9 +422,12 @@ def secrets(config, **kwargs):
               type=click.Path(exists=True, resolve_path=True))
 @click.option("-lp", "--log-path", help="Path to store all levels of logs",
               type=click.Path(exists=True, resolve_path=True))
+@click.option("--no-cache", is_flag=True, help="Run all the checks, including the checks which already passed on "
+                                               "unchanged packages")
 def lint(input: str, git: bool, all_packs: bool, verbose: int, quiet: bool, parallel: int, no_flake8: bool,
          no_bandit: bool, no_mypy: bool, no_vulture: bool, no_xsoar_linter: bool, no_pylint: bool, no_test: bool, no_pwsh_analyze: bool,
-         no_pwsh_test: bool, keep_container: bool, prev_ver: str, test_xml: str, failure_report: str, log_path: str):
+         no_pwsh_test: bool, keep_container: bool, prev_ver: str, test_xml: str, failure_report: str, log_path: str,
+         no_cache: bool):
     """Lint command will perform:\n
         1. Package in host checks - flake8, bandit, mypy, vulture.\n
         2. Package in docker image checks -  pylint, pytest, powershell - test, powershell - analyze.\n
@@ -442,7 +452,8 @@ def lint(input: str, git: bool, all_packs: bool, verbose: int, quiet: bool, para
                                          no_pwsh_test=no_pwsh_test,
                                          keep_container=keep_container,
                                          test_xml=test_xml,
-                                         failure_report=failure_report)
+                                         failure_report=failure_report,
+                                         use_cache=not no_cache)
 
 
 # ====================== format ====================== #
@@ -494,6 +505,9 @@ def format_yml(**kwargs):
     "--insecure", help="Skip certificate validation", is_flag=True)
 @click.option(
     "-v", "--verbose", help="Verbose output", is_flag=True)
+@click.option(
+    "-p", "--parallel", help="The number of content items of the same entity type to upload at a time",
+    type=click.IntRange(min=1), default=1, show_default=True)
 def upload(**kwargs):
     uploader = Uploader(**kwargs)
     return uploader.upload()
@@ -821,7 +835,11 @@ def generate_doc(**kwargs):
 )
 @click.option(
     "-o", "--output", help="Output file path, the default is the Tests directory.", default='', required=False)
+@click.option(
+    "--no-cache", is_flag=True, help="Re-process all the content files instead of only the ones which changed "
+                                     "since the previous id set creation.", default=False)
 def id_set_command(**kwargs):
+    kwargs['use_cache'] = not kwargs.pop('no_cache')
     id_set_creator = IDSetCreator(**kwargs)
     id_set_creator.create_id_set()
 
@@ -948,8 +966,11 @@ def update_pack_releasenotes(**kwargs):
     '-h', '--help'
 )
 @click.option(
-    "-i", "--input", help="Pack path to find dependencies. For example: Pack/HelloWorld", required=True,
+    "-i", "--input", help="Pack path to find dependencies. For example: Pack/HelloWorld", required=False,
     type=click.Path(exists=True, dir_okay=True))
+@click.option(
+    "--all-packs", help="Find the dependencies of all the packs in the content repository, and update the pack "
+                        "metadata of all of them in a single run.", required=False, is_flag=True)
 @click.option(
     "-idp", "--id-set-path", help="Path to id set json file.", required=False)
 @click.option(
@@ -958,9 +979,21 @@ def update_pack_releasenotes(**kwargs):
 @click.option(
     "-v", "--verbose", help="Path to debug md file. will state pack dependency per item.",
     hidden=True, required=False)
-def find_dependencies_command(id_set_path, verbose, no_update, **kwargs):
+def find_dependencies_command(id_set_path, verbose, no_update, all_packs, **kwargs):
     update_pack_metadata = not no_update
     input_path: Path = kwargs["input"]  # To not shadow python builtin `input`
+    if all_packs:
+        if input_path:
+            print_error("Please provide either an input pack or the --all-packs flag, not both.")
+            sys.exit(1)
+        PackDependencies.find_dependencies_for_all_packs(id_set_path=id_set_path,
+                                                         debug_file_path=verbose,
+                                                         update_pack_metadata=update_pack_metadata,
+                                                         )
+        return
+    if not input_path:
+        print_error("Please provide an input pack or use the --all-packs flag.")
+        sys.exit(1)
     try:
         assert "Packs/" in input_path
         pack_name = str(input_path).replace("Packs/", "")
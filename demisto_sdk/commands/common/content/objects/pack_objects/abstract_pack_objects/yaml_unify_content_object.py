@@ -1,10 +1,11 @@
 import copy
-from typing import List, Optional, Union
+from typing import Callable, Dict, List, Optional, Union
 
 import demisto_sdk.commands.common.content.errors as exc
 from demisto_sdk.commands.common.constants import (INTEGRATIONS_DIR,
-                                                   SCRIPTS_DIR, FileType)
-from demisto_sdk.commands.unify.unifier import Unifier
+                                                   SCRIPTS_DIR,
+                                                   TYPE_TO_EXTENSION, FileType)
+from demisto_sdk.commands.unify.unifier import PACK_METADATA_PATH, Unifier
 from wcmatch.pathlib import EXTMATCH, Path
 
 from .yaml_content_object import YAMLContentObject
@@ -21,9 +22,13 @@ class YAMLContentUnifiedObject(YAMLContentObject):
 
         Args:
             content_type: Only 2 availble content types - Script / Integration. (Mandatory for init - Used for unify or split)
+
+        Attributes:
+            code_transform: Modification of the code when unified, the code file itself is not changed.
         """
         super().__init__(path, file_name_prefix)
         self._content_type = content_type
+        self.code_transform: Optional[Callable[[str], str]] = None
 
     @property
     def code_path(self) -> Optional[Path]:
@@ -92,6 +97,7 @@ class YAMLContentUnifiedObject(YAMLContentObject):
 
     def _unify(self, dest_dir: Path) -> List[Path]:
         """Unify YAMLContentUnfiedObject in destination dir.
+        The already loaded yml is unified in memory with the package files, and each unified yml is written once.
 
         Args:
             dest_dir: Destination directory.
@@ -101,18 +107,43 @@ class YAMLContentUnifiedObject(YAMLContentObject):
 
         TODO:
             1. Add Exception raising in unify module.
-            2. Verbosity to quiet mode option in unify module.
         """
         # Directory configuration - Integrations or Scripts
         unify_dir = SCRIPTS_DIR if self._content_type == FileType.SCRIPT else INTEGRATIONS_DIR
         # Unify step
-        unifier = Unifier(input=str(self.path.parent), dir_name=unify_dir, output=dest_dir, force=True)
-        created_files: List[str] = unifier.merge_script_package_to_yml()
+        unifier = Unifier(input=str(self.path.parent), dir_name=unify_dir, output=str(dest_dir), force=True,
+                          yml_data=self.to_dict())
+        output_map: Dict[str, dict] = unifier.unify_package_data(**self._package_files_data(unifier),
+                                                                 code_transform=self.code_transform)
         # Validate that unify succeed - there is not exception raised in unify module.
-        if not created_files:
+        if not output_map:
             raise exc.ContentDumpError(self, self.path, "Unable to unify object")
+        unifier.write_yaml_files(output_map)
+
+        return [Path(path) for path in output_map]
+
+    def _package_files_data(self, unifier: Unifier) -> dict:
+        """Read the package files which are unified with the yml (Code, Image, Description and Pack metadata).
 
-        return [Path(path) for path in created_files]
+        Args:
+            unifier: Unifier of the object package.
+
+        Returns:
+            dict: Arguments of Unifier.unify_package_data.
+        """
+        def read_bytes(path: Optional[str]) -> Optional[bytes]:
+            return Path(path).read_bytes() if path else None
+
+        script_type = TYPE_TO_EXTENSION[unifier.get_script_obj()['type']]
+        readme = self.path.parent / 'README.md'
+
+        return {
+            'script_code': Path(unifier.get_code_file(script_type)).read_bytes(),
+            'image_data': read_bytes(unifier.get_data_path(unifier.package_path, '*png')),
+            'desc_data': read_bytes(unifier.get_data_path(unifier.package_path, '*_description.md')),
+            'has_readme': readme.is_file() and readme.stat().st_size != 0,
+            'pack_metadata_data': read_bytes(unifier.get_data_path(unifier.get_pack_path(), PACK_METADATA_PATH))
+        }
 
     def _split_yaml_4_5_0(self, dest_dir: Path) -> List[Path]:
         """Split YAMLContentUnfiedObject in destination dir.
@@ -130,22 +161,22 @@ class YAMLContentUnifiedObject(YAMLContentObject):
 
         TODO:
             1. Add Exception raising in unify module.
-            2. Verbosity to quiet mode option in unify module.
         """
         # Directory configuration - Integrations or Scripts
         unify_dir = SCRIPTS_DIR if self._content_type == FileType.SCRIPT else INTEGRATIONS_DIR
         # Split step
-        unifier = Unifier(input=str(self.path.parent), dir_name=unify_dir, output=str(dest_dir / self.path.name),
-                          force=True)
         yaml_dict = self.to_dict()
+        unifier = Unifier(input=str(self.path.parent), dir_name=unify_dir, output=str(dest_dir / self.path.name),
+                          force=True, yml_data=yaml_dict)
         yaml_dict_copy = copy.deepcopy(yaml_dict)
         script_object = self.script
-        created_files: List[str] = unifier.write_yaml_with_docker(yaml_dict_copy, yaml_dict, script_object).keys()
+        output_map: Dict[str, dict] = unifier.split_yaml_with_docker(yaml_dict_copy, yaml_dict, script_object)
         # Validate that split succeed - there is not exception raised in unify module.
-        if not created_files:
+        if not output_map:
             raise exc.ContentDumpError(self, self.path, "Unable to split object")
+        unifier.write_yaml_files(output_map)
 
-        return [Path(path) for path in created_files]
+        return [Path(path) for path in output_map]
 
     def dump(self, dest_dir: Optional[Union[str, Path]] = None, change_log: Optional[bool] = False,
              readme: Optional[bool] = False, unify: bool = True) -> List[Path]:
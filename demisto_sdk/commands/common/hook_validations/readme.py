@@ -3,10 +3,11 @@ import json
 import os
 import re
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from functools import lru_cache
 from pathlib import Path
 from threading import Lock
-from typing import Optional
+from typing import Dict, List, Optional
 
 import requests
 from demisto_sdk.commands.common.errors import Errors
@@ -18,6 +19,9 @@ from demisto_sdk.commands.common.tools import (get_content_path, print_warning,
 NO_HTML = '<!-- NOT_HTML_DOC -->'
 YES_HTML = '<!-- HTML_DOC -->'
 
+# Number of README files to parse in a single request to the mdx server
+MDX_BATCH_SIZE = 20
+
 
 class ReadMeValidator(BaseValidator):
     """ReadMeValidator is a validator for readme.md files
@@ -33,7 +37,12 @@ class ReadMeValidator(BaseValidator):
 
     # Static var to hold the mdx server process
     _MDX_SERVER_PROCESS: Optional[subprocess.Popen] = None
+    _MDX_SERVER_PORT: Optional[int] = None
     _MDX_SERVER_LOCK = Lock()
+    # HTTP session to the mdx server of each process, to reuse the connections
+    _MDX_SESSIONS: Dict[int, requests.Session] = {}
+    # Mdx parse errors of README files parsed ahead by parse_mdx_files (None for valid files)
+    _MDX_ERRORS: Dict[str, Optional[str]] = {}
 
     def __init__(self, file_path: str, ignored_errors=None, print_as_warnings=False, suppress_print=False):
         super().__init__(ignored_errors=ignored_errors, print_as_warnings=print_as_warnings,
@@ -65,29 +74,91 @@ class ReadMeValidator(BaseValidator):
         return True
 
     def mdx_verify_server(self) -> bool:
-        if not ReadMeValidator._MDX_SERVER_PROCESS:
-            ReadMeValidator.start_mdx_server()
-        with open(self.file_path, 'r') as f:
-            readme_content = f.read()
-        response = requests.post('http://localhost:6161', data=readme_content.encode('utf-8'), timeout=10)
-        if response.status_code != 200:
-            error_message, error_code = Errors.readme_error(response.text)
+        file_path = str(self.file_path.absolute())
+        if file_path in ReadMeValidator._MDX_ERRORS:
+            error = ReadMeValidator._MDX_ERRORS.pop(file_path)
+        else:
+            with open(self.file_path, 'r') as f:
+                readme_content = f.read()
+            error = ReadMeValidator.mdx_server_parse([readme_content])[0]
+        if error:
+            error_message, error_code = Errors.readme_error(error)
             if self.handle_error(error_message, error_code, file_path=self.file_path):
                 return False
         return True
 
     def is_mdx_file(self) -> bool:
         html = self.is_html_doc()
-        valid = os.environ.get('DEMISTO_README_VALIDATION') or os.environ.get('CI') or self.are_modules_installed_for_verify(self.content_path)
-        if valid and not html:
-            # add to env var the directory of node modules
-            os.environ['NODE_PATH'] = str(self.node_modules_path) + os.pathsep + os.getenv("NODE_PATH", "")
+        if self.is_mdx_verify_enabled(self.content_path) and not html:
             if os.getenv('DEMISTO_MDX_CMD_VERIFY'):
                 return self.mdx_verify()
             else:
                 return self.mdx_verify_server()
         return True
 
+    @staticmethod
+    def is_mdx_verify_enabled(content_path) -> bool:
+        """ Whether README files should be verified as mdx, adding the node modules of the content repo to NODE_PATH.
+        Args:
+            content_path: The content repo path.
+        Returns:
+            bool: True if README files should be verified, else False.
+        """
+        valid = os.environ.get('DEMISTO_README_VALIDATION') or os.environ.get('CI') or \
+            ReadMeValidator.are_modules_installed_for_verify(content_path)
+        if valid:
+            # add to env var the directory of node modules
+            os.environ['NODE_PATH'] = str(Path(content_path) / 'node_modules') + os.pathsep + os.getenv("NODE_PATH", "")
+        return bool(valid)
+
+    @staticmethod
+    def mdx_server_parse(readme_contents: List[str]) -> List[Optional[str]]:
+        """ Parse README contents as mdx in a single request to the mdx server, starting it if not started.
+        Args:
+            readme_contents: The README files contents.
+        Returns:
+            list: The parse error of each README content, None if parsed successfully.
+        """
+        if not ReadMeValidator._MDX_SERVER_PROCESS:
+            ReadMeValidator.start_mdx_server()
+        # Sessions are not shared with forked processes, each process connects with its own session
+        session = ReadMeValidator._MDX_SESSIONS.setdefault(os.getpid(), requests.Session())
+        response = session.post(f'http://localhost:{ReadMeValidator._MDX_SERVER_PORT}/batch',
+                                data=json.dumps(readme_contents).encode('utf-8'),
+                                timeout=10 + len(readme_contents))
+        if response.status_code != 200:
+            return [response.text] * len(readme_contents)
+        return response.json()
+
+    @staticmethod
+    def parse_mdx_files(file_paths: List[str], workers: int = 1):
+        """ Parse README files as mdx ahead of their validation, in batches sent concurrently to a mdx server of
+        the given number of workers. The parse errors are used when validating the files in this process, or in
+        processes forked from it.
+        Args:
+            file_paths: The README files paths.
+            workers: The number of mdx server workers and concurrent batches.
+        """
+        if os.getenv('DEMISTO_MDX_CMD_VERIFY') or not ReadMeValidator.is_mdx_verify_enabled(get_content_path()):
+            return
+        readme_contents: Dict[str, str] = {}
+        for file_path in file_paths:
+            with open(file_path, 'r') as f:
+                readme_content = f.read()
+            if not ReadMeValidator.is_html_content(readme_content):
+                readme_contents[str(Path(file_path).absolute())] = readme_content
+        paths = list(readme_contents)
+        batches = [paths[i:i + MDX_BATCH_SIZE] for i in range(0, len(paths), MDX_BATCH_SIZE)]
+        if not batches:
+            return
+        if not ReadMeValidator._MDX_SERVER_PROCESS:
+            ReadMeValidator.start_mdx_server(workers=workers)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            batches_errors = executor.map(lambda batch: ReadMeValidator.mdx_server_parse(
+                [readme_contents[path] for path in batch]), batches)
+            for batch, errors in zip(batches, batches_errors):
+                ReadMeValidator._MDX_ERRORS.update(zip(batch, errors))
+
     @staticmethod
     @lru_cache(None)
     def are_modules_installed_for_verify(content_path: str) -> bool:
@@ -124,7 +195,12 @@ class ReadMeValidator(BaseValidator):
     def is_html_doc(self) -> bool:
         txt = ''
         with open(self.file_path, 'r') as f:
-            txt = f.read(4096).strip()
+            txt = f.read(4096)
+        return self.is_html_content(txt)
+
+    @staticmethod
+    def is_html_content(txt: str) -> bool:
+        txt = txt[:4096].strip()
         if txt.startswith(NO_HTML):
             return False
         if txt.startswith(YES_HTML):
@@ -148,22 +224,34 @@ class ReadMeValidator(BaseValidator):
         return True
 
     @staticmethod
-    def start_mdx_server():
+    def start_mdx_server(workers: int = 1):
+        """ Start the mdx server on a free port, so servers of different processes do not collide.
+        The server exits when its stdin is closed, so it does not outlive this process.
+        Args:
+            workers: The number of node worker processes of the server.
+        """
         with ReadMeValidator._MDX_SERVER_LOCK:
             if not ReadMeValidator._MDX_SERVER_PROCESS:
                 mdx_parse_server = Path(__file__).parent.parent / 'mdx-parse-server.js'
-                ReadMeValidator._MDX_SERVER_PROCESS = subprocess.Popen(['node', str(mdx_parse_server)],
-                                                                       stdout=subprocess.PIPE, text=True)
+                ReadMeValidator._MDX_SERVER_PROCESS = subprocess.Popen(
+                    ['node', str(mdx_parse_server), '--port', '0', '--workers', str(workers)],
+                    stdin=subprocess.PIPE, stdout=subprocess.PIPE, text=True)
                 line = ReadMeValidator._MDX_SERVER_PROCESS.stdout.readline()
-                if 'MDX server is listening on port' not in line:
+                port = re.search(r'MDX server is listening on port: (\d+)', line)
+                if not port:
                     ReadMeValidator.stop_mdx_server()
                     raise Exception(f'Failed starting mdx server. stdout: {line}.')
+                ReadMeValidator._MDX_SERVER_PORT = int(port.group(1))
 
     @staticmethod
     def stop_mdx_server():
         if ReadMeValidator._MDX_SERVER_PROCESS:
             ReadMeValidator._MDX_SERVER_PROCESS.terminate()
             ReadMeValidator._MDX_SERVER_PROCESS = None
+            ReadMeValidator._MDX_SERVER_PORT = None
+        for session in ReadMeValidator._MDX_SESSIONS.values():
+            session.close()
+        ReadMeValidator._MDX_SESSIONS.clear()
 
 
 atexit.register(ReadMeValidator.stop_mdx_server)
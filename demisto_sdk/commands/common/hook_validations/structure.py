@@ -6,9 +6,10 @@ import json
 import logging
 import os
 import re
-from typing import Optional, Tuple
+from functools import lru_cache
+from typing import Dict, Optional, Tuple
 
-import yaml
+import pykwalify
 from demisto_sdk.commands.common.configuration import Configuration
 from demisto_sdk.commands.common.constants import (
     ACCEPTED_FILE_EXTENSIONS, CHECKED_TYPES_REGEXES,
@@ -17,10 +18,39 @@ from demisto_sdk.commands.common.errors import Errors
 from demisto_sdk.commands.common.hook_validations.base_validator import \
     BaseValidator
 from demisto_sdk.commands.common.tools import (get_content_file_type_dump,
-                                               get_remote_file)
+                                               get_remote_file,
+                                               load_file_content,
+                                               yaml_safe_load)
 from demisto_sdk.commands.format.format_constants import \
     OLD_FILE_DEFAULT_1_FROMVERSION
 from pykwalify.core import Core
+from pykwalify.rule import Rule
+
+# CompiledSchemaCore overrides private pykwalify internals (checked with pykwalify 1.7 and 1.8), if another pykwalify
+# version does not have them the schema is compiled by Core on every validation instead.
+IS_COMPILED_SCHEMA_SUPPORTED = all(hasattr(Core, attribute) for attribute in ('_start_validate', '_validate')) and \
+    hasattr(pykwalify, 'partial_schemas')
+
+
+class CompiledSchemaCore(Core):
+    """pykwalify Core which validates against pre-compiled schema rules, instead of building the rules again from
+    the schema on every validation.
+
+        Attributes:
+            partial_rules (dict): the compiled partial schemas (`schema;<name>` keys) of the schema, by name.
+            compiled_root_rule (Rule): the compiled root rule of the schema.
+        """
+
+    def __init__(self, compiled_schema, **kwargs):
+        self.partial_rules, self.compiled_root_rule = compiled_schema
+        super().__init__(schema_data={}, **kwargs)
+
+    def _start_validate(self, value=None):
+        self.errors = []
+        # partial schemas are registered globally in pykwalify by name, different schemas may use the same names
+        pykwalify.partial_schemas.update(self.partial_rules)
+        self.root_rule = self.compiled_root_rule
+        self._validate(value, self.root_rule, '', [])
 
 
 class StructureValidator(BaseValidator):
@@ -39,7 +69,7 @@ class StructureValidator(BaseValidator):
     SCHEMAS_PATH = "schemas"
 
     FILE_SUFFIX_TO_LOAD_FUNCTION = {
-        '.yml': yaml.safe_load,
+        '.yml': yaml_safe_load,
         '.json': json.load,
     }
 
@@ -127,10 +157,17 @@ class StructureValidator(BaseValidator):
             if self.suppress_print:
                 logging.disable(logging.CRITICAL)
             scheme_file_name = 'integration' if self.scheme_name.value == 'betaintegration' else self.scheme_name.value  # type: ignore
-            path = os.path.normpath(
-                os.path.join(__file__, "..", "..", self.SCHEMAS_PATH, '{}.yml'.format(scheme_file_name)))
-            core = Core(source_file=self.file_path,
-                        schema_files=[path])
+            if self.file_path.endswith('.json'):
+                # json files are parsed the same by pykwalify, validate the already loaded file
+                source = {'source_data': self.current_file}
+            else:
+                # pykwalify loads yml files as YAML 1.2, unlike yaml_safe_load (e.g. an unquoted `yes` label is a
+                # string and not a boolean), so these are loaded again by pykwalify
+                source = {'source_file': self.file_path}
+            if IS_COMPILED_SCHEMA_SUPPORTED:
+                core = CompiledSchemaCore(self.get_compiled_scheme(scheme_file_name), **source)
+            else:
+                core = Core(schema_files=[self.get_scheme_path(scheme_file_name)], **source)
             core.validate(raise_exception=True)
         except Exception as err:
             try:
@@ -146,6 +183,42 @@ class StructureValidator(BaseValidator):
                     return False
         return True
 
+    @staticmethod
+    @lru_cache(None)
+    def get_compiled_scheme(scheme_file_name: str) -> Tuple[Dict[str, Rule], Rule]:
+        """Loads and compiles a scheme from SCHEMAS_PATH, once per process.
+
+        Args:
+            scheme_file_name: The scheme file name, without the .yml suffix.
+
+        Returns:
+            (dict, Rule): The compiled partial schemas of the scheme by name, and the compiled root rule.
+        """
+        schema = Core(source_data={}, schema_files=[StructureValidator.get_scheme_path(scheme_file_name)]).schema
+
+        partial_rules = {}
+        root_schema = {}
+        for key, value in schema.items():
+            if key.startswith('schema;'):
+                partial_rules[key.split(';', 1)[1]] = Rule(schema=value)
+            else:
+                root_schema[key] = value
+
+        return partial_rules, Rule(schema=root_schema)
+
+    @staticmethod
+    def get_scheme_path(scheme_file_name: str) -> str:
+        """Gets the path of a scheme in SCHEMAS_PATH.
+
+        Args:
+            scheme_file_name: The scheme file name, without the .yml suffix.
+
+        Returns:
+            str: The scheme file path.
+        """
+        return os.path.normpath(
+            os.path.join(__file__, "..", "..", StructureValidator.SCHEMAS_PATH, '{}.yml'.format(scheme_file_name)))
+
     @staticmethod
     def get_file_id_from_loaded_file_data(loaded_file_data):
         # type: (dict) -> Optional[str]
@@ -251,9 +324,7 @@ class StructureValidator(BaseValidator):
         if file_extension in ACCEPTED_FILE_EXTENSIONS:
             if file_extension in self.FILE_SUFFIX_TO_LOAD_FUNCTION:
                 load_function = self.FILE_SUFFIX_TO_LOAD_FUNCTION[file_extension]
-                with open(self.file_path, 'r') as file_obj:
-                    loaded_file_data = load_function(file_obj)  # type: ignore
-                    return loaded_file_data
+                return load_file_content(load_function, self.file_path)
 
             # Ignore loading image and markdown
             elif file_extension in ['.png', '.md']:
@@ -1,6 +1,23 @@
+const cli = require('commander');
+const cluster = require('cluster');
 const mdx = require('@mdx-js/mdx');
 const http = require('http')
 
+cli.option("-p --port <port to listen on, 0 for any free port>", "", "0")
+cli.option("-w --workers <number of parse worker processes>", "", "1")
+cli.parse(process.argv)
+
+const workers = parseInt(cli.workers)
+
+async function parseError(content) {
+    try {
+        await mdx(content)
+        return null
+    } catch (error) {
+        return "MDX parse failure: " + error
+    }
+}
+
 function requestHandler(req, res) {
     // console.log(req)
     if (req.method != 'POST') {
@@ -14,21 +31,68 @@ function requestHandler(req, res) {
     })
     req.on('end', async function () {
         //   console.log('Body length: ' + body.length)
-        try {
-            parsed = await mdx(body)
-            res.end('Successfully parsed mdx')
-        } catch (error) {
+        if (req.url == '/batch') {
+            // A json list of mdx contents, responding with a json list of their parse errors (null if parsed)
+            let errors = []
+            try {
+                for (const content of JSON.parse(body)) {
+                    errors.push(await parseError(content))
+                }
+            } catch (error) {
+                res.statusCode = 400
+                res.end("Invalid batch: " + error)
+                return
+            }
+            res.setHeader('Content-Type', 'application/json')
+            res.end(JSON.stringify(errors))
+            return
+        }
+        const error = await parseError(body)
+        if (error) {
             res.statusCode = 500
-            res.end("MDX parse failure: " + error)
+            res.end(error)
+        } else {
+            res.end('Successfully parsed mdx')
         }
     })
 }
 
-const server = http.createServer(requestHandler);
+function listen() {
+    const server = http.createServer(requestHandler);
+    server.keepAliveTimeout = 60000
+    server.listen(parseInt(cli.port), (err) => {
+        if (err) {
+            return console.log('MDX server failed starting.', err)
+        }
+        if (workers <= 1) {
+            console.log(`MDX server is listening on port: ${server.address().port}`)
+        }
+    });
+}
+
+function exitWithParent() {
+    // Exit when the process which started the server exits and closes our stdin
+    process.stdin.on('end', () => process.exit(0))
+    process.stdin.resume()
+}
 
-server.listen(6161, (err) => {
-    if (err) {
-        return console.log('MDX server failed starting.', err)
+if (workers <= 1) {
+    exitWithParent()
+    listen()
+} else if (cluster.isMaster) {
+    exitWithParent()
+    // In a cluster the workers share the listening port, listening on port 0 gives all of them the same port
+    let listening = 0
+    cluster.on('listening', (worker, address) => {
+        listening += 1
+        if (listening == workers) {
+            console.log(`MDX server is listening on port: ${address.port}`)
+        }
+    })
+    for (let i = 0; i < workers; i++) {
+        cluster.fork()
     }
-    console.log(`MDX server is listening on port: 6161`)
-});
+} else {
+    process.on('disconnect', () => process.exit(0))
+    listen()
+}
@@ -80,3 +80,66 @@ def test_is_image_path_valid():
     assert images_paths[0] and alternative_images_paths[0] in captured_output.getvalue()
     assert images_paths[1] and alternative_images_paths[1] in captured_output.getvalue()
     assert images_paths[2] not in captured_output.getvalue()
+
+
+def test_parse_mdx_files_mdx_server(mocker):
+    """
+    Given
+        - A valid README file
+    When
+        - Parsing the README files of all the packs ahead of their validation, with 2 mdx server workers
+    Then
+        - Ensure the file is parsed by a server on a free port
+        - Ensure the validation of the file uses the parse result, without parsing it again
+    """
+    readme_validator = ReadMeValidator(VALID_MD)
+    valid = readme_validator.are_modules_installed_for_verify(readme_validator.content_path)
+    if not valid:
+        pytest.skip('skipping mdx server test. ' + MDX_SKIP_NPM_MESSAGE)
+        return
+    mocker.patch.dict(os.environ, {'DEMISTO_README_VALIDATION': 'yes'})
+    try:
+        ReadMeValidator.parse_mdx_files([VALID_MD], workers=2)
+        assert ReadMeValidator._MDX_SERVER_PORT not in (None, 6161)
+        assert ReadMeValidator._MDX_ERRORS == {VALID_MD: None}
+        mocker.spy(ReadMeValidator, 'mdx_server_parse')
+        assert readme_validator.is_valid_file()
+        assert not ReadMeValidator.mdx_server_parse.called
+    finally:
+        ReadMeValidator.stop_mdx_server()
+
+
+def test_parse_mdx_files_in_batches(mocker, tmp_path):
+    """
+    Given
+        - 45 README files, one of them is not a valid mdx and one of them is an html document
+    When
+        - Parsing the README files ahead of their validation
+    Then
+        - Ensure the mdx files are sent to the mdx server in batches and the html document is not sent
+        - Ensure the parse errors are used when validating the files
+    """
+    readme_files = []
+    for i in range(45):
+        readme_file = tmp_path / f'README{i}.md'
+        readme_file.write_text('<p>html readme</p>' if i == 44 else f'## Readme {i}')
+        readme_files.append(str(readme_file))
+
+    def mdx_server_parse(readme_contents):
+        return ['MDX parse failure: invalid' if content == '## Readme 0' else None for content in readme_contents]
+
+    mocker.patch.object(ReadMeValidator, 'is_mdx_verify_enabled', return_value=True)
+    mocker.patch.object(ReadMeValidator, 'start_mdx_server')
+    mocker.patch.object(ReadMeValidator, 'mdx_server_parse', side_effect=mdx_server_parse)
+    mocker.patch('demisto_sdk.commands.common.hook_validations.readme.get_content_path', return_value=tmp_path)
+    mocker.patch.dict(os.environ, {'DEMISTO_README_VALIDATION': 'yes'})
+    mocker.patch.object(ReadMeValidator, '_MDX_ERRORS', {})
+
+    ReadMeValidator.parse_mdx_files(readme_files, workers=2)
+    ReadMeValidator.start_mdx_server.assert_called_once_with(workers=2)
+    assert [len(call[0][0]) for call in ReadMeValidator.mdx_server_parse.call_args_list] == [20, 20, 4]
+    assert len(ReadMeValidator._MDX_ERRORS) == 44
+
+    assert not ReadMeValidator(readme_files[0], suppress_print=True).is_mdx_file()
+    assert ReadMeValidator(readme_files[1]).is_mdx_file()
+    assert ReadMeValidator.mdx_server_parse.call_count == 3
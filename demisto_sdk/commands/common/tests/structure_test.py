@@ -99,6 +99,56 @@ class TestStructureValidator:
         validator = StructureValidator(file_path=path, predefined_scheme='incidentfield')
         assert validator.is_valid_scheme() is answer
 
+    def test_scheme_validation_compiles_scheme_once(self):
+        """
+        Given
+            - Two indicator fields, validated by the same scheme.
+        When
+            - Validating the scheme of both files.
+        Then
+            - Ensure the scheme is loaded and compiled only once.
+            - Ensure the validation results are the same as validating each file on its own.
+        """
+        StructureValidator.get_compiled_scheme.cache_clear()
+
+        assert StructureValidator(file_path=INDICATORFIELD_EXACT_SCHEME,
+                                  predefined_scheme='incidentfield').is_valid_scheme()
+        assert not StructureValidator(file_path=INDICATORFIELD_MISSING_FIELD,
+                                      predefined_scheme='incidentfield').is_valid_scheme()
+        assert StructureValidator.get_compiled_scheme.cache_info().misses == 1
+        assert StructureValidator.get_compiled_scheme.cache_info().hits == 1
+
+    @pytest.mark.parametrize("path, answer", [(INDICATORFIELD_EXACT_SCHEME, True),
+                                              (INDICATORFIELD_MISSING_FIELD, False)])
+    def test_scheme_validation_without_compiled_scheme_support(self, path, answer, mocker):
+        """
+        Given
+            - A pykwalify version without the internals which the compiled scheme validation relies on.
+        When
+            - Validating the scheme of a file.
+        Then
+            - Ensure the file is validated against its scheme, without the compiled scheme.
+        """
+        from demisto_sdk.commands.common.hook_validations import structure
+        mocker.patch.object(structure, 'IS_COMPILED_SCHEMA_SUPPORTED', False)
+        get_compiled_scheme = mocker.spy(StructureValidator, 'get_compiled_scheme')
+
+        assert StructureValidator(file_path=path, predefined_scheme='incidentfield').is_valid_scheme() is answer
+        assert not get_compiled_scheme.called
+
+    def test_scheme_validation_of_loaded_json_file(self):
+        """
+        Given
+            - A valid indicator field, whose loaded content is missing required fields.
+        When
+            - Validating the scheme of the file.
+        Then
+            - Ensure the loaded content is validated, and not the file on disk.
+        """
+        validator = StructureValidator(file_path=INDICATORFIELD_EXACT_SCHEME, predefined_scheme='incidentfield')
+        validator.current_file = {'id': 'indicator_field'}
+        assert validator.is_valid_scheme() is False
+
     SCHEME_VALIDATION_REPUTATION = [
         (VALID_REPUTATION_FILE, True),
         (INVALID_REPUTATION_FILE, False)
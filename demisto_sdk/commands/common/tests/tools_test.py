@@ -1,9 +1,11 @@
 import glob
 import json
+import multiprocessing
 import os
 from pathlib import Path
 
 import pytest
+import yaml
 from demisto_sdk.commands.common import tools
 from demisto_sdk.commands.common.constants import (INTEGRATIONS_DIR,
                                                    LAYOUTS_DIR, PACKS_DIR,
@@ -45,6 +47,7 @@ from demisto_sdk.tests.constants_test import (IGNORED_PNG,
 from TestSuite.pack import Pack
 from TestSuite.playbook import Playbook
 from TestSuite.repo import Repo
+from TestSuite.test_tools import ChangeCWD
 
 
 class TestGenericFunctions:
@@ -146,6 +149,10 @@ class TestGenericFunctions:
         assert snake == 'camel_case'
 
 
+def read_local_git_file(file_path):
+    return tools.get_local_git_object_reader().read_file('origin/master', file_path)
+
+
 class TestGetRemoteFile:
     def test_get_remote_file_sanity(self):
         hello_world_yml = tools.get_remote_file('Packs/HelloWorld/Integrations/HelloWorld/HelloWorld.yml')
@@ -197,6 +204,74 @@ class TestGetRemoteFile:
         hello_world_readme = tools.get_remote_file('Packs/HelloWorld/README.md', 'master')
         assert hello_world_readme == {}
 
+    @staticmethod
+    def init_content_repo(repo_path):
+        for command in ['git init -q', 'git config user.email test@test.com', 'git config user.name test',
+                        'git remote add origin https://github.com/demisto/content.git']:
+            tools.run_command(command, cwd=repo_path)
+        os.makedirs(os.path.join(repo_path, 'Packs', 'HelloWorld'))
+        with open(os.path.join(repo_path, 'Packs', 'HelloWorld', 'pack_metadata.json'), 'w') as metadata_file:
+            metadata_file.write('{"name": "HelloWorld"}')
+        tools.run_command('git add .', cwd=repo_path)
+        tools.run_command('git commit -q -m initial', cwd=repo_path)
+        tools.run_command('git update-ref refs/remotes/origin/master HEAD', cwd=repo_path)
+
+    def test_get_remote_file_from_local_git(self, tmpdir, mocker):
+        """
+        Given
+            - A content repository, whose origin/master branch exists locally.
+        When
+            - Getting remote files of origin/master, and of a branch which exists only in github.
+        Then
+            - Ensure the origin/master files are read from the local git repository, and cached.
+            - Ensure the other branch file is fetched from github.
+        """
+        mocker.patch.object(tools, '_git_object_reader', None)
+        mocker.patch.object(tools, '_remote_files', {})
+        requests_get = mocker.patch.object(tools.requests, 'get')
+        requests_get.return_value.content = b'{"name": "RemoteHelloWorld"}'
+        self.init_content_repo(str(tmpdir))
+
+        with ChangeCWD(str(tmpdir)):
+            assert tools.get_remote_file('Packs/HelloWorld/pack_metadata.json') == {'name': 'HelloWorld'}
+            assert tools.get_remote_file('Packs/HelloWorld/pack_metadata.json', 'origin/master') == \
+                {'name': 'HelloWorld'}
+            assert tools.get_remote_file('Packs/HelloWorld/README.md', 'origin/master') == {}
+            assert requests_get.call_count == 0
+            assert len(tools.get_local_git_object_reader().files) == 2
+
+            assert tools.get_remote_file('Packs/HelloWorld/pack_metadata.json', 'NoLocalBranch') == \
+                {'name': 'RemoteHelloWorld'}
+            assert tools.get_remote_file('Packs/HelloWorld/pack_metadata.json', 'NoLocalBranch') == \
+                {'name': 'RemoteHelloWorld'}
+            assert requests_get.call_count == 1
+
+    def test_get_remote_file_from_local_git_in_forked_workers(self, tmpdir, mocker):
+        """
+        Given
+            - A content repository, whose files were already read from the local git repository by the parent process.
+        When
+            - Reading other files of the repository in forked worker processes.
+        Then
+            - Ensure every worker reads the files it requested, through its own git process.
+        """
+        mocker.patch.object(tools, '_git_object_reader', None)
+        self.init_content_repo(str(tmpdir))
+        for i in range(20):
+            with open(os.path.join(str(tmpdir), 'Packs', 'HelloWorld', f'file{i}.json'), 'w') as file_:
+                file_.write(json.dumps({'index': i}))
+        tools.run_command('git add .', cwd=str(tmpdir))
+        tools.run_command('git commit -q -m files', cwd=str(tmpdir))
+        tools.run_command('git update-ref refs/remotes/origin/master HEAD', cwd=str(tmpdir))
+
+        with ChangeCWD(str(tmpdir)):
+            assert read_local_git_file('Packs/HelloWorld/pack_metadata.json') == b'{"name": "HelloWorld"}'
+            with multiprocessing.get_context('fork').Pool(4) as pool:
+                files = pool.map_async(read_local_git_file,
+                                       [f'Packs/HelloWorld/file{i}.json' for i in range(20)]).get(timeout=60)
+
+        assert files == [json.dumps({'index': i}).encode() for i in range(20)]
+
     def test_should_file_skip_validation_negative(self):
         should_skip = tools.should_file_skip_validation('Packs/HelloWorld/Integrations/HelloWorld/search_alerts.json')
         assert not should_skip
@@ -225,6 +300,63 @@ class TestGetRemoteFile:
         assert should_skip
 
 
+class TestDockerImagesCache:
+    @pytest.fixture(autouse=True)
+    def docker_images_cache(self, mocker, tmp_path):
+        mocker.patch.object(tools, 'DOCKER_IMAGES_CACHE_PATH', str(tmp_path / '.demisto-sdk' / 'docker_images_cache.json'))
+        mocker.patch.object(tools, '_docker_images_cache', None)
+
+    def test_get_docker_image_detail_cached_across_runs(self, mocker):
+        """
+        Given
+            - A local docker image.
+
+        When
+            - Getting the python version of the image twice, in different runs.
+            - Getting the python version after the image content changed.
+
+        Then
+            - Ensure the container is run only once for the same image content.
+            - Ensure the container is run again when the image content changed.
+        """
+        mocker.patch.object(tools, 'get_docker_image_id', return_value='sha256:1')
+        get_detail = mocker.MagicMock(return_value=3.8)
+        assert tools.get_docker_image_detail('demisto/python3:3.8.6.12176', 'python_version', get_detail) == 3.8
+
+        # A new run loads the cache from the disk
+        mocker.patch.object(tools, '_docker_images_cache', None)
+        assert tools.get_docker_image_detail('demisto/python3:3.8.6.12176', 'python_version', get_detail) == 3.8
+        assert get_detail.call_count == 1
+
+        tools.get_docker_image_id.return_value = 'sha256:2'
+        assert tools.get_docker_image_detail('demisto/python3:3.8.6.12176', 'python_version', get_detail) == 3.8
+        assert get_detail.call_count == 2
+
+    def test_get_docker_image_detail_not_cached(self, mocker):
+        """
+        Given
+            - A docker image which does not exist locally and docker is not available.
+            - A docker image which failed to run.
+
+        When
+            - Getting the python version of the images.
+
+        Then
+            - Ensure the details are not cached.
+        """
+        mocker.patch.object(tools, 'get_docker_image_id', return_value=None)
+        get_detail = mocker.MagicMock(return_value=3.8)
+        tools.get_docker_image_detail('demisto/python3:3.8.6.12176', 'python_version', get_detail)
+        tools.get_docker_image_detail('demisto/python3:3.8.6.12176', 'python_version', get_detail)
+        assert get_detail.call_count == 2
+
+        tools.get_docker_image_id.return_value = 'sha256:1'
+        get_detail.side_effect = ValueError
+        with pytest.raises(ValueError):
+            tools.get_docker_image_detail('demisto/python3:3.8.6.12176', 'python_version', get_detail)
+        assert not os.path.exists(tools.DOCKER_IMAGES_CACHE_PATH)
+
+
 class TestServerVersionCompare:
     V5 = "5.0.0"
     V0 = "0.0.0"
@@ -336,6 +468,45 @@ class TestGetFile:
         assert file_data
         assert file_data.get('name') is not None
 
+    @pytest.mark.parametrize('loader', [yaml.SafeLoader, getattr(yaml, 'CSafeLoader', yaml.SafeLoader)])
+    def test_yaml_safe_load(self, loader, mocker):
+        """
+        Given
+            - The pure python yaml loader, and the libyaml based one when it is available.
+        When
+            - Loading a yml file with yaml_safe_load.
+        Then
+            - Ensure the file is loaded the same as with yaml.safe_load.
+        """
+        mocker.patch.object(tools, 'YAML_SAFE_LOADER', loader)
+        with open(SOURCE_FORMAT_INTEGRATION_COPY) as yml_file:
+            expected_data = yaml.safe_load(yml_file)
+        with open(SOURCE_FORMAT_INTEGRATION_COPY) as yml_file:
+            assert tools.yaml_safe_load(yml_file) == expected_data
+
+    def test_get_yaml_parses_once(self, tmpdir, mocker):
+        """
+        Given
+            - A yml file.
+        When
+            - Getting the file content twice, modifying the returned content, and then changing the file.
+        Then
+            - Ensure the file is parsed once until it changes.
+            - Ensure modifying the returned content does not modify the content returned by later calls.
+        """
+        safe_load = mocker.patch.object(tools, 'yaml_safe_load', side_effect=tools.yaml_safe_load)
+        yml_file = tmpdir / 'file.yml'
+        yml_file.write('name: a\n')
+
+        file_data = tools.get_yaml(str(yml_file))
+        file_data['name'] = 'b'
+        assert tools.get_yaml(str(yml_file)) == {'name': 'a'}
+        assert safe_load.call_count == 1
+
+        yml_file.write('name: c\n')
+        assert tools.get_yaml(str(yml_file)) == {'name': 'c'}
+        assert safe_load.call_count == 2
+
 
 def test_get_latest_release_notes_text_invalid():
     """
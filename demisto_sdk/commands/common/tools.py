@@ -6,15 +6,19 @@ import os
 import re
 import shlex
 import sys
+import threading
 from configparser import ConfigParser, MissingSectionHeaderError
+from copy import deepcopy
 from distutils.version import LooseVersion
-from functools import partial
+from functools import lru_cache, partial
 from pathlib import Path
 from subprocess import DEVNULL, PIPE, Popen, check_output
 from typing import Any, Callable, Dict, List, Optional, Tuple, Type, Union
 
 import click
 import colorama
+import docker
+import docker.errors
 import git
 import requests
 import urllib3
@@ -42,6 +46,13 @@ ryaml = YAML()
 ryaml.preserve_quotes = True
 ryaml.allow_duplicate_keys = True
 
+# The maximal number of parsed file contents kept by load_file_content
+PARSED_FILES_CACHE_SIZE = 512
+
+# The libyaml based loader is several times faster than the pure python one, and loads the same content.
+# It is available only when PyYAML is built with libyaml, otherwise the pure python loader is used.
+YAML_SAFE_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
 
 class LOG_COLORS:
     NATIVE = colorama.Style.RESET_ALL
@@ -117,6 +128,31 @@ def src_root() -> Path:
     return Path(git_dir) / 'demisto_sdk'
 
 
+@lru_cache(maxsize=None)
+def get_distribution_version(distribution_name: str) -> str:
+    """ Installed version of a python distribution, Used to invalidate caches of results which it affects.
+
+    Args:
+        distribution_name: The distribution name, e.g. demisto-sdk.
+
+    Returns:
+        str: The distribution version, empty string if it is not installed.
+    """
+    try:
+        from pkg_resources import DistributionNotFound, get_distribution
+    except ImportError:
+        return ''
+    try:
+        return get_distribution(distribution_name).version
+    except DistributionNotFound:
+        return ''
+
+
+def get_demisto_sdk_version() -> str:
+    """Installed demisto-sdk version, empty string if demisto-sdk distribution is not installed"""
+    return get_distribution_version('demisto-sdk')
+
+
 def print_error(error_str):
     print_color(error_str, LOG_COLORS.RED)
 
@@ -157,35 +193,197 @@ def run_command(command, is_silenced=True, exit_on_error=True, cwd=None):
     return output
 
 
-def get_remote_file(full_file_path, tag='master', return_content=False):
+class GitObjectReader:
+    """Reads files of git revisions from the local git object database, through one persistent
+    `git cat-file --batch` process. The read files are cached by revision and path.
+
+        Attributes:
+            repo_path (str): the root path of the git repository.
+            process (Popen): the `git cat-file --batch` process, started on the first read.
+            process_pid (int): the id of the process which started the `git cat-file --batch` process.
+            known_revisions (dict): whether a revision exists in the local repository, by revision.
+            files (dict): the read files content by (revision, path), None for files which do not exist.
+    """
+
+    def __init__(self, repo_path):
+        self.repo_path = repo_path
+        self.process = None  # type: Optional[Popen]
+        self.process_pid = None  # type: Optional[int]
+        self.known_revisions = {}  # type: Dict[str, bool]
+        self.files = {}  # type: Dict[Tuple[str, str], Optional[bytes]]
+
+    def _read_object(self, object_name):
+        # type: (str) -> Optional[bytes]
+        """Reads a single object from the `git cat-file --batch` process.
+
+        Args:
+            object_name: The object name, e.g. `<revision>` or `<revision>:<path>`.
+
+        Returns:
+            The object content, or None if the object does not exist.
+        """
+        if '\n' in object_name:
+            return None
+        if self.process is not None and self.process_pid != os.getpid():
+            # A forked process (e.g. validate worker) must not share the pipes of its parent's process
+            self.process.stdin.close()  # type: ignore
+            self.process.stdout.close()  # type: ignore
+            self.process = None
+        if self.process is None:
+            self.process = Popen(['git', 'cat-file', '--batch'], stdin=PIPE, stdout=PIPE, stderr=DEVNULL,
+                                 cwd=self.repo_path)
+            self.process_pid = os.getpid()
+
+        self.process.stdin.write(f'{object_name}\n'.encode())  # type: ignore
+        self.process.stdin.flush()  # type: ignore
+        # the header is `<sha> <type> <size>`, or `<object name> missing` if the object does not exist
+        header = self.process.stdout.readline().split()  # type: ignore
+        if not header or header[-1] in (b'missing', b'ambiguous'):
+            return None
+
+        content = self.process.stdout.read(int(header[2]))  # type: ignore
+        self.process.stdout.read(1)  # type: ignore # the object content is followed by a new line
+        return content
+
+    def get_revision(self, tag):
+        # type: (str) -> Optional[str]
+        """Gets the local revision of a remote tag or branch, preferring the origin remote branches.
+
+        Args:
+            tag: The branch, tag or commit SHA1, with or without the `origin/` prefix.
+
+        Returns:
+            The local revision, or None if it does not exist in the local repository.
+        """
+        revisions = [tag] if tag.startswith('origin/') else [f'origin/{tag}', tag]
+        for revision in revisions:
+            if revision not in self.known_revisions:
+                self.known_revisions[revision] = self._read_object(f'{revision}^{{commit}}') is not None
+            if self.known_revisions[revision]:
+                return revision
+        return None
+
+    def read_file(self, revision, file_path):
+        # type: (str, str) -> Optional[bytes]
+        """Reads a file of a local revision.
+
+        Args:
+            revision: The local revision.
+            file_path: The file path, absolute or relative to the current working directory.
+
+        Returns:
+            The file content, or None if the file does not exist in the revision.
+        """
+        repo_file_path = os.path.relpath(os.path.abspath(file_path), self.repo_path).replace('\\', '/')
+        if (revision, repo_file_path) not in self.files:
+            self.files[(revision, repo_file_path)] = self._read_object(f'{revision}:{repo_file_path}')
+        return self.files[(revision, repo_file_path)]
+
+    @staticmethod
+    def from_content_repo():
+        # type: () -> Optional[GitObjectReader]
+        """Creates a git object reader of the current repository, if it is the content repository or a fork of it.
+
+        Returns:
+            The git object reader, or None if not running in the content repository.
+        """
+        try:
+            remotes = run_command('git remote -v', exit_on_error=False)
+            repo_path = run_command('git rev-parse --show-toplevel', exit_on_error=False).strip()
+        except (RuntimeError, OSError):
+            return None
+
+        if repo_path and (re.search(CONTENT_GITHUB_ORIGIN, remotes) or re.search(CONTENT_GITHUB_UPSTREAM, remotes)):
+            return GitObjectReader(repo_path)
+        return None
+
+
+# The local git object reader used by get_remote_file, None if it was not created yet, False if not available
+_git_object_reader = None  # type: Union[None, bool, GitObjectReader]
+
+# The files which were fetched from github by get_remote_file, by (tag, path), None for files which were not found
+_remote_files = {}  # type: Dict[Tuple[str, str], Optional[bytes]]
+
+
+def get_local_git_object_reader():
+    # type: () -> Optional[GitObjectReader]
+    """
+    Returns:
+        The local git object reader, if running in the content repository. Created once per process.
+    """
+    global _git_object_reader
+    if _git_object_reader is None:
+        _git_object_reader = GitObjectReader.from_content_repo() or False
+    return _git_object_reader or None
+
+
+def get_remote_file_content(full_file_path, tag='master'):
     """
+    Gets the raw content of a file from the content repository, from the local git object database when the tag
+    exists locally, and otherwise from github. The content is cached by tag and path.
+
     Args:
-        full_file_path (string):The full path of the file.
+        full_file_path (string): The full path of the file.
         tag (string): The branch name. default is 'master'
-        return_content (bool): Determines whether to return the file's raw content or the dict representation of it.
-    Returns:
-        The file content in the required format.
 
+    Returns:
+        bytes. The file content, or None if the file could not be found.
     """
+    git_object_reader = get_local_git_object_reader()
+    try:
+        revision = git_object_reader.get_revision(tag) if git_object_reader else None
+        if git_object_reader and revision:
+            content = git_object_reader.read_file(revision, full_file_path)
+            if content is None:
+                print_warning('Could not find the old entity file under "{}:{}".\n'
+                              'please make sure that you did not break backward compatibility.'.format(
+                                  revision, full_file_path))
+            return content
+    except (OSError, ValueError) as exc:
+        print_warning(f'Could not read the old entity file from the local git repository, fetching it from github. '
+                      f'Reason: {exc}')
+
+    if (tag, full_file_path) in _remote_files:
+        return _remote_files[(tag, full_file_path)]
+
     # 'origin/' prefix is used to compared with remote branches but it is not a part of the github url.
-    tag = tag.lstrip('origin/')
+    github_tag = tag.lstrip('origin/')
 
     # The replace in the end is for Windows support
-    github_path = os.path.join(CONTENT_GITHUB_LINK, tag, full_file_path).replace('\\', '/')
+    github_path = os.path.join(CONTENT_GITHUB_LINK, github_tag, full_file_path).replace('\\', '/')
     try:
         res = requests.get(github_path, verify=False, timeout=10)
         res.raise_for_status()
+        content = res.content
     except Exception as exc:
         print_warning('Could not find the old entity file under "{}".\n'
                       'please make sure that you did not break backward compatibility. '
                       'Reason: {}'.format(github_path, exc))
+        content = None
+
+    _remote_files[(tag, full_file_path)] = content
+    return content
+
+
+def get_remote_file(full_file_path, tag='master', return_content=False):
+    """
+    Args:
+        full_file_path (string):The full path of the file.
+        tag (string): The branch name. default is 'master'
+        return_content (bool): Determines whether to return the file's raw content or the dict representation of it.
+    Returns:
+        The file content in the required format.
+
+    """
+    content = get_remote_file_content(full_file_path, tag)
+    if content is None:
         return {}
     if return_content:
-        return res.content
+        return content
     if full_file_path.endswith('json'):
-        details = json.loads(res.content)
+        details = json.loads(content)
     elif full_file_path.endswith('yml'):
-        details = yaml.safe_load(res.content)
+        details = yaml_safe_load(content)
     # if neither yml nor json then probably a CHANGELOG or README file.
     else:
         details = {}
@@ -225,7 +423,7 @@ def filter_packagify_changes(modified_files, added_files, removed_files, tag='ma
                 updated_added_files.add(file_path)
                 continue
             with open(file_path) as f:
-                details = yaml.safe_load(f.read())
+                details = yaml_safe_load(f.read())
 
             uniq_identifier = '_'.join([
                 details['name'],
@@ -325,16 +523,52 @@ def get_last_remote_release_version():
     return ''
 
 
+def yaml_safe_load(stream):
+    """
+    Same as yaml.safe_load, using the libyaml based loader when it is available.
+
+    Args:
+        stream: The yaml string or stream to load.
+
+    Returns:
+        The loaded yaml.
+    """
+    return yaml.load(stream, Loader=YAML_SAFE_LOADER)
+
+
+@lru_cache(maxsize=PARSED_FILES_CACHE_SIZE)
+def _parse_file_content(method, file_content, replace_simple_equal):
+    if replace_simple_equal:
+        file_content = file_content.replace("simple: =", "simple: '='")
+    # revert str to stream for loader
+    return method(io.StringIO(file_content))
+
+
+def load_file_content(method, file_path, replace_simple_equal=True):
+    """
+    Reads and parses a file. The parsed content is cached process-wide by the file content, so a file which is loaded
+    by several commands or validators is parsed only once, and a file which changed is parsed again.
+
+    Args:
+        method: The function which parses the file stream, e.g. yaml_safe_load.
+        file_path: The file path.
+        replace_simple_equal: Whether to quote `simple: =` values before parsing, as yaml_safe_load can not parse them.
+
+    Returns:
+        The parsed file content. A copy of the cached content is returned, so it can be modified by the caller.
+    """
+    with open(os.path.expanduser(file_path), mode="r", encoding="utf8") as f:
+        file_content = f.read()
+    return deepcopy(_parse_file_content(method, file_content, replace_simple_equal))
+
+
 def get_file(method, file_path, type_of_file):
     data_dictionary = None
     with open(os.path.expanduser(file_path), mode="r", encoding="utf8") as f:
         if file_path.endswith(type_of_file):
-            read_file = f.read()
-            replaced = read_file.replace("simple: =", "simple: '='")
-            # revert str to stream for loader
-            stream = io.StringIO(replaced)
+            file_content = f.read()
             try:
-                data_dictionary = method(stream)
+                data_dictionary = deepcopy(_parse_file_content(method, file_content, replace_simple_equal=True))
             except Exception as e:
                 print_error(
                     "{} has a structure issue of file type{}. Error was: {}".format(file_path, type_of_file, str(e)))
@@ -345,7 +579,7 @@ def get_file(method, file_path, type_of_file):
 
 
 def get_yaml(file_path):
-    return get_file(yaml.safe_load, file_path, ('yml', 'yaml'))
+    return get_file(yaml_safe_load, file_path, ('yml', 'yaml'))
 
 
 def get_ryaml(file_path: str) -> dict:
@@ -359,8 +593,7 @@ def get_ryaml(file_path: str) -> dict:
         dict. The yml contents
     """
     try:
-        with open(os.path.expanduser(file_path), 'r') as yf:
-            data = ryaml.load(yf)
+        data = load_file_content(ryaml.load, file_path, replace_simple_equal=False)
     except FileNotFoundError as e:
         click.echo(f'File {file_path} not found. Error was: {str(e)}', nl=True)
     except Exception as e:
@@ -733,6 +966,92 @@ def get_all_docker_images(script_obj) -> List[str]:
     return imgs
 
 
+DOCKER_IMAGES_CACHE_PATH = os.path.join(os.path.expanduser('~'), '.demisto-sdk', 'docker_images_cache.json')
+# Bump whenever the structure of the cached docker image details changes, so stale cache entries are discarded.
+DOCKER_IMAGES_CACHE_VERSION = 1
+# The docker images details cache, loaded on first use. Details are added from several lint threads.
+_docker_images_cache: Optional[Dict[str, dict]] = None
+_docker_images_cache_lock = threading.Lock()
+
+
+def get_docker_image_id(docker_image: str) -> Optional[str]:
+    """Gets the id of a local docker image, which is the digest of the image content.
+
+    Args:
+        docker_image: The docker image name.
+
+    Returns:
+        str: The image id, None if the image does not exist locally or docker is not available.
+    """
+    try:
+        return docker.from_env().images.get(docker_image).id
+    except (docker.errors.DockerException, requests.exceptions.RequestException):
+        return None
+
+
+def _get_docker_images_cache() -> Dict[str, dict]:
+    global _docker_images_cache
+    if _docker_images_cache is None:
+        _docker_images_cache = {}
+        try:
+            with open(DOCKER_IMAGES_CACHE_PATH, 'r') as cache_file:
+                cache = json.load(cache_file)
+            if cache.get('version') == DOCKER_IMAGES_CACHE_VERSION:
+                _docker_images_cache = cache.get('images', {})
+        except (OSError, ValueError):
+            pass
+
+    return _docker_images_cache
+
+
+def _save_docker_images_cache(cache: Dict[str, dict]):
+    try:
+        os.makedirs(os.path.dirname(DOCKER_IMAGES_CACHE_PATH), exist_ok=True)
+        # Write to a temporary file and replace, so concurrent runs never read a partially written cache
+        tmp_cache_path = f'{DOCKER_IMAGES_CACHE_PATH}.{os.getpid()}.tmp'
+        with open(tmp_cache_path, 'w') as cache_file:
+            json.dump({'version': DOCKER_IMAGES_CACHE_VERSION, 'images': cache}, cache_file)
+        os.replace(tmp_cache_path, DOCKER_IMAGES_CACHE_PATH)
+    except OSError as e:
+        print_warning(f'Could not save the docker images cache to {DOCKER_IMAGES_CACHE_PATH} - {e}')
+
+
+def get_docker_image_detail(docker_image: str, detail: str, get_detail: Callable[[], Any]) -> Any:
+    """Gets a detail of a docker image which is found by running a container of the image, e.g. its python version.
+
+    The details are cached on disk by the image name and the image id, so a container is run once per image content
+    and not in every run. Details of images which do not exist locally are cached after they are pulled.
+
+    Args:
+        docker_image: The docker image name.
+        detail: The detail name, e.g. python_version.
+        get_detail: Function which runs the container and returns the detail, it should raise an exception on failure
+            so failures are not cached. The returned detail must be JSON serializable.
+
+    Returns:
+        The docker image detail.
+    """
+    image_id = get_docker_image_id(docker_image)
+    with _docker_images_cache_lock:
+        cached_image = _get_docker_images_cache().get(docker_image, {})
+        if image_id and cached_image.get('id') == image_id and detail in cached_image:
+            return cached_image[detail]
+
+    image_detail = get_detail()
+
+    # Running the container pulls the image if it does not exist locally
+    image_id = image_id or get_docker_image_id(docker_image)
+    if image_id:
+        with _docker_images_cache_lock:
+            cache = _get_docker_images_cache()
+            if cache.get(docker_image, {}).get('id') != image_id:
+                cache[docker_image] = {'id': image_id}
+            cache[docker_image][detail] = image_detail
+            _save_docker_images_cache(cache)
+
+    return image_detail
+
+
 def get_python_version(docker_image, log_verbose=None, no_prints=False):
     """
     Get the python version of a docker image
@@ -746,14 +1065,17 @@ def get_python_version(docker_image, log_verbose=None, no_prints=False):
     if log_verbose is None:
         log_verbose = LOG_VERBOSE
     stderr_out = None if log_verbose else DEVNULL
-    py_ver = check_output(["docker", "run", "--rm", docker_image,
-                           "python", "-c",
-                           "import sys;print('{}.{}'.format(sys.version_info[0], sys.version_info[1]))"],
-                          universal_newlines=True, stderr=stderr_out).strip()
+
+    def run_python_version_container() -> float:
+        return float(check_output(["docker", "run", "--rm", docker_image,
+                                   "python", "-c",
+                                   "import sys;print('{}.{}'.format(sys.version_info[0], sys.version_info[1]))"],
+                                  universal_newlines=True, stderr=stderr_out).strip())
+
+    py_num = get_docker_image_detail(docker_image, 'python_version', run_python_version_container)
     if not no_prints:
-        print("Detected python version: [{}] for docker image: {}".format(py_ver, docker_image))
+        print("Detected python version: [{}] for docker image: {}".format(py_num, docker_image))
 
-    py_num = float(py_ver)
     if py_num < 2.7 or (3 < py_num < 3.4):  # pylint can only work on python 3.4 and up
         raise ValueError("Python vesion for docker image: {} is not supported: {}. "
                          "We only support python 2.7.* and python3 >= 3.4.".format(docker_image, py_num))
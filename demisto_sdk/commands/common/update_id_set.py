@@ -1,4 +1,5 @@
 import glob
+import hashlib
 import itertools
 import json
 import os
@@ -9,7 +10,7 @@ from datetime import datetime
 from distutils.version import LooseVersion
 from functools import partial
 from multiprocessing import Pool, cpu_count
-from typing import Callable, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 import click
 import networkx
@@ -23,10 +24,11 @@ from demisto_sdk.commands.common.constants import (CLASSIFIERS_DIR,
                                                    REPORTS_DIR, SCRIPTS_DIR,
                                                    TEST_PLAYBOOKS_DIR,
                                                    WIDGETS_DIR, FileType)
-from demisto_sdk.commands.common.tools import (LOG_COLORS, find_type, get_json,
-                                               get_pack_name, get_yaml,
-                                               print_color, print_error,
-                                               print_warning)
+from demisto_sdk.commands.common.tools import (LOG_COLORS, find_type,
+                                               get_demisto_sdk_version,
+                                               get_json, get_pack_name,
+                                               get_yaml, print_color,
+                                               print_error, print_warning)
 from demisto_sdk.commands.unify.unifier import Unifier
 
 CONTENT_ENTITIES = ['Integrations', 'Scripts', 'Playbooks', 'TestPlaybooks', 'Classifiers',
@@ -1038,16 +1040,230 @@ def get_general_paths(path):
 
 
 DEFAULT_ID_SET_PATH = "./Tests/id_set.json"
+ID_SET_CACHE_FILE_NAME = ".id_set_cache.json"
+# Bump whenever the structure of the extracted id_set entries changes, so stale cache entries are discarded.
+# The cache is also discarded when the demisto-sdk version changes, as the entries extraction may have changed.
+ID_SET_CACHE_VERSION = 1
+
+
+def get_file_content_hash(path: str) -> str:
+    """Calculates the content hash of an id_set work item.
+
+    Args:
+        path: A content file path, or a package directory (integration / script).
+            For a package directory all the files directly under it are hashed (yml, code, image, description).
+
+    Returns:
+        str: The md5 hex digest of the content.
+    """
+    content_hash = hashlib.md5()
+    if os.path.isdir(path):
+        file_paths = [os.path.join(path, file_name) for file_name in sorted(os.listdir(path))]
+    else:
+        file_paths = [path]
+
+    for file_path in file_paths:
+        if not os.path.isfile(file_path):
+            continue
+        content_hash.update(os.path.basename(file_path).encode('utf-8'))
+        with open(file_path, 'rb') as f:
+            content_hash.update(f.read())
+
+    return content_hash.hexdigest()
+
+
+class IDSetCache:
+    """On disk cache of extracted id_set entries, keyed by section, work item path and content hash.
+
+    For the sections processed during the current run only the used entries are saved, so deleted files are dropped
+    from the cache. The cached entries of the other sections are kept as is.
+    """
+
+    def __init__(self, cache_path: str):
+        self.cache_path = cache_path
+        self.cached_sections: Dict[str, Dict[str, dict]] = {}
+        self.used_sections: Dict[str, Dict[str, dict]] = {}
+        self.hits = 0
+        self.misses = 0
+        self._load()
+
+    def _load(self):
+        if not os.path.isfile(self.cache_path):
+            return
+        try:
+            with open(self.cache_path, 'r') as cache_file:
+                cache = json.load(cache_file)
+        except (OSError, ValueError):
+            print_warning(f'Could not load the id_set cache from {self.cache_path}, the id_set will be fully re-created.')
+            return
+
+        if cache.get('version') == ID_SET_CACHE_VERSION and cache.get('sdk_version') == get_demisto_sdk_version():
+            self.cached_sections = cache.get('sections', {})
+
+    def start_section(self, section: str):
+        """Marks the section as processed in the current run, its unused cached entries will not be saved."""
+        self.used_sections.setdefault(section, {})
+
+    def get(self, section: str, path: str, content_hash: str) -> Optional[Any]:
+        cached_item = self.cached_sections.get(section, {}).get(path)
+        if cached_item and cached_item.get('hash') == content_hash:
+            self.hits += 1
+            self.used_sections.setdefault(section, {})[path] = cached_item
+            return cached_item.get('result')
+
+        self.misses += 1
+        return None
+
+    def set(self, section: str, path: str, content_hash: str, result: Any):
+        self.used_sections.setdefault(section, {})[path] = {'hash': content_hash, 'result': result}
+
+    def save(self):
+        with open(self.cache_path, 'w') as cache_file:
+            json.dump({'version': ID_SET_CACHE_VERSION, 'sdk_version': get_demisto_sdk_version(),
+                       'sections': {**self.cached_sections, **self.used_sections}}, cache_file)
+
+
+def get_id_set_cache_path(id_set_path: str) -> str:
+    return os.path.join(os.path.dirname(os.path.abspath(id_set_path)), ID_SET_CACHE_FILE_NAME)
+
+
+class IDSetSectionJob:
+    """The extraction of an id_set section, dispatched to the pool without waiting for its results.
+
+    Paths whose content did not change since the cached run are not dispatched, their cached results are used.
+    """
+
+    def __init__(self, pool: Pool, section: str, func: Callable, paths: List[str],
+                 id_set_cache: Optional[IDSetCache], context: Optional[list] = None):
+        """
+        Args:
+            pool: The process pool.
+            section: The section name.
+            func: The process function to map over the paths.
+            paths: The work item paths.
+            id_set_cache: The id_set cache, if None all the paths are processed.
+            context: Other id_set entries the processing result depends on, a change in them invalidates the section.
+        """
+        self.section = section
+        self.paths = paths
+        self.id_set_cache = id_set_cache
+        self.results: Dict[str, Any] = {}
+        self.path_hashes: Dict[str, str] = {}
+        self.paths_to_process = paths
+
+        if id_set_cache is not None:
+            context_hash = hashlib.md5(json.dumps(context, sort_keys=True).encode('utf-8')).hexdigest() if context else ''
+            self.paths_to_process = []
+            id_set_cache.start_section(section)
+            for path in paths:
+                self.path_hashes[path] = get_file_content_hash(path) + context_hash
+                cached_result = id_set_cache.get(section, path, self.path_hashes[path])
+                if cached_result is None:
+                    self.paths_to_process.append(path)
+                else:
+                    self.results[path] = cached_result
+
+        self.async_result = pool.map_async(func, self.paths_to_process)
+
+    def get(self) -> list:
+        """Waits for the section extraction to finish.
+
+        Returns:
+            list: The process function results, in the order of the section paths.
+        """
+        for path, result in zip(self.paths_to_process, self.async_result.get()):
+            if self.id_set_cache is not None:
+                self.id_set_cache.set(self.section, path, self.path_hashes[path], result)
+            self.results[path] = result
+
+        return [self.results[path] for path in self.paths]
+
+
+# Sections which need the entries of another section in order to be processed:
+# section -> (dependency section, the process function argument the dependency entries are passed in)
+ID_SET_SECTION_DEPENDENCIES = {
+    'IncidentFields': ('IncidentTypes', 'incidents_types_list'),
+    'IndicatorTypes': ('Integrations', 'all_integrations'),
+}
+
+
+def get_id_set_sections(print_logs: bool) -> OrderedDict:
+    """Gets the id_set sections to process.
+    The sections other sections depend on come first, so their results are the first to be ready.
+
+    Args:
+        print_logs: Whether to print logs to stdout.
+
+    Returns:
+        OrderedDict: section name -> (content entity, paths getter, process function).
+            The process function of a dependent section also expects the entries of the section it depends on.
+    """
+    return OrderedDict([
+        ('Integrations', ('Integrations', get_integrations_paths,
+                          partial(process_integration, print_logs=print_logs))),
+        ('IncidentTypes', ('IncidentTypes', partial(get_general_paths, INCIDENT_TYPES_DIR),
+                           partial(process_general_items, print_logs=print_logs,
+                                   expected_file_types=(FileType.INCIDENT_TYPE,),
+                                   data_extraction_func=get_incident_type_data))),
+        ('Playbooks', ('Playbooks', get_playbooks_paths,
+                       partial(process_general_items, print_logs=print_logs,
+                               expected_file_types=(FileType.PLAYBOOK,),
+                               data_extraction_func=get_playbook_data))),
+        ('Scripts', ('Scripts', partial(get_general_paths, SCRIPTS_DIR),
+                     partial(process_script, print_logs=print_logs))),
+        ('TestPlaybooks', ('TestPlaybooks', partial(get_general_paths, TEST_PLAYBOOKS_DIR),
+                           partial(process_test_playbook_path, print_logs=print_logs))),
+        ('Classifiers', ('Classifiers', partial(get_general_paths, CLASSIFIERS_DIR),
+                         partial(process_general_items, print_logs=print_logs,
+                                 expected_file_types=(FileType.CLASSIFIER, FileType.OLD_CLASSIFIER),
+                                 data_extraction_func=get_classifier_data))),
+        ('Dashboards', ('Dashboards', partial(get_general_paths, DASHBOARDS_DIR),
+                        partial(process_general_items, print_logs=print_logs,
+                                expected_file_types=(FileType.DASHBOARD,),
+                                data_extraction_func=get_general_data))),
+        ('IndicatorFields', ('IndicatorFields', partial(get_general_paths, INDICATOR_FIELDS_DIR),
+                             partial(process_general_items, print_logs=print_logs,
+                                     expected_file_types=(FileType.INDICATOR_FIELD,),
+                                     data_extraction_func=get_general_data))),
+        ('Layouts', ('Layouts', partial(get_general_paths, LAYOUTS_DIR),
+                     partial(process_general_items, print_logs=print_logs,
+                             expected_file_types=(FileType.LAYOUT,),
+                             data_extraction_func=get_layout_data))),
+        ('LayoutsContainers', ('Layouts', partial(get_general_paths, LAYOUTS_DIR),
+                               partial(process_general_items, print_logs=print_logs,
+                                       expected_file_types=(FileType.LAYOUTS_CONTAINER,),
+                                       data_extraction_func=get_layoutscontainer_data))),
+        ('Reports', ('Reports', partial(get_general_paths, REPORTS_DIR),
+                     partial(process_general_items, print_logs=print_logs,
+                             expected_file_types=(FileType.REPORT,),
+                             data_extraction_func=get_general_data))),
+        ('Widgets', ('Widgets', partial(get_general_paths, WIDGETS_DIR),
+                     partial(process_general_items, print_logs=print_logs,
+                             expected_file_types=(FileType.WIDGET,),
+                             data_extraction_func=get_widget_data))),
+        ('Mappers', ('Mappers', partial(get_general_paths, MAPPERS_DIR),
+                     partial(process_general_items, print_logs=print_logs,
+                             expected_file_types=(FileType.MAPPER,),
+                             data_extraction_func=get_mapper_data))),
+        ('IncidentFields', ('IncidentFields', partial(get_general_paths, INCIDENT_FIELDS_DIR),
+                            partial(process_incident_fields, print_logs=print_logs))),
+        ('IndicatorTypes', ('IndicatorTypes', partial(get_general_paths, INDICATOR_TYPES_DIR),
+                            partial(process_indicator_types, print_logs=print_logs))),
+    ])
 
 
 def re_create_id_set(id_set_path: Optional[str] = DEFAULT_ID_SET_PATH, objects_to_create: list = None,  # noqa: C901
-                     print_logs: bool = True):
+                     print_logs: bool = True, use_cache: bool = True):
     """Re create the id set
 
     Args:
         id_set_path (str, optional): If passed an empty string will use default path. Pass in None to avoid saving the id set.
             Defaults to DEFAULT_ID_SET_PATH.
         objects_to_create (list, optional): [description]. Defaults to None.
+        print_logs (bool, optional): Whether to print logs to stdout. Defaults to True.
+        use_cache (bool, optional): Whether to re-process only the files which changed since the previous run, using
+            the id_set cache stored next to the id set file. Has no effect when the id set is not saved.
+            Defaults to True.
 
     Returns: id set object
     """
@@ -1090,198 +1306,59 @@ def re_create_id_set(id_set_path: Optional[str] = DEFAULT_ID_SET_PATH, objects_t
         objects_to_create = CONTENT_ENTITIES
 
     start_time = time.time()
-    scripts_list = []
-    playbooks_list = []
-    integration_list = []
-    testplaybooks_list = []
-
-    classifiers_list = []
-    dashboards_list = []
-    incident_fields_list = []
-    incident_type_list = []
-    indicator_fields_list = []
-    indicator_types_list = []
-    layouts_list = []
-    reports_list = []
-    widgets_list = []
-    mappers_list = []
+    id_set_cache = IDSetCache(get_id_set_cache_path(id_set_path)) if use_cache and id_set_path else None
+    id_set_sections = OrderedDict((section, section_data) for section, section_data in get_id_set_sections(print_logs).items()
+                                  if section_data[0] in objects_to_create)
 
     pool = Pool(processes=int(cpu_count() * 1.5))
 
     print_color("Starting the creation of the id_set", LOG_COLORS.GREEN)
 
-    with click.progressbar(length=len(objects_to_create), label="Progress of id set creation") as progress_bar:
-        if 'Integrations' in objects_to_create:
-            print_color("\nStarting iteration over Integrations", LOG_COLORS.GREEN)
-            for arr in pool.map(partial(process_integration,
-                                        print_logs=print_logs
-                                        ),
-                                get_integrations_paths()):
-                integration_list.extend(arr)
-
-        progress_bar.update(1)
-
-        if 'Playbooks' in objects_to_create:
-            print_color("\nStarting iteration over Playbooks", LOG_COLORS.GREEN)
-            for arr in pool.map(partial(process_general_items,
-                                        print_logs=print_logs,
-                                        expected_file_types=(FileType.PLAYBOOK,),
-                                        data_extraction_func=get_playbook_data,
-                                        ),
-                                get_playbooks_paths()):
-                playbooks_list.extend(arr)
-
-        progress_bar.update(1)
-
-        if 'Scripts' in objects_to_create:
-            print_color("\nStarting iteration over Scripts", LOG_COLORS.GREEN)
-            for arr in pool.map(partial(process_script,
-                                        print_logs=print_logs
-                                        ),
-                                get_general_paths(SCRIPTS_DIR)):
-                scripts_list.extend(arr)
-
-        progress_bar.update(1)
-
-        if 'TestPlaybooks' in objects_to_create:
-            print_color("\nStarting iteration over TestPlaybooks", LOG_COLORS.GREEN)
-            for pair in pool.map(partial(process_test_playbook_path,
-                                         print_logs=print_logs
-                                         ),
-                                 get_general_paths(TEST_PLAYBOOKS_DIR)):
-                if pair[0]:
-                    testplaybooks_list.append(pair[0])
-                if pair[1]:
-                    scripts_list.append(pair[1])
-
-        progress_bar.update(1)
-
-        if 'Classifiers' in objects_to_create:
-            print_color("\nStarting iteration over Classifiers", LOG_COLORS.GREEN)
-            for arr in pool.map(partial(process_general_items,
-                                        print_logs=print_logs,
-                                        expected_file_types=(FileType.CLASSIFIER, FileType.OLD_CLASSIFIER),
-                                        data_extraction_func=get_classifier_data,
-                                        ),
-                                get_general_paths(CLASSIFIERS_DIR)):
-                classifiers_list.extend(arr)
-
-        progress_bar.update(1)
-
-        if 'Dashboards' in objects_to_create:
-            print_color("\nStarting iteration over Dashboards", LOG_COLORS.GREEN)
-            for arr in pool.map(partial(process_general_items,
-                                        print_logs=print_logs,
-                                        expected_file_types=(FileType.DASHBOARD,),
-                                        data_extraction_func=get_general_data,
-                                        ),
-                                get_general_paths(DASHBOARDS_DIR)):
-                dashboards_list.extend(arr)
-
-        progress_bar.update(1)
-
-        if 'IncidentTypes' in objects_to_create:
-            print_color("\nStarting iteration over Incident Types", LOG_COLORS.GREEN)
-            for arr in pool.map(partial(process_general_items,
-                                        print_logs=print_logs,
-                                        expected_file_types=(FileType.INCIDENT_TYPE,),
-                                        data_extraction_func=get_incident_type_data,
-                                        ),
-                                get_general_paths(INCIDENT_TYPES_DIR)):
-                incident_type_list.extend(arr)
-
-        progress_bar.update(1)
-
-        # Has to be called after 'IncidentTypes' is called
-        if 'IncidentFields' in objects_to_create:
-            print_color("\nStarting iteration over Incident Fields", LOG_COLORS.GREEN)
-            for arr in pool.map(partial(process_incident_fields,
-                                        print_logs=print_logs,
-                                        incidents_types_list=incident_type_list
-                                        ),
-                                get_general_paths(INCIDENT_FIELDS_DIR)):
-                incident_fields_list.extend(arr)
-
-        progress_bar.update(1)
-
-        if 'IndicatorFields' in objects_to_create:
-            print_color("\nStarting iteration over Indicator Fields", LOG_COLORS.GREEN)
-            for arr in pool.map(partial(process_general_items,
-                                        print_logs=print_logs,
-                                        expected_file_types=(FileType.INDICATOR_FIELD,),
-                                        data_extraction_func=get_general_data,
-                                        ),
-                                get_general_paths(INDICATOR_FIELDS_DIR)):
-                indicator_fields_list.extend(arr)
-
-        progress_bar.update(1)
-
-        # Has to be called after 'Integrations' is called
-        if 'IndicatorTypes' in objects_to_create:
-            print_color("\nStarting iteration over Indicator Types", LOG_COLORS.GREEN)
-            for arr in pool.map(partial(process_indicator_types,
-                                        print_logs=print_logs,
-                                        all_integrations=integration_list
-                                        ),
-                                get_general_paths(INDICATOR_TYPES_DIR)):
-                indicator_types_list.extend(arr)
-
-        progress_bar.update(1)
-
-        if 'Layouts' in objects_to_create:
-            print_color("\nStarting iteration over Layouts", LOG_COLORS.GREEN)
-            for arr in pool.map(partial(process_general_items,
-                                        print_logs=print_logs,
-                                        expected_file_types=(FileType.LAYOUT,),
-                                        data_extraction_func=get_layout_data,
-                                        ),
-                                get_general_paths(LAYOUTS_DIR)):
-                layouts_list.extend(arr)
-            for arr in pool.map(partial(process_general_items,
-                                        print_logs=print_logs,
-                                        expected_file_types=(FileType.LAYOUTS_CONTAINER,),
-                                        data_extraction_func=get_layoutscontainer_data,
-                                        ),
-                                get_general_paths(LAYOUTS_DIR)):
-                layouts_list.extend(arr)
-
-        progress_bar.update(1)
-
-        if 'Reports' in objects_to_create:
-            print_color("\nStarting iteration over Reports", LOG_COLORS.GREEN)
-            for arr in pool.map(partial(process_general_items,
-                                        print_logs=print_logs,
-                                        expected_file_types=(FileType.REPORT,),
-                                        data_extraction_func=get_general_data,
-                                        ),
-                                get_general_paths(REPORTS_DIR)):
-                reports_list.extend(arr)
-
-        progress_bar.update(1)
-
-        if 'Widgets' in objects_to_create:
-            print_color("\nStarting iteration over Widgets", LOG_COLORS.GREEN)
-            for arr in pool.map(partial(process_general_items,
-                                        print_logs=print_logs,
-                                        expected_file_types=(FileType.WIDGET,),
-                                        data_extraction_func=get_widget_data,
-                                        ),
-                                get_general_paths(WIDGETS_DIR)):
-                widgets_list.extend(arr)
-
-        progress_bar.update(1)
-
-        if 'Mappers' in objects_to_create:
-            print_color("\nStarting iteration over Mappers", LOG_COLORS.GREEN)
-            for arr in pool.map(partial(process_general_items,
-                                        print_logs=print_logs,
-                                        expected_file_types=(FileType.MAPPER,),
-                                        data_extraction_func=get_mapper_data,
-                                        ),
-                                get_general_paths(MAPPERS_DIR)):
-                mappers_list.extend(arr)
-
-        progress_bar.update(1)
+    # All the sections are dispatched to the pool up front, as one stream of work items.
+    # Only a dependent section waits, for the results of the section it depends on.
+    section_jobs = {}
+    for section, (_, get_paths, process_func) in id_set_sections.items():
+        if section not in ID_SET_SECTION_DEPENDENCIES:
+            section_jobs[section] = IDSetSectionJob(pool, section, process_func, get_paths(), id_set_cache)
+
+    section_results = {}
+    with click.progressbar(length=len(id_set_sections), label="Progress of id set creation") as progress_bar:
+        for section, (_, get_paths, process_func) in id_set_sections.items():
+            if section not in ID_SET_SECTION_DEPENDENCIES:
+                continue
+            dependency, dependency_argument = ID_SET_SECTION_DEPENDENCIES[section]
+            if dependency in section_jobs and dependency not in section_results:
+                section_results[dependency] = section_jobs[dependency].get()
+            dependency_entries = list(itertools.chain.from_iterable(section_results.get(dependency, [])))
+            section_jobs[section] = IDSetSectionJob(pool, section,
+                                                    partial(process_func, **{dependency_argument: dependency_entries}),
+                                                    get_paths(), id_set_cache, context=dependency_entries)
+
+        for section, section_job in section_jobs.items():
+            if section not in section_results:
+                section_results[section] = section_job.get()
+            progress_bar.update(1)
+
+    pool.close()
+
+    def get_section_entries(section: str) -> list:
+        return list(itertools.chain.from_iterable(section_results.get(section, [])))
+
+    test_playbooks_pairs = section_results.get('TestPlaybooks', [])
+    scripts_list = get_section_entries('Scripts') + [pair[1] for pair in test_playbooks_pairs if pair[1]]
+    playbooks_list = get_section_entries('Playbooks')
+    integration_list = get_section_entries('Integrations')
+    testplaybooks_list = [pair[0] for pair in test_playbooks_pairs if pair[0]]
+    classifiers_list = get_section_entries('Classifiers')
+    dashboards_list = get_section_entries('Dashboards')
+    incident_fields_list = get_section_entries('IncidentFields')
+    incident_type_list = get_section_entries('IncidentTypes')
+    indicator_fields_list = get_section_entries('IndicatorFields')
+    indicator_types_list = get_section_entries('IndicatorTypes')
+    layouts_list = get_section_entries('Layouts') + get_section_entries('LayoutsContainers')
+    reports_list = get_section_entries('Reports')
+    widgets_list = get_section_entries('Widgets')
+    mappers_list = get_section_entries('Mappers')
 
     new_ids_dict = OrderedDict()
     # we sort each time the whole set in case someone manually changed something
@@ -1304,6 +1381,11 @@ def re_create_id_set(id_set_path: Optional[str] = DEFAULT_ID_SET_PATH, objects_t
     if id_set_path:
         with open(id_set_path, 'w+') as id_set_file:
             json.dump(new_ids_dict, id_set_file, indent=4)
+    if id_set_cache:
+        id_set_cache.save()
+        if print_logs:
+            print_color(f"Re-processed {id_set_cache.misses} changed items, "
+                        f"reused {id_set_cache.hits} items from the id_set cache", LOG_COLORS.GREEN)
     exec_time = time.time() - start_time
     print_color("Finished the creation of the id_set. Total time: {} seconds".format(exec_time), LOG_COLORS.GREEN)
 
@@ -1323,42 +1405,70 @@ def find_duplicates(id_set, print_logs):
         if print_logs:
             print_color("Checking diff for {}".format(object_type), LOG_COLORS.GREEN)
         objects = id_set.get(object_type)
-        ids = {list(specific_item.keys())[0] for specific_item in objects}
-
-        dup_list = []
-        for id_to_check in ids:
-            if has_duplicate(objects, id_to_check, object_type, print_logs):
-                dup_list.append(id_to_check)
-        lists_to_return.append(dup_list)
+        lists_to_return.append(get_duplicate_ids(objects, object_type, print_logs))
 
     if print_logs:
         print_color("Checking diff for Incident and Indicator Fields", LOG_COLORS.GREEN)
 
     fields = id_set['IncidentFields'] + id_set['IndicatorFields']
-    field_ids = {list(field.keys())[0] for field in fields}
-
-    field_list = []
-    for field_to_check in field_ids:
-        if has_duplicate(fields, field_to_check, 'Indicator and Incident Fields', print_logs):
-            field_list.append(field_to_check)
-    lists_to_return.append(field_list)
+    lists_to_return.append(get_duplicate_ids(fields, 'Indicator and Incident Fields', print_logs))
 
     return lists_to_return
 
 
+def get_duplicate_ids(id_set_section: list, object_type=None, print_logs=True) -> list:
+    """Finds the duplicate ids of an id set section, grouping the section items by id in a single pass.
+
+    Args:
+        id_set_section: The id set section items.
+        object_type: The section object type.
+        print_logs: Whether to print logs to stdout.
+
+    Returns:
+        list: The duplicate ids.
+    """
+    items_by_id: Dict[str, list] = OrderedDict()
+    for item in id_set_section:
+        for item_id, item_data in item.items():
+            if item_data:
+                items_by_id.setdefault(item_id, []).append(item_data)
+
+    return [item_id for item_id, items_data in items_by_id.items()
+            if len(items_data) > 1 and are_duplicates(items_data, item_id, object_type, print_logs)]
+
+
 def has_duplicate(id_set, id_to_check, object_type=None, print_logs=True):
-    duplicates = [duplicate for duplicate in id_set if duplicate.get(id_to_check)]
+    duplicates = [list(duplicate.values())[0] for duplicate in id_set if duplicate.get(id_to_check)]
+
+    return are_duplicates(duplicates, id_to_check, object_type, print_logs)
+
 
-    if len(duplicates) < 2:
+def get_version_range(item_data: dict) -> Tuple[tuple, tuple]:
+    """Parses the item version range once, to a pair of comparable (from version, to version) tuples."""
+    return (tuple(LooseVersion(item_data.get('fromversion', '0.0.0')).version),
+            tuple(LooseVersion(item_data.get('toversion', '99.99.99')).version))
+
+
+def are_duplicates(items_data: list, id_to_check, object_type=None, print_logs=True) -> bool:
+    """Checks whether items sharing the same id are duplicates, i.e. their version ranges overlap.
+
+    Args:
+        items_data: The data of the items with the same id.
+        id_to_check: The items id.
+        object_type: The items object type.
+        print_logs: Whether to print logs to stdout.
+
+    Returns:
+        bool: True if the items are duplicates, False otherwise.
+    """
+    if len(items_data) < 2:
         return False
 
-    for dup1, dup2 in itertools.combinations(duplicates, 2):
-        dict1 = list(dup1.values())[0]
-        dict2 = list(dup2.values())[0]
-        dict1_from_version = LooseVersion(dict1.get('fromversion', '0.0.0'))
-        dict2_from_version = LooseVersion(dict2.get('fromversion', '0.0.0'))
-        dict1_to_version = LooseVersion(dict1.get('toversion', '99.99.99'))
-        dict2_to_version = LooseVersion(dict2.get('toversion', '99.99.99'))
+    items_with_versions = [(item_data, get_version_range(item_data)) for item_data in items_data]
+
+    for (dict1, dict1_versions), (dict2, dict2_versions) in itertools.combinations(items_with_versions, 2):
+        dict1_from_version, dict1_to_version = dict1_versions
+        dict2_from_version, dict2_to_version = dict2_versions
 
         if print_logs and dict1.get('name') != dict2.get('name'):
             print_warning('The following {} have the same ID ({}) but different names: '
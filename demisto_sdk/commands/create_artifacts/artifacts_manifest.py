@@ -0,0 +1,160 @@
+import hashlib
+import json
+import os
+from typing import Dict, List, Optional, Set, Tuple
+
+from wcmatch.pathlib import Path
+
+MANIFEST_FILE_NAME = 'artifacts_manifest.json'
+# Sources of a dump unit - Source paths and extra value which affects the created artifacts.
+UnitSources = Tuple[List[Path], str]
+
+
+class ArtifactsManifest:
+    def __init__(self, artifacts_path: Path, config: dict, previous_units: Optional[Dict[str, dict]] = None):
+        """ Manifest of incremental artifacts, Maps each dump unit (Pack, TestPlaybooks etc.) to its sources hash and
+        the artifacts files it created.
+
+        Args:
+            artifacts_path: Artifacts directory, the manifest is saved in.
+            config: Artifacts configuration which affects all units (Content version, suffix etc.).
+            previous_units: Units of the previous run manifest.
+        """
+        self.artifacts_path = artifacts_path
+        self.path = artifacts_path / MANIFEST_FILE_NAME
+        self.config = config
+        self.previous_units = previous_units or {}
+        self.units: Dict[str, dict] = {}
+        self.units_to_dump: Set[str] = set()
+
+    @classmethod
+    def load(cls, artifacts_path: Path, config: dict) -> 'ArtifactsManifest':
+        """ Load previous run manifest, Ignored if created with different configuration.
+
+        Args:
+            artifacts_path: Artifacts directory, the manifest is saved in.
+            config: Artifacts configuration which affects all units (Content version, suffix etc.).
+
+        Returns:
+            ArtifactsManifest: Manifest object.
+        """
+        previous_units = None
+        manifest_path = artifacts_path / MANIFEST_FILE_NAME
+        if manifest_path.exists():
+            try:
+                manifest = json.loads(manifest_path.read_text())
+                if manifest.get('config') == config:
+                    previous_units = manifest.get('units')
+            except ValueError:
+                pass
+
+        return cls(artifacts_path, config, previous_units)
+
+    @property
+    def is_incremental(self) -> bool:
+        """True if previous run artifacts could be reused else False"""
+        return bool(self.previous_units)
+
+    def plan(self, units: Dict[str, UnitSources]) -> Set[str]:
+        """ Decide which units should be dumped:
+                1. Unit sources not changed and its artifacts files exists - Retain its files.
+                2. Otherwise - Delete its previous files and dump it.
+            Files of units which no longer exists are deleted.
+
+        Args:
+            units: Sources of every dump unit.
+
+        Returns:
+            Set[str]: Units to dump.
+        """
+        for unit, (sources, extra) in units.items():
+            sources_hash = hash_sources(sources, extra)
+            previous = self.previous_units.get(unit)
+            if previous and previous['hash'] == sources_hash and \
+                    all((self.artifacts_path / file).exists() for file in previous['files']):
+                self.units[unit] = previous
+            else:
+                self.units[unit] = {'hash': sources_hash, 'files': []}
+                self.units_to_dump.add(unit)
+
+        for unit, previous in self.previous_units.items():
+            if unit not in self.units or unit in self.units_to_dump:
+                for file in previous['files']:
+                    self.delete_file(self.artifacts_path / file)
+
+        return self.units_to_dump
+
+    @property
+    def retained_files(self) -> Set[Path]:
+        """Artifacts files of units which were not dumped"""
+        return {self.artifacts_path / file
+                for unit, unit_manifest in self.units.items() if unit not in self.units_to_dump
+                for file in unit_manifest['files']}
+
+    def add_created_files(self, unit: str, files: List[Path]):
+        """ Add files created by dumped unit.
+
+        Args:
+            unit: Dumped unit.
+            files: Files created in artifacts.
+        """
+        self.units[unit]['files'].extend(file.relative_to(self.artifacts_path).as_posix() for file in files)
+
+    def rename_files(self, renames: Dict[Path, Path]):
+        """ Rename files of dumped units (Suffix add).
+
+        Args:
+            renames: Old file path to new file path.
+        """
+        relative_renames = {old.relative_to(self.artifacts_path).as_posix(): new.relative_to(self.artifacts_path).as_posix()
+                            for old, new in renames.items()}
+        for unit in self.units_to_dump:
+            self.units[unit]['files'] = [relative_renames.get(file, file) for file in self.units[unit]['files']]
+
+    def save(self):
+        """Save manifest for next run, Including only existing files (Unifier temporary files are deleted)"""
+        for unit in self.units_to_dump:
+            self.units[unit]['files'] = sorted({file for file in self.units[unit]['files']
+                                                if (self.artifacts_path / file).exists()})
+        self.path.write_text(json.dumps({'config': self.config, 'units': self.units}, indent=4, sort_keys=True))
+
+    def delete(self):
+        """Delete manifest, next run will create all artifacts"""
+        if self.path.exists():
+            self.path.unlink()
+
+    def delete_file(self, file: Path):
+        """Delete artifacts file and its directories which left empty (Excluding the artifacts directories)"""
+        if file.exists():
+            file.unlink()
+        directory = file.parent
+        while directory.parent != self.artifacts_path and directory.exists() and not any(directory.iterdir()):
+            directory.rmdir()
+            directory = directory.parent
+
+
+def hash_sources(sources: List[Path], extra: str = '') -> str:
+    """ Hash files content and relative paths of sources.
+
+    Args:
+        sources: Files or directories to hash.
+        extra: Extra value to include in hash.
+
+    Returns:
+        str: Sources hash.
+    """
+    sources_hash = hashlib.sha1(extra.encode())
+    for source in sources:
+        files: List[Path] = []
+        if source.is_dir():
+            for dir_path, dir_names, file_names in os.walk(source):
+                dir_names[:] = sorted(dir_name for dir_name in dir_names if dir_name != '__pycache__')
+                files.extend(Path(dir_path, file_name) for file_name in sorted(file_names))
+        elif source.exists():
+            files.append(source)
+        for file in files:
+            file_bytes = file.read_bytes()
+            sources_hash.update(f'{file.relative_to(source.parent).as_posix()}\0{len(file_bytes)}\0'.encode())
+            sources_hash.update(file_bytes)
+
+    return sources_hash.hexdigest()
@@ -32,6 +32,7 @@ class ObjectReport:
         self._content_test = content_test
         self._content_new = content_new
         self._content_all = content_all
+        self.created_files: List[Path] = []
 
     def to_dict(self):
         """Class to dict used in order to populate table using paandas"""
@@ -59,6 +60,10 @@ class ObjectReport:
         """Set content_all include state to True"""
         self._content_all = True
 
+    def add_created_files(self, created_files: List[Path]):
+        """Add files created in artifacts for the object"""
+        self.created_files.extend(created_files)
+
 
 class ArtifactsReport:
     def __init__(self, header: str):
@@ -71,17 +76,25 @@ class ArtifactsReport:
         """
         self._header = header
         self._content_objects: List[dict] = []
+        self.created_files: List[Path] = []
 
     def append(self, object_report: ObjectReport):
         """Append object report to entries"""
         self._content_objects.append(object_report.to_dict())
+        self.created_files.extend(object_report.created_files)
 
     def __iadd__(self, object_report: ObjectReport):
         """Append object report to entries using + operator"""
         self._content_objects.append(object_report.to_dict())
+        self.created_files.extend(object_report.created_files)
 
         return self
 
+    def merge(self, artifacts_report: 'ArtifactsReport'):
+        """Append entries of another report (Objects of the same pack dumped separately)"""
+        self._content_objects.extend(artifacts_report._content_objects)
+        self.created_files.extend(artifacts_report.created_files)
+
     def to_str(self, src_relative_to: Path = None):
         """ Create pandas table as pretty string.
 
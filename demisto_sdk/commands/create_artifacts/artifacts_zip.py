@@ -0,0 +1,183 @@
+import os
+import shutil
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from tempfile import TemporaryFile
+from typing import IO, Dict, List, NamedTuple, Tuple
+from zipfile import ZIP64_LIMIT, ZIP_DEFLATED, ZipFile, ZipInfo
+
+from wcmatch.pathlib import Path
+
+# Same compression as shutil.make_archive
+COMPRESS_LEVEL = zlib.Z_DEFAULT_COMPRESSION
+CHUNK_SIZE = 1024 * 1024
+
+
+class CompressedFile(NamedTuple):
+    """ Location and sizes of a file compressed once in the compressed files spool.
+
+    Args:
+        offset: Offset of the raw deflate stream in the spool.
+        compress_size: Size of the raw deflate stream.
+        file_size: Size of the uncompressed file.
+        crc: CRC-32 of the uncompressed file.
+    """
+    offset: int
+    compress_size: int
+    file_size: int
+    crc: int
+
+
+def make_archives(archives: Dict[Path, Path], workers: int = 1):
+    """ Zip directories to archives (Same structure as shutil.make_archive), Files which exists in several archives
+    (Hard links of the same file) are compressed only once and their compressed stream is written to every archive.
+
+    Args:
+        archives: Archive path to the directory it should contain.
+        workers: Number of threads compressing files.
+    """
+    archives_entries = {archive: archive_entries(root_dir) for archive, root_dir in archives.items()}
+    with TemporaryFile() as spool:
+        compressed_files = compress_files(archives_entries, spool, workers)
+        for archive, entries in archives_entries.items():
+            with ZipFile(archive, 'w', compression=ZIP_DEFLATED) as zip_file:
+                for arcname, path in entries:
+                    if path.is_dir():
+                        zip_file.write(path, arcname)
+                    else:
+                        write_compressed_file(zip_file, arcname, path, compressed_files[file_key(path)], spool)
+
+
+def archive_entries(root_dir: Path) -> List[Tuple[str, Path]]:
+    """ Collect the directories and files to archive, in the order shutil.make_archive writes them.
+
+    Args:
+        root_dir: Directory to archive.
+
+    Returns:
+        List[Tuple[str, Path]]: Name in archive and path of each directory/file.
+    """
+    entries = []
+    for dir_path, dir_names, file_names in os.walk(root_dir):
+        dir_names.sort()
+        for name in dir_names + sorted(file_names):
+            path = Path(dir_path, name)
+            entries.append((path.relative_to(root_dir).as_posix(), path))
+
+    return entries
+
+
+def file_key(path: Path) -> Tuple[int, int]:
+    """Identify hard links of the same file"""
+    stat = path.stat()
+    return stat.st_dev, stat.st_ino
+
+
+def compress_files(archives_entries: Dict[Path, List[Tuple[str, Path]]], spool: IO[bytes],
+                   workers: int) -> Dict[Tuple[int, int], CompressedFile]:
+    """ Compress every unique file of the archives once, to the compressed files spool.
+
+    Args:
+        archives_entries: Entries of every archive.
+        spool: File to write the compressed streams to.
+        workers: Number of threads compressing files.
+
+    Returns:
+        Dict[Tuple[int, int], CompressedFile]: Compressed file by file key.
+    """
+    unique_files: Dict[Tuple[int, int], Path] = {}
+    for entries in archives_entries.values():
+        for _, path in entries:
+            if not path.is_dir():
+                unique_files.setdefault(file_key(path), path)
+
+    compressed_files = {}
+    keys = list(unique_files)
+    # zlib releases the GIL while compressing, compress in batches to bound the memory of pending streams
+    batch_size = max(workers, 1) * 4
+    with ThreadPoolExecutor(max_workers=max(workers, 1)) as executor:
+        for i in range(0, len(keys), batch_size):
+            batch = keys[i:i + batch_size]
+            batch_results = executor.map(compress_file, [unique_files[key] for key in batch])
+            for key, (data, file_size, crc) in zip(batch, batch_results):
+                compressed_files[key] = CompressedFile(offset=spool.tell(), compress_size=len(data),
+                                                       file_size=file_size, crc=crc)
+                spool.write(data)
+
+    return compressed_files
+
+
+def compress_file(path: Path) -> Tuple[bytes, int, int]:
+    """ Compress file to raw deflate stream, as stored in zip archives.
+
+    Args:
+        path: File to compress.
+
+    Returns:
+        Tuple[bytes, int, int]: Compressed stream, uncompressed size and CRC-32.
+    """
+    compressor = zlib.compressobj(COMPRESS_LEVEL, zlib.DEFLATED, -15)
+    chunks = []
+    file_size = 0
+    crc = 0
+    with path.open('rb') as file:
+        for chunk in iter(lambda: file.read(CHUNK_SIZE), b''):
+            file_size += len(chunk)
+            crc = zlib.crc32(chunk, crc)
+            chunks.append(compressor.compress(chunk))
+    chunks.append(compressor.flush())
+
+    return b''.join(chunks), file_size, crc
+
+
+def write_compressed_file(zip_file: ZipFile, arcname: str, path: Path, compressed_file: CompressedFile,
+                          spool: IO[bytes]):
+    """ Write already compressed file to zip archive.
+    ZipFile has no api for writing compressed streams, So the entry is written the same way ZipFile.write writes it.
+
+    Args:
+        zip_file: Zip archive opened for write.
+        arcname: Name of the file in the archive.
+        path: File path.
+        compressed_file: Compressed stream of the file in the spool.
+        spool: The compressed files spool.
+    """
+    zinfo = ZipInfo.from_file(path, arcname)
+    zinfo.compress_type = ZIP_DEFLATED
+    zinfo.file_size = compressed_file.file_size
+    zinfo.compress_size = compressed_file.compress_size
+    zinfo.CRC = compressed_file.crc
+    zip64 = zinfo.file_size > ZIP64_LIMIT or zinfo.compress_size > ZIP64_LIMIT
+    # Mirrors ZipFile.write using ZipFile internals, which were checked against the supported CPython 3.7 and 3.8 (and
+    # 3.11 to 3.13) - test_make_archives_round_trip reads every entry back on each tox env, Recheck on new versions.
+    if getattr(zip_file, '_writing', False):
+        raise ValueError("Can't write to ZIP archive while an open writing handle exists")
+    zip_file._writecheck(zinfo)  # type: ignore
+    zip_file._didModify = True  # type: ignore
+    zinfo.header_offset = zip_file.fp.tell()  # type: ignore
+    zip_file.fp.write(zinfo.FileHeader(zip64))  # type: ignore
+    spool.seek(compressed_file.offset)
+    shutil.copyfileobj(LimitedReader(spool, compressed_file.compress_size), zip_file.fp)  # type: ignore
+    zip_file.filelist.append(zinfo)
+    zip_file.NameToInfo[zinfo.filename] = zinfo
+    zip_file.start_dir = zip_file.fp.tell()  # type: ignore
+
+
+class LimitedReader:
+    def __init__(self, file: IO[bytes], size: int):
+        """ Read up to size bytes of file.
+
+        Args:
+            file: File to read from its current position.
+            size: Number of bytes to read.
+        """
+        self.file = file
+        self.remaining = size
+
+    def read(self, size: int = -1) -> bytes:
+        if size < 0 or size > self.remaining:
+            size = self.remaining
+        data = self.file.read(size)
+        self.remaining -= len(data)
+
+        return data
@@ -4,12 +4,16 @@ import os
 import re
 import sys
 import time
-from concurrent.futures import as_completed
+from collections import Counter
+from concurrent.futures import Future, as_completed
 from contextlib import contextmanager
-from shutil import make_archive, rmtree
-from typing import List, Optional, Union
+from functools import partial
+from itertools import chain
+from shutil import rmtree
+from typing import Callable, Dict, Iterator, List, Optional, Set, Tuple, Union
 
-from demisto_sdk.commands.common.constants import (BASE_PACK,
+from demisto_sdk.commands.common.constants import (API_MODULES_PACK,
+                                                   BASE_PACK,
                                                    DOCUMENTATION_DIR,
                                                    INTEGRATIONS_DIR, PACKS_DIR,
                                                    RELEASE_NOTES_DIR,
@@ -22,11 +26,15 @@ from demisto_sdk.commands.common.content.objects.pack_objects import (
     JSONContentObject, Script, TextObject, YAMLContentObject,
     YAMLContentUnifiedObject)
 from demisto_sdk.commands.common.logger import logging_setup
+from demisto_sdk.commands.common.tools import get_demisto_sdk_version
+from demisto_sdk.commands.unify.unifier import Unifier
 from packaging.version import parse
-from pebble import ProcessFuture, ProcessPool
+from pebble import ProcessPool
 from wcmatch.pathlib import BRACE, EXTMATCH, NEGATE, NODIR, SPLIT, Path
 
+from .artifacts_manifest import ArtifactsManifest, UnitSources
 from .artifacts_report import ArtifactsReport, ObjectReport
+from .artifacts_zip import make_archives
 
 ####################
 # Global variables #
@@ -36,6 +44,7 @@ from .artifacts_report import ArtifactsReport, ObjectReport
 FIRST_MARKETPLACE_VERSION = parse('6.0.0')
 IGNORED_PACKS = ['ApiModules']
 IGNORED_TEST_PLAYBOOKS_DIR = 'Deprecated'
+CONTENT_DESCRIPTOR = 'content-descriptor.json'
 ContentObject = Union[YAMLContentUnifiedObject, YAMLContentObject, JSONContentObject, TextObject]
 logger: logging.Logger
 EX_SUCCESS = 0
@@ -49,7 +58,7 @@ EX_FAIL = 1
 
 class ArtifactsManager:
     def __init__(self, artifacts_path: str, content_version: str, suffix: str, zip: bool, packs: bool,
-                 cpus: int):
+                 cpus: int, zip_packs: bool = False, incremental: bool = False):
         """ Content artifacts configuration
 
         Args:
@@ -59,16 +68,21 @@ class ArtifactsManager:
             suffix: suffix to add all file we creates.
             zip: True for zip all content artifacts to 3 diffrent zip files in same structure else False.
             cpus: Availble cpus in the computer.
+            zip_packs: True for zip each pack of content_packs to uploadable_packs/<pack>.zip else False.
+            incremental: True for reuse previous run artifacts of unchanged packs/objects else False.
         """
         self.suffix = suffix
         self.content_version = content_version
         self.zip_artifacts = zip
+        self.zip_packs = zip_packs
+        self.incremental = incremental
         self.only_content_packs = packs
         self.artifacts_path = Path(artifacts_path)
         self.content_new_path = self.artifacts_path / 'content_new'
         self.content_test_path = self.artifacts_path / 'content_test'
         self.content_packs_path = self.artifacts_path / 'content_packs'
         self.content_all_path = self.artifacts_path / 'all_content'
+        self.uploadable_packs_path = self.artifacts_path / 'uploadable_packs'
         self.cpus = cpus
         self.execution_start = time.time()
         self.content = Content.from_cwd()
@@ -78,21 +92,29 @@ class ArtifactsManager:
 def create_content_artifacts(artifact_manager: ArtifactsManager) -> int:
     global logger
     logger = logging_setup(3)
+    manifest = load_manifest(artifact_manager) if artifact_manager.incremental else None
 
-    with ArtifactsDirsHandler(artifact_manager), ProcessPoolHandler(artifact_manager) as pool:
-        futures: List[ProcessFuture] = []
+    with ArtifactsDirsHandler(artifact_manager, manifest), ProcessPoolHandler(artifact_manager) as pool:
+        # Units to dump, None for all
+        units_to_dump = plan_incremental_dump(artifact_manager, manifest) if manifest else None
+        futures: Dict[Future, str] = {}
         # content/Packs
-        futures.extend(dump_packs(artifact_manager, pool))
+        futures.update(dump_packs(artifact_manager, pool, units_to_dump))
         # content/TestPlaybooks
-        futures.append(pool.schedule(dump_tests_conditionally, args=(artifact_manager,)))
+        if units_to_dump is None or TEST_PLAYBOOKS_DIR in units_to_dump:
+            futures[pool.schedule(dump_tests_conditionally, args=(artifact_manager,))] = TEST_PLAYBOOKS_DIR
         # content/content-descriptor.json
-        futures.append(pool.schedule(dump_content_descriptor, args=(artifact_manager,)))
+        if units_to_dump is None or CONTENT_DESCRIPTOR in units_to_dump:
+            futures[pool.schedule(dump_content_descriptor, args=(artifact_manager,))] = CONTENT_DESCRIPTOR
         # content/Documentation/doc-*.json
-        futures.append(pool.schedule(dump_content_documentations, args=(artifact_manager,)))
+        if units_to_dump is None or DOCUMENTATION_DIR in units_to_dump:
+            futures[pool.schedule(dump_content_documentations, args=(artifact_manager,))] = DOCUMENTATION_DIR
         # Wait for all futures to be finished
-        wait_futures_complete(futures, artifact_manager)
+        wait_futures_complete(futures, artifact_manager, manifest)
         # Add suffix
-        suffix_handler(artifact_manager)
+        renamed_files = suffix_handler(artifact_manager, manifest.retained_files if manifest else None)
+        if manifest:
+            manifest.rename_files(renamed_files)
 
     logger.info(f"\nExecution time: {time.time() - artifact_manager.execution_start} seconds")
 
@@ -128,21 +150,36 @@ def ProcessPoolHandler(artifact_manager: ArtifactsManager) -> ProcessPool:
             pool.join()
 
 
-def wait_futures_complete(futures: List[ProcessFuture], artifact_manager: ArtifactsManager):
+def wait_futures_complete(futures: Dict[Future, str], artifact_manager: ArtifactsManager,
+                          manifest: Optional[ArtifactsManifest] = None):
     """Wait for all futures to complete, Raise exception if occured.
+    Reports of the same unit (Objects of the same pack) are merged and logged when all of them completed.
 
     Args:
         artifact_manager: Artifacts manager object.
-        futures: futures to wait for.
+        futures: futures to wait for, with the unit each of them dumps.
+        manifest: Incremental artifacts manifest to add the created files to.
 
     Raises:
         Exception: Raise caught exception for further cleanups.
     """
+    pending_futures = Counter(futures.values())
+    units_reports: Dict[str, ArtifactsReport] = {}
     for future in as_completed(futures):
         try:
             result = future.result()
+            unit = futures[future]
             if isinstance(result, ArtifactsReport):
-                logger.info(result.to_str(artifact_manager.content.path))
+                if unit in units_reports:
+                    units_reports[unit].merge(result)
+                else:
+                    units_reports[unit] = result
+            pending_futures[unit] -= 1
+            if not pending_futures[unit] and unit in units_reports:
+                unit_report = units_reports.pop(unit)
+                logger.info(unit_report.to_str(artifact_manager.content.path))
+                if manifest:
+                    manifest.add_created_files(unit, unit_report.created_files)
         except (ContentError, DuplicateFiles, ContentFactoryError) as e:
             logger.error(e.msg)
             raise
@@ -241,12 +278,14 @@ def dump_content_documentations(artifact_manager: ArtifactsManager) -> Artifacts
     for documentation in artifact_manager.content.documentations:
         object_report = ObjectReport(documentation, content_packs=True)
         created_files = documentation.dump(artifact_manager.content_packs_path / BASE_PACK / DOCUMENTATION_DIR)
+        object_report.add_created_files(created_files)
         if not artifact_manager.only_content_packs:
             object_report.set_content_new()
             object_report.set_content_all()
             for dest in [artifact_manager.content_new_path,
                          artifact_manager.content_all_path]:
                 created_files = dump_link_files(artifact_manager, documentation, dest, created_files)
+                object_report.add_created_files(created_files)
         report.append(object_report)
 
     return report
@@ -281,6 +320,7 @@ def dump_content_descriptor(artifact_manager: ArtifactsManager) -> ArtifactsRepo
                      artifact_manager.content_new_path,
                      artifact_manager.content_all_path]:
             created_files = dump_link_files(artifact_manager, descriptor, dest, created_files)
+            object_report.add_created_files(created_files)
         report.append(object_report)
 
     return report
@@ -307,7 +347,9 @@ def dump_tests_conditionally(artifact_manager: ArtifactsManager) -> ArtifactsRep
         if is_in_content_test(artifact_manager, test):
             object_report.set_content_test()
             test_created_files = dump_link_files(artifact_manager, test, artifact_manager.content_test_path)
-            dump_link_files(artifact_manager, test, artifact_manager.content_all_path, test_created_files)
+            object_report.add_created_files(test_created_files)
+            object_report.add_created_files(dump_link_files(artifact_manager, test, artifact_manager.content_all_path,
+                                                            test_created_files))
         report += object_report
 
     return report
@@ -317,20 +359,32 @@ def dump_tests_conditionally(artifact_manager: ArtifactsManager) -> ArtifactsRep
 # Content packs functions #
 ###########################
 
-def dump_packs(artifact_manager: ArtifactsManager, pool: ProcessPool) -> List[ProcessFuture]:
+def dump_packs(artifact_manager: ArtifactsManager, pool: ProcessPool,
+               units_to_dump: Optional[Set[str]] = None) -> Dict[Future, str]:
     """ Create futures which dumps conditionally content/Packs.
+    Every pack object is dumped in its own process, largest objects first - In order to keep all processes busy until
+    the end instead of waiting for the largest packs.
 
     Args:
         artifact_manager: Artifacts manager object.
         pool: Process pool to schedule new processes.
+        units_to_dump: Packs units to dump (Packs/<pack_name>), None for all packs.
 
     Returns:
-        List[ProcessFuture]: List of pebble futures to wait for.
+        Dict[Future, str]: Pebble futures to wait for, with the pack unit each of them dumps.
     """
-    futures = []
+    tasks: List[Tuple[int, str, Callable, tuple]] = []
     for pack_name, pack in artifact_manager.content.packs.items():
-        if pack_name not in IGNORED_PACKS:
-            futures.append(pool.schedule(dump_pack, args=(artifact_manager, pack)))
+        unit = f'{PACKS_DIR}/{pack_name}'
+        if pack_name not in IGNORED_PACKS and (units_to_dump is None or unit in units_to_dump):
+            for content_object in get_pack_objects(pack):
+                tasks.append((calc_content_object_size(content_object), unit, dump_pack_object,
+                              (artifact_manager, pack.id, content_object)))
+            tasks.append((0, unit, dump_pack_files, (artifact_manager, pack)))
+
+    futures: Dict[Future, str] = {}
+    for _, unit, task, args in sorted(tasks, key=lambda pack_task: pack_task[0], reverse=True):
+        futures[pool.schedule(task, args=args)] = unit
 
     return futures
 
@@ -357,52 +411,102 @@ def dump_pack(artifact_manager: ArtifactsManager, pack: Pack) -> ArtifactsReport
         ArtifactsReport: ArtifactsReport object.
     """
     pack_report = ArtifactsReport(f"Pack {pack.id}:")
-    for integration in pack.integrations:
-        pack_report += dump_pack_conditionally(artifact_manager, integration)
-    for script in pack.scripts:
-        pack_report += dump_pack_conditionally(artifact_manager, script)
-    for playbook in pack.playbooks:
-        pack_report += dump_pack_conditionally(artifact_manager, playbook)
-    for test_playbook in pack.test_playbooks:
-        pack_report += dump_pack_conditionally(artifact_manager, test_playbook)
-    for report in pack.reports:
-        pack_report += dump_pack_conditionally(artifact_manager, report)
-    for layout in pack.layouts:
-        pack_report += dump_pack_conditionally(artifact_manager, layout)
-    for dashboard in pack.dashboards:
-        pack_report += dump_pack_conditionally(artifact_manager, dashboard)
-    for incident_field in pack.incident_fields:
-        pack_report += dump_pack_conditionally(artifact_manager, incident_field)
-    for incident_type in pack.incident_types:
-        pack_report += dump_pack_conditionally(artifact_manager, incident_type)
-    for indicator_field in pack.indicator_fields:
-        pack_report += dump_pack_conditionally(artifact_manager, indicator_field)
-    for indicator_type in pack.indicator_types:
-        pack_report += dump_pack_conditionally(artifact_manager, indicator_type)
-    for connection in pack.connections:
-        pack_report += dump_pack_conditionally(artifact_manager, connection)
-    for classifier in pack.classifiers:
-        pack_report += dump_pack_conditionally(artifact_manager, classifier)
-    for widget in pack.widgets:
-        pack_report += dump_pack_conditionally(artifact_manager, widget)
+    for content_object in get_pack_objects(pack):
+        pack_report += dump_pack_conditionally(artifact_manager, content_object)
+    pack_report.merge(dump_pack_files(artifact_manager, pack))
+
+    return pack_report
+
+
+def get_pack_objects(pack: Pack) -> Iterator[ContentObject]:
+    """ Pack objects which dumped conditionally (Integrations, Scripts, Playbooks etc).
+
+    Args:
+        pack: Pack object.
+
+    Returns:
+        Iterator[ContentObject]: Pack content objects.
+    """
+    return chain(pack.integrations, pack.scripts, pack.playbooks, pack.test_playbooks, pack.reports, pack.layouts,
+                 pack.dashboards, pack.incident_fields, pack.incident_types, pack.indicator_fields,
+                 pack.indicator_types, pack.connections, pack.classifiers, pack.widgets)
+
+
+def calc_content_object_size(content_object: ContentObject) -> int:
+    """ Size of content object files, Integration/Script in package directory includes all package files (Code, Image
+    etc.) which are unified.
+
+    Args:
+        content_object: Content object.
+
+    Returns:
+        int: Size in bytes.
+    """
+    if isinstance(content_object, YAMLContentUnifiedObject) and \
+            content_object.path.parent.name not in [INTEGRATIONS_DIR, SCRIPTS_DIR, TEST_PLAYBOOKS_DIR]:
+        return sum(file.stat().st_size for file in content_object.path.parent.iterdir() if file.is_file())
+
+    return content_object.path.stat().st_size
+
+
+def dump_pack_object(artifact_manager: ArtifactsManager, pack_id: str,
+                     content_object: ContentObject) -> ArtifactsReport:
+    """ Dump pack object conditionally.
+
+    Args:
+        artifact_manager: Artifacts manager object.
+        pack_id: Pack id of the object.
+        content_object: Content object (e.g. Integration/Script/Layout etc)
+
+    Returns:
+        ArtifactsReport: Pack ArtifactsReport object which includes the object report.
+    """
+    pack_report = ArtifactsReport(f"Pack {pack_id}:")
+    pack_report += dump_pack_conditionally(artifact_manager, content_object)
+
+    return pack_report
+
+
+def dump_pack_files(artifact_manager: ArtifactsManager, pack: Pack) -> ArtifactsReport:
+    """ Dump pack files which are not dumped conditionally:
+            1. Release notes.
+            2. Tools.
+            3. pack_metadata.json
+            4. README.md
+
+    Args:
+        artifact_manager: Artifacts manager object.
+        pack: Pack object.
+
+    Returns:
+        ArtifactsReport: Pack ArtifactsReport object.
+    """
+    pack_report = ArtifactsReport(f"Pack {pack.id}:")
     for release_note in pack.release_notes:
-        pack_report += ObjectReport(release_note, content_packs=True)
-        release_note.dump(artifact_manager.content_packs_path / pack.id / RELEASE_NOTES_DIR)
+        object_report = ObjectReport(release_note, content_packs=True)
+        object_report.add_created_files(release_note.dump(artifact_manager.content_packs_path / pack.id /
+                                                          RELEASE_NOTES_DIR))
+        pack_report += object_report
     for tool in pack.tools:
         object_report = ObjectReport(tool, content_packs=True)
         created_files = tool.dump(artifact_manager.content_packs_path / pack.id / TOOLS_DIR)
+        object_report.add_created_files(created_files)
         if not artifact_manager.only_content_packs:
             object_report.set_content_new()
-            dump_link_files(artifact_manager, tool, artifact_manager.content_new_path, created_files)
+            object_report.add_created_files(dump_link_files(artifact_manager, tool, artifact_manager.content_new_path,
+                                                            created_files))
             object_report.set_content_all()
-            dump_link_files(artifact_manager, tool, artifact_manager.content_all_path, created_files)
+            object_report.add_created_files(dump_link_files(artifact_manager, tool, artifact_manager.content_all_path,
+                                                            created_files))
         pack_report += object_report
     if pack.pack_metadata:
-        pack_report += ObjectReport(pack.pack_metadata, content_packs=True)
-        pack.pack_metadata.dump(artifact_manager.content_packs_path / pack.id)
+        object_report = ObjectReport(pack.pack_metadata, content_packs=True)
+        object_report.add_created_files(pack.pack_metadata.dump(artifact_manager.content_packs_path / pack.id))
+        pack_report += object_report
     if pack.readme:
-        pack_report += ObjectReport(pack.readme, content_packs=True)
-        pack.readme.dump(artifact_manager.content_packs_path / pack.id)
+        object_report = ObjectReport(pack.readme, content_packs=True)
+        object_report.add_created_files(pack.readme.dump(artifact_manager.content_packs_path / pack.id))
+        pack_report += object_report
 
     return pack_report
 
@@ -447,7 +551,11 @@ def dump_pack_conditionally(artifact_manager: ArtifactsManager, content_object:
         # Content all filter
         if is_in_content_all(artifact_manager, content_object):
             object_report.set_content_all()
-            dump_link_files(artifact_manager, content_object, artifact_manager.content_all_path, test_new_created_files)
+            object_report.add_created_files(dump_link_files(artifact_manager, content_object,
+                                                            artifact_manager.content_all_path, test_new_created_files))
+
+    object_report.add_created_files(pack_created_files)
+    object_report.add_created_files(test_new_created_files)
 
     return object_report
 
@@ -455,13 +563,13 @@ def dump_pack_conditionally(artifact_manager: ArtifactsManager, content_object:
 @contextmanager
 def content_files_handler(artifact_manager: ArtifactsManager, content_object: ContentObject):
     """ Pre-processing pack, perform the following:
-            1. Change content/Packs/Base/Scripts/CommonServerPython.py global variables:
+            1. Change content/Packs/Base/Scripts/CommonServerPython.py global variables in the unified script only
+               (The source file is not modified):
                 a. CONTENT_RELEASE_VERSION to given content version flag.
                 b. CONTENT_BRANCH_NAME to active branch
 
         Post-processing pack, perform the following:
-            1. Change content/Packs/Base/Scripts/CommonServerPython.py to original state.
-            2. Unifier creates *_45.yml files in content_pack by default which is not support due to_version lower than
+            1. Unifier creates *_45.yml files in content_pack by default which is not support due to_version lower than
                 NEWEST_SUPPORTED_VERSION, Therefor after copy it to content_new, delete it.
 
     Args:
@@ -477,38 +585,37 @@ def content_files_handler(artifact_manager: ArtifactsManager, content_object: Co
         if (BASE_PACK in content_object.path.parts) and isinstance(content_object, Script) and \
                 content_object.code_path and content_object.code_path.name == 'CommonServerPython.py':
             # Modify CommonServerPython.py global variables
-            repo = artifact_manager.content.git()
-            modify_common_server_constants(content_object.code_path, artifact_manager.content_version,
-                                           'master' if not repo else repo.active_branch)
+            content_object.code_transform = partial(modify_common_server_constants,
+                                                    content_version=artifact_manager.content_version,
+                                                    branch_name=get_content_branch_name(artifact_manager))
         yield files_to_remove
     finally:
-        if (BASE_PACK in content_object.path.parts) and isinstance(content_object, Script) and \
-                content_object.code_path and content_object.code_path.name == 'CommonServerPython.py':
-            # Modify CommonServerPython.py global variables
-            modify_common_server_constants(content_object.code_path, '0.0.0', 'master')
-
         # Delete yaml which created by Unifier in packs and to_version/toVersion lower than NEWEST_SUPPORTED_VERSION
         for file_path in files_to_remove:
             file_path.unlink()
 
 
-def modify_common_server_constants(code_path: Path, content_version: str, branch_name: Optional[str] = None):
+def modify_common_server_constants(code: str, content_version: str, branch_name: Optional[str] = None) -> str:
     """ Modify content/Packs/Base/Scripts/CommonServerPython.py global variables:
             a. CONTENT_RELEASE_VERSION to given content version flag.
             b. CONTENT_BRANCH_NAME to active branch
 
     Args:
-        code_path: Packs/Base/Scripts/CommonServerPython.py full code path.
+        code: Packs/Base/Scripts/CommonServerPython.py code.
         branch_name: branch name to update in CONTENT_BRANCH_NAME
         content_version: content version to update in CONTENT_RELEASE_VERSION
+
+    Returns:
+        str: Modified code.
     """
-    file_content_new = re.sub(r"CONTENT_RELEASE_VERSION = '\d.\d.\d'",
-                              f"CONTENT_RELEASE_VERSION = '{content_version}'",
-                              code_path.read_text())
-    file_content_new = re.sub(r"CONTENT_BRANCH_NAME = '\w+'",
-                              f"CONTENT_BRANCH_NAME = '{branch_name}'",
-                              file_content_new)
-    code_path.write_text(file_content_new)
+    code_new = re.sub(r"CONTENT_RELEASE_VERSION = '\d.\d.\d'",
+                      f"CONTENT_RELEASE_VERSION = '{content_version}'",
+                      code)
+    code_new = re.sub(r"CONTENT_BRANCH_NAME = '\w+'",
+                      f"CONTENT_BRANCH_NAME = '{branch_name}'",
+                      code_new)
+
+    return code_new
 
 
 ########################
@@ -516,7 +623,7 @@ def modify_common_server_constants(code_path: Path, content_version: str, branch
 ########################
 
 
-def suffix_handler(artifact_manager: ArtifactsManager):
+def suffix_handler(artifact_manager: ArtifactsManager, skip_files: Optional[Set[Path]] = None) -> Dict[Path, Path]:
     """ Add suffix to file names exclude:
             1. pack_metadata.json
             2. README.
@@ -529,7 +636,12 @@ def suffix_handler(artifact_manager: ArtifactsManager):
 
     Args:
         artifact_manager: Artifacts manager object.
+        skip_files: Files which allready have suffix (Retained from previous run).
+
+    Returns:
+        Dict[Path, Path]: Renamed files to their new path.
     """
+    renamed_files: Dict[Path, Path] = {}
     files_pattern_to_add_suffix = "!reputations.json|!pack_metadata.json|" \
                                   "!doc-*.json|!content-descriptor.json|*.{json,yml,yaml}"
     if artifact_manager.suffix:
@@ -543,10 +655,15 @@ def suffix_handler(artifact_manager: ArtifactsManager):
                                                                     flags=BRACE | SPLIT | EXTMATCH | NODIR | NEGATE)
         for files in [files_content_new, files_content_packs, files_content_test, files_content_all]:
             for file in files:
+                if skip_files and file in skip_files:
+                    continue
                 file_name_split = file.name.split('.')
                 file_real_stem = ".".join(file_name_split[:-1])
                 suffix = file_name_split[-1]
-                file.rename(file.with_name(f'{file_real_stem}{artifact_manager.suffix}.{suffix}'))
+                renamed_files[file] = file.with_name(f'{file_real_stem}{artifact_manager.suffix}.{suffix}')
+                file.rename(renamed_files[file])
+
+    return renamed_files
 
 ###########
 # Helpers #
@@ -605,6 +722,12 @@ def dump_link_files(artifact_manager: ArtifactsManager, content_object: ContentO
     return new_created_files
 
 
+def get_content_branch_name(artifact_manager: ArtifactsManager) -> str:
+    """Active branch of content repository, Set in CommonServerPython.py"""
+    repo = artifact_manager.content.git()
+    return 'master' if not repo else str(repo.active_branch)
+
+
 def calc_relative_packs_dir(artifact_manager: ArtifactsManager, content_object: ContentObject) -> Path:
     relative_pack_path = content_object.path.relative_to(artifact_manager.content.path / PACKS_DIR)
     if ((INTEGRATIONS_DIR in relative_pack_path.parts and relative_pack_path.parts[-2] != INTEGRATIONS_DIR) or
@@ -621,37 +744,123 @@ def child_mute():
     sys.stdout = open(os.devnull, 'w')
 
 
+###################################
+# Incremental artifacts functions #
+###################################
+
+
+def load_manifest(artifact_manager: ArtifactsManager) -> ArtifactsManifest:
+    """ Load previous run manifest of incremental artifacts.
+
+    Args:
+        artifact_manager: Artifacts manager object.
+
+    Returns:
+        ArtifactsManifest: Manifest, Previous run artifacts are reused only if created with the same configuration.
+    """
+    config = {
+        # Unify/dump changes between sdk versions changes the artifacts
+        'sdk_version': get_demisto_sdk_version(),
+        'content_version': artifact_manager.content_version,
+        'suffix': artifact_manager.suffix,
+        'packs': artifact_manager.only_content_packs
+    }
+
+    return ArtifactsManifest.load(artifact_manager.artifacts_path, config)
+
+
+def plan_incremental_dump(artifact_manager: ArtifactsManager, manifest: ArtifactsManifest) -> Set[str]:
+    """ Decide which units should be dumped, Unit is one of:
+            1. Pack - Packs/<pack_name>
+            2. TestPlaybooks.
+            3. content-descriptor.json.
+            4. Documentation.
+
+    Args:
+        artifact_manager: Artifacts manager object.
+        manifest: Incremental artifacts manifest.
+
+    Returns:
+        Set[str]: Units which their sources changed since previous run.
+    """
+    content_path = artifact_manager.content.path
+    units: Dict[str, UnitSources] = {}
+    for pack_name, pack in artifact_manager.content.packs.items():
+        if pack_name not in IGNORED_PACKS:
+            # CommonServerPython.py in Base pack includes the branch name
+            units[f'{PACKS_DIR}/{pack_name}'] = ([pack.path, *get_api_modules_sources(artifact_manager, pack)],
+                                                 get_content_branch_name(artifact_manager) if pack_name == BASE_PACK else '')
+    units[TEST_PLAYBOOKS_DIR] = ([content_path / TEST_PLAYBOOKS_DIR], '')
+    units[CONTENT_DESCRIPTOR] = ([content_path / CONTENT_DESCRIPTOR], '')
+    units[DOCUMENTATION_DIR] = ([content_path / DOCUMENTATION_DIR], '')
+    units_to_dump = manifest.plan(units)
+    logger.info(f"\nIncremental artifacts: {len(units) - len(units_to_dump)} of {len(units)} packs/objects unchanged")
+
+    return units_to_dump
+
+
+def get_api_modules_sources(artifact_manager: ArtifactsManager, pack: Pack) -> List[Path]:
+    """ API modules which the pack code imports - Unify inserts their code in place of the import, So they are also
+    sources of the pack artifacts.
+
+    Args:
+        artifact_manager: Artifacts manager object.
+        pack: Pack object.
+
+    Returns:
+        List[Path]: API modules directories (Packs/ApiModules/Scripts/<module>).
+    """
+    api_modules: Set[str] = set()
+    for code_path in pack.path.glob(patterns=[f'{INTEGRATIONS_DIR}/*/*.py', f'{SCRIPTS_DIR}/*/*.py']):
+        _, module_name = Unifier.check_api_module_imports(code_path.read_text(encoding='utf-8', errors='ignore'))
+        if module_name:
+            api_modules.add(module_name)
+    api_modules_path = artifact_manager.content.path / PACKS_DIR / API_MODULES_PACK / SCRIPTS_DIR
+
+    return [api_modules_path / module_name for module_name in sorted(api_modules)]
+
+
 ###################################
 # Artifacts Directories functions #
 ###################################
 
 
 @contextmanager
-def ArtifactsDirsHandler(artifact_manager: ArtifactsManager):
+def ArtifactsDirsHandler(artifact_manager: ArtifactsManager, manifest: Optional[ArtifactsManifest] = None):
     """ Artifacts Directories handler.
     Logic by time line:
-        1. Delete artifacts directories if exists.
+        1. Delete artifacts directories if exists (Kept if incremental from previous run artifacts).
         2. Create directories.
-        3. If any error occured -> Delete artifacts directories -> Exit.
+        3. If any error occured -> Delete artifacts directories (And incremental manifest) -> Exit.
         4. If finish succesfully:
-            a. If zip:
-                1. Zip artifacts zip.
-                2. Delete artifacts directories.
+            a. If incremental:
+                1. Save manifest.
+            b. If zip or zip packs:
+                1. Zip artifacts zip / packs zips.
+            c. If zip and not incremental:
+                1. Delete artifacts directories.
         5. log report.
 
     Args:
         artifact_manager: Artifacts manager object.
+        manifest: Incremental artifacts manifest.
     """
     try:
-        delete_dirs(artifact_manager)
+        if not (manifest and manifest.is_incremental):
+            delete_dirs(artifact_manager)
         create_dirs(artifact_manager)
         yield
     except (Exception, KeyboardInterrupt):
         delete_dirs(artifact_manager)
+        if manifest:
+            manifest.delete()
         artifact_manager.exit_code = EX_FAIL
     else:
-        if artifact_manager.zip_artifacts:
+        if manifest:
+            manifest.save()
+        if artifact_manager.zip_artifacts or artifact_manager.zip_packs:
             zip_dirs(artifact_manager)
+        if artifact_manager.zip_artifacts and not manifest:
             delete_dirs(artifact_manager)
         report_artifacts_paths(artifact_manager)
 
@@ -667,22 +876,33 @@ def delete_dirs(artifact_manager: ArtifactsManager):
 def create_dirs(artifact_manager: ArtifactsManager):
     """Create artifacts directories"""
     if artifact_manager.only_content_packs:
-        artifact_manager.content_packs_path.mkdir(parents=True)
+        artifact_manager.content_packs_path.mkdir(parents=True, exist_ok=True)
     else:
         for artifact_dir in [artifact_manager.content_test_path, artifact_manager.content_new_path,
                              artifact_manager.content_packs_path, artifact_manager.content_all_path]:
-            artifact_dir.mkdir(parents=True)
+            artifact_dir.mkdir(parents=True, exist_ok=True)
 
 
 def zip_dirs(artifact_manager: ArtifactsManager):
-    """Zip artifacts directories"""
-    if artifact_manager.only_content_packs:
-        make_archive(artifact_manager.content_packs_path, 'zip', artifact_manager.content_packs_path)
-    else:
-        with ProcessPoolHandler(artifact_manager) as pool:
-            for artifact_dir in [artifact_manager.content_test_path, artifact_manager.content_new_path,
-                                 artifact_manager.content_packs_path, artifact_manager.content_all_path]:
-                pool.schedule(make_archive, args=(artifact_dir, 'zip', artifact_dir))
+    """Zip artifacts directories and packs, files linked to several artifacts are compressed once"""
+    archives: Dict[Path, Path] = {}
+    if artifact_manager.zip_artifacts:
+        if artifact_manager.only_content_packs:
+            artifact_dirs = [artifact_manager.content_packs_path]
+        else:
+            artifact_dirs = [artifact_manager.content_test_path, artifact_manager.content_new_path,
+                             artifact_manager.content_packs_path, artifact_manager.content_all_path]
+        for artifact_dir in artifact_dirs:
+            archives[Path(f'{artifact_dir}.zip')] = artifact_dir
+    if artifact_manager.zip_packs:
+        if artifact_manager.uploadable_packs_path.exists():
+            rmtree(artifact_manager.uploadable_packs_path)
+        artifact_manager.uploadable_packs_path.mkdir(parents=True)
+        for pack_dir in sorted(artifact_manager.content_packs_path.iterdir()):
+            if pack_dir.is_dir():
+                archives[artifact_manager.uploadable_packs_path / f'{pack_dir.name}.zip'] = pack_dir
+
+    make_archives(archives, workers=artifact_manager.cpus)
 
 
 def report_artifacts_paths(artifact_manager: ArtifactsManager):
@@ -702,3 +922,6 @@ def report_artifacts_paths(artifact_manager: ArtifactsManager):
         for artifact_dir in [artifact_manager.content_test_path, artifact_manager.content_new_path,
                              artifact_manager.content_all_path]:
             logger.info(template.format(artifact_dir))
+
+    if artifact_manager.zip_packs:
+        logger.info(f"\n\t - {artifact_manager.uploadable_packs_path}")
@@ -1,6 +1,8 @@
+import os
 from contextlib import contextmanager
-from filecmp import cmp, dircmp
-from shutil import copyfile, copytree, rmtree
+from filecmp import dircmp
+from shutil import copyfile, copytree, make_archive, rmtree
+from zipfile import ZipFile
 
 import pytest
 from demisto_sdk.commands.common.constants import PACKS_DIR, TEST_PLAYBOOKS_DIR
@@ -128,23 +130,18 @@ def test_modify_common_server_constants():
             - Content version x.x.x
             - Active branch - xxxx
 
-    Then: CommonServerPython.py changes:
+    Then: Modified CommonServerPython.py code:
             - Global variable - CONTENT_RELEASE_VERSION = 'x.x.x'
             - Global variable - CONTENT_BRANCH_NAME = 'xxxx'
-
-    Notes:
-        - After test clean up changes.
     """
     from demisto_sdk.commands.create_artifacts.content_artifacts_creator import \
         modify_common_server_constants
     path_before = COMMON_SERVER / 'CommonServerPython.py'
     path_excepted = COMMON_SERVER / 'CommonServerPython_modified.py'
     old_data = path_before.read_text()
-    modify_common_server_constants(path_before, '6.0.0', 'test')
-
-    assert cmp(path_before, path_excepted)
 
-    path_before.write_text(old_data)
+    assert modify_common_server_constants(old_data, '6.0.0', 'test') == path_excepted.read_text()
+    assert path_before.read_text() == old_data
 
 
 def test_dump_pack(mock_git):
@@ -233,3 +230,436 @@ def test_duplicate_file_failure(mock_git):
             exit_code = create_content_artifacts(artifact_manager=config)
 
     assert exit_code == 1
+
+
+def test_make_archives(mocker):
+    """
+    Given
+    - Two directories, sharing a hard linked file.
+
+    When
+    - Zipping both directories.
+
+    Then
+    - Ensure every unique file is compressed once.
+    - Ensure the archives are valid and have the same entries and contents as shutil.make_archive archives.
+    """
+    from demisto_sdk.commands.create_artifacts import artifacts_zip
+    compress_file = mocker.spy(artifacts_zip, 'compress_file')
+    with temp_dir() as temp:
+        first_dir = temp / 'first'
+        second_dir = temp / 'second'
+        (first_dir / 'sub').mkdir(parents=True)
+        second_dir.mkdir()
+        (first_dir / 'shared.yml').write_text('shared: file\n' * 100)
+        (first_dir / 'sub' / 'empty.json').write_text('')
+        (second_dir / 'own.md').write_text('# own file')
+        os.link(first_dir / 'shared.yml', second_dir / 'shared.yml')
+
+        artifacts_zip.make_archives({temp / 'first.zip': first_dir, temp / 'second.zip': second_dir}, workers=2)
+
+        assert compress_file.call_count == 3
+        for artifact_dir in [first_dir, second_dir]:
+            expected = make_archive(temp / f'expected_{artifact_dir.name}', 'zip', artifact_dir)
+            with ZipFile(temp / f'{artifact_dir.name}.zip') as zip_file, ZipFile(expected) as expected_zip_file:
+                assert zip_file.testzip() is None
+                assert sorted(zip_file.namelist()) == sorted(expected_zip_file.namelist())
+                for name in expected_zip_file.namelist():
+                    assert zip_file.read(name) == expected_zip_file.read(name)
+
+
+def test_make_archives_round_trip():
+    """
+    Given
+    - Two directories, sharing a hard linked file, with files larger than a compression chunk and binary files.
+
+    When
+    - Zipping both directories.
+
+    Then
+    - Ensure every entry passes the archive CRC check.
+    - Ensure every entry is read back the same as its source file.
+    """
+    from demisto_sdk.commands.create_artifacts.artifacts_zip import CHUNK_SIZE, make_archives
+    with temp_dir() as temp:
+        first_dir = temp / 'first'
+        second_dir = temp / 'second'
+        (first_dir / 'sub').mkdir(parents=True)
+        second_dir.mkdir()
+        (first_dir / 'large.yml').write_text('large: file\n' * CHUNK_SIZE)
+        (first_dir / 'sub' / 'random.png').write_bytes(os.urandom(CHUNK_SIZE * 2 + 1))
+        (first_dir / 'sub' / 'empty.json').write_text('')
+        (second_dir / 'shared.bin').write_bytes(os.urandom(1000))
+        os.link(second_dir / 'shared.bin', first_dir / 'shared.bin')
+
+        make_archives({temp / 'first.zip': first_dir, temp / 'second.zip': second_dir})
+
+        for artifact_dir in [first_dir, second_dir]:
+            with ZipFile(temp / f'{artifact_dir.name}.zip') as zip_file:
+                assert zip_file.testzip() is None
+                files = [info for info in zip_file.infolist() if not info.is_dir()]
+                assert sorted(info.filename for info in files) == \
+                    sorted(path.relative_to(artifact_dir).as_posix() for path in artifact_dir.rglob('*')
+                           if path.is_file())
+                for info in files:
+                    assert zip_file.read(info) == (artifact_dir / info.filename).read_bytes()
+
+
+def test_write_compressed_file_while_writing():
+    """
+    Given
+    - Zip archive with an open writing handle.
+
+    When
+    - Writing an already compressed file to the archive.
+
+    Then
+    - Ensure it fails as ZipFile.write does, without corrupting the archive.
+    """
+    from tempfile import TemporaryFile
+
+    from demisto_sdk.commands.create_artifacts.artifacts_zip import (
+        CompressedFile, compress_file, write_compressed_file)
+    with temp_dir() as temp:
+        path = temp / 'file.yml'
+        path.write_text('file: data\n')
+        data, file_size, crc = compress_file(path)
+        with TemporaryFile() as spool, ZipFile(temp / 'archive.zip', 'w') as zip_file:
+            spool.write(data)
+            compressed_file = CompressedFile(offset=0, compress_size=len(data), file_size=file_size, crc=crc)
+            with zip_file.open('open.yml', 'w') as open_file:
+                with pytest.raises(ValueError):
+                    write_compressed_file(zip_file, 'file.yml', path, compressed_file, spool)
+                open_file.write(b'open: file\n')
+            write_compressed_file(zip_file, 'file.yml', path, compressed_file, spool)
+        with ZipFile(temp / 'archive.zip') as zip_file:
+            assert zip_file.testzip() is None
+            assert zip_file.read('open.yml') == b'open: file\n'
+            assert zip_file.read('file.yml') == path.read_bytes()
+
+
+def test_create_content_artifacts_zip(mock_git):
+    """
+    Given
+    - Content repository.
+
+    When
+    - Creating zipped content artifacts and a zip for each pack.
+
+    Then
+    - Ensure the artifacts zips contain the artifacts directories.
+    - Ensure a zip is created for each pack of content_packs.
+    """
+    from demisto_sdk.commands.create_artifacts.content_artifacts_creator import (
+        ArtifactsManager, create_content_artifacts)
+    with temp_dir() as temp:
+        config = ArtifactsManager(artifacts_path=temp,
+                                  content_version='6.0.0',
+                                  zip=True,
+                                  zip_packs=True,
+                                  suffix='',
+                                  cpus=1,
+                                  packs=False)
+        exit_code = create_content_artifacts(artifact_manager=config)
+
+        assert exit_code == 0
+        for artifact_dir in ['all_content', 'content_new', 'content_packs', 'content_test']:
+            assert not (temp / artifact_dir).exists()
+            with ZipFile(temp / f'{artifact_dir}.zip') as zip_file:
+                zip_file.extractall(temp / 'extracted' / artifact_dir)
+        assert same_folders(temp / 'extracted', ARTIFACTS_EXPEXTED_RESULTS / 'content')
+        assert sorted(pack_zip.name for pack_zip in (temp / 'uploadable_packs').iterdir()) == \
+            ['Base.zip', 'Sample01.zip', 'Sample02.zip']
+        with ZipFile(temp / 'uploadable_packs' / 'Sample01.zip') as zip_file:
+            zip_file.extractall(temp / 'extracted_pack')
+        assert same_folders(temp / 'extracted_pack', ARTIFACTS_EXPEXTED_RESULTS / 'content' / 'content_packs' / 'Sample01')
+
+
+@contextmanager
+def modify_pack_readme(pack_name: str):
+    """Modify pack README.md.
+
+     Open:
+        - Add line to the pack README.md.
+
+    Close:
+        - Modify content to the original state.
+    """
+    file = TEST_CONTENT_REPO / PACKS_DIR / pack_name / 'README.md'
+    old_data = file.read_text()
+    file.write_text(old_data + '\nModified README\n')
+
+    try:
+        yield
+    finally:
+        file.write_text(old_data)
+
+
+@pytest.mark.parametrize(argnames="suffix", argvalues=["", "_test"])
+def test_create_content_artifacts_incremental(suffix: str, mock_git):
+    """
+    Given
+    - Content artifacts created in incremental mode.
+
+    When
+    - Creating the artifacts again in the same path, after modifying one pack.
+
+    Then
+    - Ensure only the modified pack artifacts are created again.
+    - Ensure the artifacts are the same as a full run artifacts, and the suffix is added once.
+    """
+    from demisto_sdk.commands.create_artifacts.content_artifacts_creator import (
+        ArtifactsManager, create_content_artifacts)
+    with temp_dir() as temp:
+        config = ArtifactsManager(artifacts_path=temp,
+                                  content_version='6.0.0',
+                                  zip=False,
+                                  incremental=True,
+                                  suffix=suffix,
+                                  cpus=1,
+                                  packs=False)
+        assert create_content_artifacts(artifact_manager=config) == 0
+        assert (temp / 'artifacts_manifest.json').exists()
+        # Mark artifacts files to know if they are created again
+        unchanged_file = temp / 'content_packs' / 'Sample01' / 'pack_metadata.json'
+        modified_file = temp / 'content_packs' / 'Sample02' / 'pack_metadata.json'
+        unchanged_data = unchanged_file.read_text()
+        unchanged_file.write_text('{}')
+        modified_file.write_text('{}')
+        first_run_files = sorted(file.relative_to(temp) for file in temp.rglob('*'))
+
+        with modify_pack_readme('Sample02'):
+            config = ArtifactsManager(artifacts_path=temp,
+                                      content_version='6.0.0',
+                                      zip=False,
+                                      incremental=True,
+                                      suffix=suffix,
+                                      cpus=1,
+                                      packs=False)
+            assert create_content_artifacts(artifact_manager=config) == 0
+
+        assert unchanged_file.read_text() == '{}'
+        assert modified_file.read_text() != '{}'
+        unchanged_file.write_text(unchanged_data)
+        assert sorted(file.relative_to(temp) for file in temp.rglob('*')) == first_run_files
+        if suffix:
+            assert not list(temp.rglob(f'*{suffix}{suffix}*'))
+        else:
+            (temp / 'artifacts_manifest.json').unlink()
+            assert same_folders(temp, ARTIFACTS_EXPEXTED_RESULTS / 'content')
+
+
+def test_artifacts_manifest_plan():
+    """
+    Given
+    - Manifest of previous run with unchanged, changed and removed units.
+
+    When
+    - Planning which units to dump.
+
+    Then
+    - Ensure only changed and new units are dumped.
+    - Ensure the artifacts files of changed and removed units are deleted, with their empty directories.
+    """
+    from demisto_sdk.commands.create_artifacts.artifacts_manifest import (
+        ArtifactsManifest, hash_sources)
+    with temp_dir() as temp:
+        sources = temp / 'sources'
+        sources.mkdir()
+        (sources / 'unchanged.yml').write_text('unchanged')
+        (sources / 'changed.yml').write_text('changed')
+        artifacts = temp / 'artifacts'
+        for file in ['content_packs/Unchanged/unchanged.yml', 'content_packs/Changed/changed.yml',
+                     'content_packs/Removed/removed.yml', 'content_new/removed.yml']:
+            (artifacts / file).parent.mkdir(parents=True, exist_ok=True)
+            (artifacts / file).write_text('artifact')
+        previous_units = {
+            'Packs/Unchanged': {'hash': hash_sources([sources / 'unchanged.yml']),
+                                'files': ['content_packs/Unchanged/unchanged.yml']},
+            'Packs/Changed': {'hash': 'old', 'files': ['content_packs/Changed/changed.yml']},
+            'Packs/Removed': {'hash': 'old', 'files': ['content_packs/Removed/removed.yml', 'content_new/removed.yml']}
+        }
+        manifest = ArtifactsManifest(artifacts, {}, previous_units)
+
+        units_to_dump = manifest.plan({'Packs/Unchanged': ([sources / 'unchanged.yml'], ''),
+                                       'Packs/Changed': ([sources / 'changed.yml'], ''),
+                                       'Packs/New': ([sources / 'new.yml'], '')})
+
+        assert units_to_dump == {'Packs/Changed', 'Packs/New'}
+        assert manifest.retained_files == {artifacts / 'content_packs/Unchanged/unchanged.yml'}
+        assert sorted(path.relative_to(artifacts).as_posix() for path in artifacts.rglob('*')) == \
+            ['content_new', 'content_packs', 'content_packs/Unchanged', 'content_packs/Unchanged/unchanged.yml']
+
+
+def test_dump_packs_largest_objects_first(mock_git, mocker):
+    """
+    Given
+    - Content repository packs.
+
+    When
+    - Scheduling the packs dump to the processes pool.
+
+    Then
+    - Ensure every pack object is scheduled separately, largest objects first.
+    - Ensure the reports of each pack are merged and its artifacts are the same as dumping the whole pack.
+    """
+    from concurrent.futures import Future
+
+    from demisto_sdk.commands.create_artifacts.content_artifacts_creator import (
+        ArtifactsManager, calc_content_object_size, create_dirs,
+        dump_pack_object, dump_packs, wait_futures_complete)
+
+    class SyncPool:
+        def __init__(self):
+            self.scheduled = []
+
+        def schedule(self, function, args):
+            self.scheduled.append((function, args))
+            future: Future = Future()
+            future.set_result(function(*args))
+            return future
+
+    with temp_dir() as temp:
+        config = ArtifactsManager(artifacts_path=temp,
+                                  content_version='6.0.0',
+                                  zip=False,
+                                  suffix='',
+                                  cpus=1,
+                                  packs=False)
+        create_dirs(artifact_manager=config)
+        pool = SyncPool()
+        logger = mocker.patch('demisto_sdk.commands.create_artifacts.content_artifacts_creator.logger', create=True)
+
+        futures = dump_packs(config, pool)  # type: ignore
+        wait_futures_complete(futures, config)
+
+        objects_sizes = [calc_content_object_size(args[2]) for function, args in pool.scheduled
+                         if function is dump_pack_object]
+        assert len(objects_sizes) > len(config.content.packs)
+        assert objects_sizes == sorted(objects_sizes, reverse=True)
+        pack_objects = [args[2] for function, args in pool.scheduled if function is dump_pack_object]
+        playbook = next(content_object for content_object in pack_objects
+                        if content_object.path.name == 'playbook-sample_packs_new.yml')
+        assert calc_content_object_size(playbook) == 35
+        layout = next(content_object for content_object in pack_objects
+                      if content_object.path.name == 'layoutscontainer-sample_new.json')
+        assert calc_content_object_size(layout) == 93
+        assert logger.info.call_count == len(set(futures.values()))
+        assert same_folders(src1=temp / 'content_packs' / 'Sample01',
+                            src2=ARTIFACTS_EXPEXTED_RESULTS / 'content' / 'content_packs' / 'Sample01')
+
+
+def test_calc_content_object_size():
+    """
+    Given
+    - Integration in a package directory, unified integration and playbooks.
+
+    When
+    - Calculating the size of each object.
+
+    Then
+    - Ensure the size of the integration in a package directory includes all its package files.
+    - Ensure the size of the unified integration and the playbook is the size of their own file.
+    """
+    from demisto_sdk.commands.common.content.objects.pack_objects import (
+        Integration, Playbook)
+    from demisto_sdk.commands.create_artifacts.content_artifacts_creator import \
+        calc_content_object_size
+    with temp_dir() as temp:
+        package = temp / 'Integrations' / 'Sample'
+        package.mkdir(parents=True)
+        (package / 'Sample.yml').write_text('name: Sample\n')
+        (package / 'Sample.py').write_text('print(1)\n' * 100)
+        (package / 'Sample_image.png').write_bytes(b'0' * 50)
+        (temp / 'Integrations' / 'integration-unified.yml').write_text('name: Unified\n')
+        (temp / 'Playbooks').mkdir()
+        (temp / 'Playbooks' / 'playbook-small.yml').write_text('id: small\n')
+        (temp / 'Playbooks' / 'playbook-large.yml').write_text('id: large\n' * 100)
+
+        assert calc_content_object_size(Integration(package / 'Sample.yml')) == 13 + 900 + 50
+        assert calc_content_object_size(Integration(temp / 'Integrations' / 'integration-unified.yml')) == 14
+        assert calc_content_object_size(Playbook(temp / 'Playbooks' / 'playbook-small.yml')) == 10
+
+
+def test_dump_common_server_python(mock_git):
+    """
+    Given
+    - Base pack CommonServerPython script.
+
+    When
+    - Dumping it to the artifacts.
+
+    Then
+    - Ensure CONTENT_RELEASE_VERSION is modified in the unified script artifact.
+    - Ensure the CommonServerPython.py source file is not modified.
+    """
+    from demisto_sdk.commands.common.content import Content
+    from demisto_sdk.commands.create_artifacts.content_artifacts_creator import (
+        ArtifactsManager, Script, create_dirs, dump_pack_conditionally)
+    with temp_dir() as temp:
+        content = temp / 'content'
+        script_dir = content / PACKS_DIR / 'Base' / 'Scripts' / 'CommonServerPython'
+        script_dir.mkdir(parents=True)
+        code_path = script_dir / 'CommonServerPython.py'
+        copyfile(COMMON_SERVER / 'CommonServerPython.py', code_path)
+        (script_dir / 'CommonServerPython.yml').write_text("commonfields:\n  id: CommonServerPython\n  version: -1\n"
+                                                           "name: CommonServerPython\nscript: '-'\ntype: python\n"
+                                                           "subtype: python3\nfromversion: 5.0.0\n")
+        Content.git().working_tree_dir = content
+        config = ArtifactsManager(artifacts_path=temp / 'artifacts',
+                                  content_version='6.0.0',
+                                  zip=False,
+                                  suffix='',
+                                  cpus=1,
+                                  packs=True)
+        create_dirs(artifact_manager=config)
+
+        dump_pack_conditionally(config, Script(script_dir / 'CommonServerPython.yml'))
+
+        unified_script = (config.content_packs_path / 'Base' / 'Scripts' / 'script-CommonServerPython.yml').read_text()
+        assert "CONTENT_RELEASE_VERSION = '6.0.0'" in unified_script
+        assert code_path.read_text() == (COMMON_SERVER / 'CommonServerPython.py').read_text()
+
+
+def test_plan_incremental_dump_api_module_change(mock_git, mocker):
+    """
+    Given
+    - Pack which its integration imports an API module, and a pack which does not.
+
+    When
+    - Planning the incremental dump after the API module code changed.
+
+    Then
+    - Ensure the importing pack is dumped, and the other pack artifacts are reused.
+    """
+    from demisto_sdk.commands.common.content import Content
+    from demisto_sdk.commands.create_artifacts.artifacts_manifest import \
+        ArtifactsManifest
+    from demisto_sdk.commands.create_artifacts.content_artifacts_creator import (
+        ArtifactsManager, plan_incremental_dump)
+    with temp_dir() as temp:
+        content = temp / 'content'
+        module_path = content / PACKS_DIR / 'ApiModules' / 'Scripts' / 'TestApiModule' / 'TestApiModule.py'
+        code_paths = {'Dependent': 'from TestApiModule import *  # noqa: E402\n', 'Independent': 'print(1)\n'}
+        for pack_name, code in code_paths.items():
+            code_path = content / PACKS_DIR / pack_name / 'Integrations' / pack_name / f'{pack_name}.py'
+            code_path.parent.mkdir(parents=True)
+            code_path.write_text(code)
+        module_path.parent.mkdir(parents=True)
+        module_path.write_text('API_MODULE_VERSION = 1\n')
+        Content.git().working_tree_dir = content
+        mocker.patch('demisto_sdk.commands.create_artifacts.content_artifacts_creator.logger', create=True)
+        config = ArtifactsManager(artifacts_path=temp / 'artifacts',
+                                  content_version='6.0.0',
+                                  zip=False,
+                                  suffix='',
+                                  cpus=1,
+                                  packs=True)
+        previous_manifest = ArtifactsManifest(config.artifacts_path, {})
+        plan_incremental_dump(config, previous_manifest)
+        module_path.write_text('API_MODULE_VERSION = 2\n')
+
+        units_to_dump = plan_incremental_dump(config, ArtifactsManifest(config.artifacts_path, {},
+                                                                        previous_manifest.units))
+
+        assert units_to_dump & {'Packs/Dependent', 'Packs/Independent'} == {'Packs/Dependent'}
@@ -2,16 +2,19 @@ from demisto_sdk.commands.common.update_id_set import re_create_id_set
 
 
 class IDSetCreator:
-    def __init__(self, output: str = '', print_logs: bool = True):
+    def __init__(self, output: str = '', print_logs: bool = True, use_cache: bool = True):
         """IDSetCreator
 
         Args:
             output (str, optional): The output path. Set to None to avoid creation of a file. '' means the default path.
              Defaults to 'Tests/id_set.json'.
             print_logs (bool, optional): Print log output. Defaults to True.
+            use_cache (bool, optional): Re-process only the content files which changed since the previous id set
+             creation. Defaults to True.
         """
         self.output = output
         self.print_logs = print_logs
+        self.use_cache = use_cache
 
     def create_id_set(self):
-        return re_create_id_set(id_set_path=self.output, print_logs=self.print_logs)
+        return re_create_id_set(id_set_path=self.output, print_logs=self.print_logs, use_cache=self.use_cache)
@@ -10,7 +10,8 @@ import pytest
 from demisto_sdk.commands.common.constants import FileType
 from demisto_sdk.commands.common.git_tools import git_path
 from demisto_sdk.commands.common.update_id_set import (
-    find_duplicates, get_classifier_data, get_fields_by_script_argument,
+    ID_SET_CACHE_FILE_NAME, find_duplicates, get_classifier_data,
+    get_duplicate_ids, get_fields_by_script_argument, get_file_content_hash,
     get_general_data, get_incident_fields_by_playbook_input,
     get_incident_type_data, get_indicator_type_data, get_layout_data,
     get_layoutscontainer_data, get_mapper_data, get_playbook_data,
@@ -18,6 +19,7 @@ from demisto_sdk.commands.common.update_id_set import (
     has_duplicate, process_general_items, process_incident_fields,
     process_integration, process_script, re_create_id_set)
 from demisto_sdk.commands.create_id_set.create_id_set import IDSetCreator
+from TestSuite.test_tools import ChangeCWD
 from TestSuite.utils import IsEqualFunctions
 
 TESTS_DIR = f'{git_path()}/demisto_sdk/tests'
@@ -69,6 +71,149 @@ class TestIDSetCreator:
         assert 'Mappers' in id_set.keys()
 
 
+class TestIDSetCache:
+    SCRIPT_YML = 'commonfields:\n  id: {id_}\nname: {name}\nscript: \'-\'\ntype: python\n'
+
+    def create_content(self, tmp_path):
+        scripts_dir = tmp_path / 'Packs' / 'CachePack' / 'Scripts'
+        scripts_dir.mkdir(parents=True)
+        (scripts_dir / 'script-first.yml').write_text(self.SCRIPT_YML.format(id_='first', name='first'))
+        (scripts_dir / 'script-second.yml').write_text(self.SCRIPT_YML.format(id_='second', name='second'))
+        (tmp_path / 'Tests').mkdir()
+        return scripts_dir
+
+    @staticmethod
+    def get_script_names(id_set):
+        return {list(script.keys())[0]: list(script.values())[0]['name'] for script in id_set['scripts']}
+
+    def test_re_create_id_set_with_cache(self, tmp_path, mocker):
+        """
+        Given
+            - A content repo with two scripts.
+        When
+            - Creating the id set, then re-creating it after modifying one of the scripts.
+        Then
+            - Ensure the cache file is created next to the id set.
+            - Ensure the unmodified script entry is taken from the cache and the modified one is re-processed.
+            - Ensure the cache is ignored when use_cache is False.
+        """
+        import demisto_sdk.commands.common.update_id_set as uis
+        mocker.patch.object(uis, 'cpu_count', return_value=1)
+        scripts_dir = self.create_content(tmp_path)
+        id_set_path = str(tmp_path / 'Tests' / 'id_set.json')
+        cache_path = tmp_path / 'Tests' / ID_SET_CACHE_FILE_NAME
+
+        with ChangeCWD(str(tmp_path)):
+            re_create_id_set(id_set_path, objects_to_create=['Scripts'], print_logs=False)
+            assert cache_path.exists()
+
+            # change the cached entry to make sure it is used instead of re-processing the file
+            cache = json.loads(cache_path.read_text())
+            first_script_path = os.path.join('Packs', 'CachePack', 'Scripts', 'script-first.yml')
+            cache['sections']['Scripts'][first_script_path]['result'][0]['first']['name'] = 'cached'
+            cache_path.write_text(json.dumps(cache))
+            (scripts_dir / 'script-second.yml').write_text(self.SCRIPT_YML.format(id_='second', name='modified'))
+
+            id_set = re_create_id_set(id_set_path, objects_to_create=['Scripts'], print_logs=False)
+            assert self.get_script_names(id_set) == {'first': 'cached', 'second': 'modified'}
+
+            id_set = re_create_id_set(id_set_path, objects_to_create=['Scripts'], print_logs=False, use_cache=False)
+            assert self.get_script_names(id_set) == {'first': 'first', 'second': 'modified'}
+
+    def test_re_create_id_set_with_cache_of_other_sections(self, tmp_path, mocker):
+        """
+        Given
+            - An id set cache of the Scripts and IncidentTypes sections.
+        When
+            - Re-creating only the Scripts section.
+        Then
+            - Ensure the cached IncidentTypes entries are kept in the cache.
+        """
+        import demisto_sdk.commands.common.update_id_set as uis
+        mocker.patch.object(uis, 'cpu_count', return_value=1)
+        self.create_content(tmp_path)
+        incident_types_dir = tmp_path / 'Packs' / 'CachePack' / 'IncidentTypes'
+        incident_types_dir.mkdir()
+        (incident_types_dir / 'incidenttype-Phishing.json').write_text(
+            json.dumps({'id': 'Phishing', 'name': 'Phishing', 'color': '#000000'}))
+        id_set_path = str(tmp_path / 'Tests' / 'id_set.json')
+        cache_path = tmp_path / 'Tests' / ID_SET_CACHE_FILE_NAME
+
+        with ChangeCWD(str(tmp_path)):
+            re_create_id_set(id_set_path, objects_to_create=['Scripts', 'IncidentTypes'], print_logs=False)
+            incident_types_cache = json.loads(cache_path.read_text())['sections']['IncidentTypes']
+            re_create_id_set(id_set_path, objects_to_create=['Scripts'], print_logs=False)
+
+            cache_sections = json.loads(cache_path.read_text())['sections']
+            assert cache_sections['IncidentTypes'] == incident_types_cache
+            assert len(cache_sections['Scripts']) == 2
+
+    def test_id_set_cache_of_other_sdk_version(self, tmp_path, mocker):
+        """
+        Given
+            - An id set cache saved by another demisto-sdk version.
+        When
+            - Loading the cache.
+        Then
+            - Ensure the cached entries are discarded.
+        """
+        import demisto_sdk.commands.common.update_id_set as uis
+        cache_path = str(tmp_path / ID_SET_CACHE_FILE_NAME)
+        mocker.patch.object(uis, 'get_demisto_sdk_version', return_value='1.0.0')
+        id_set_cache = uis.IDSetCache(cache_path)
+        id_set_cache.set('Scripts', 'script.yml', 'hash', [{'script': {}}])
+        id_set_cache.save()
+        assert uis.IDSetCache(cache_path).get('Scripts', 'script.yml', 'hash') == [{'script': {}}]
+
+        mocker.patch.object(uis, 'get_demisto_sdk_version', return_value='1.0.1')
+        assert uis.IDSetCache(cache_path).get('Scripts', 'script.yml', 'hash') is None
+
+    def test_get_file_content_hash_of_package(self, tmp_path):
+        """
+        Given
+            - A script package directory.
+        When
+            - Calculating its content hash before and after modifying the code file.
+        Then
+            - Ensure the hash changes.
+        """
+        (tmp_path / 'Script.yml').write_text(self.SCRIPT_YML.format(id_='script', name='script'))
+        (tmp_path / 'Script.py').write_text('print(1)')
+        first_hash = get_file_content_hash(str(tmp_path))
+
+        (tmp_path / 'Script.py').write_text('print(2)')
+        assert get_file_content_hash(str(tmp_path)) != first_hash
+
+
+class TestDependentSections:
+    def test_re_create_id_set_dependent_sections(self, tmp_path, mocker):
+        """
+        Given
+            - A pack with two incident types and an incident field associated to all the incident types.
+        When
+            - Creating the id set, where incident fields are dispatched once the incident types are extracted.
+        Then
+            - Ensure the incident field is associated to both incident types.
+        """
+        import demisto_sdk.commands.common.update_id_set as uis
+        mocker.patch.object(uis, 'cpu_count', return_value=1)
+        pack_dir = tmp_path / 'Packs' / 'FieldsPack'
+        (pack_dir / 'IncidentTypes').mkdir(parents=True)
+        (pack_dir / 'IncidentFields').mkdir()
+        for type_name in ('Phishing', 'Malware'):
+            (pack_dir / 'IncidentTypes' / f'incidenttype-{type_name}.json').write_text(
+                json.dumps({'id': type_name, 'name': type_name, 'color': '#000000'}))
+        (pack_dir / 'IncidentFields' / 'incidentfield-field.json').write_text(
+            json.dumps({'id': 'incident_field', 'name': 'field', 'cliName': 'field', 'associatedTypes': ['all']}))
+
+        with ChangeCWD(str(tmp_path)):
+            id_set = re_create_id_set(None, objects_to_create=['IncidentFields', 'IncidentTypes'], print_logs=False)
+
+        assert len(id_set['IncidentTypes']) == 2
+        incident_field = id_set['IncidentFields'][0]['incident_field']
+        assert sorted(incident_field['incident_types']) == ['Malware', 'Phishing']
+
+
 class TestDuplicates:
     MOCKED_DATA = [
         (
@@ -180,6 +325,22 @@ class TestDuplicates:
         result = has_duplicate(TestDuplicates.ID_SET, list_input, 'Layouts', False)
         assert list_output == result
 
+    @staticmethod
+    def test_get_duplicate_ids():
+        """
+        Given
+            - An id set section with several ids, where only some have items with overlapping versions.
+        When
+            - Getting the duplicate ids of the section.
+        Then
+            - Ensure only the ids with overlapping versions are returned.
+        """
+        section = TestDuplicates.MOCKED_DATA[1][0] + TestDuplicates.MOCKED_DATA[2][0]
+        section += [{f'unique_{i}': {'name': f'unique_{i}', 'file_path': str(i)}} for i in range(10000)]
+
+        assert get_duplicate_ids(section, print_logs=False) == ['Test3']
+        assert get_duplicate_ids(TestDuplicates.ID_SET, 'Layouts', False) == ['urlRep']
+
 
 class TestIntegrations:
     INTEGRATION_DATA = {
@@ -1,5 +1,3 @@
-import ast
-import io
 import json
 import logging
 import os
@@ -133,23 +131,14 @@ class Downloader:
         try:
             verify = (not self.insecure) if self.insecure else None  # set to None so demisto_client will use env var DEMISTO_VERIFY_SSL
             self.client = demisto_client.configure(verify_ssl=verify)
-            api_response: tuple = demisto_client.generic_request_func(self.client, '/content/bundle', 'GET')
-            body: bytes = ast.literal_eval(api_response[0])
-            io_bytes = io.BytesIO(body)
-            # Demisto's custom content file is of type tar.gz
-            tar = tarfile.open(fileobj=io_bytes, mode='r')
-
-            for member in tar.getmembers():
-                file_name: str = self.update_file_prefix(member.name.strip('/'))
-                file_path: str = os.path.join(self.custom_content_temp_dir, file_name)
-                with open(file_path, 'w') as file:
-                    extracted_file = tar.extractfile(member)
-                    # File might empty
-                    if extracted_file:
-                        string_to_write = extracted_file.read().decode('utf-8')
-                        file.write(string_to_write)
-                    else:
-                        raise FileNotFoundError(f'Could not extract files from tar file: {file_path}')
+            # Stream the response body instead of loading the whole bundle into memory
+            api_response: tuple = demisto_client.generic_request_func(self.client, '/content/bundle', 'GET',
+                                                                      _preload_content=False)
+            response = api_response[0]
+            try:
+                self.extract_custom_content(response)
+            finally:
+                response.release_conn()
 
             return True
 
@@ -168,6 +157,23 @@ class Downloader:
             print_color(f'Exception raised when fetching custom content:\n{e}', LOG_COLORS.NATIVE)
             return False
 
+    def extract_custom_content(self, bundle) -> None:
+        """
+        Extracts the custom content bundle into the temporary dir, member by member as it is read.
+        :param bundle: A file object of the custom content bundle
+        """
+        # Demisto's custom content file is of type tar.gz
+        with tarfile.open(fileobj=bundle, mode='r|gz') as tar:
+            for member in tar:
+                file_name: str = self.update_file_prefix(member.name.strip('/'))
+                file_path: str = os.path.join(self.custom_content_temp_dir, file_name)
+                extracted_file = tar.extractfile(member)
+                # File might empty
+                if not extracted_file:
+                    raise FileNotFoundError(f'Could not extract files from tar file: {file_path}')
+                with open(file_path, 'wb') as file:
+                    shutil.copyfileobj(extracted_file, file)
+
     def get_custom_content_objects(self) -> List[dict]:
         """
         Creates a list of all custom content objects
@@ -1,5 +1,9 @@
+import ast
 import os
 import shutil
+import threading
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, HTTPServer
 from pathlib import Path
 
 import pytest
@@ -9,6 +13,7 @@ from demisto_sdk.commands.common.constants import (
     INCIDENT_FIELDS_DIR, INCIDENT_TYPES_DIR, INDICATOR_FIELDS_DIR,
     INDICATOR_TYPES_DIR, INTEGRATIONS_DIR, LAYOUTS_DIR, PLAYBOOKS_DIR,
     REPORTS_DIR, SCRIPTS_DIR, TEST_PLAYBOOKS_DIR, WIDGETS_DIR)
+from demisto_sdk.commands.common.git_tools import git_path
 from demisto_sdk.commands.common.tools import (get_child_files, get_json,
                                                get_yaml)
 from demisto_sdk.commands.download.downloader import Downloader
@@ -16,6 +21,10 @@ from mock import patch
 from ruamel.yaml import YAML
 
 
+DEMISTO_API_RESPONSE_PATH = os.path.join(git_path(), 'demisto_sdk', 'tests', 'test_files', 'download_command',
+                                         'demisto_api_response')
+
+
 def ordered(obj):
     if isinstance(obj, dict):
         return sorted((k, ordered(v)) for k, v in obj.items())
@@ -25,6 +34,38 @@ def ordered(obj):
         return obj
 
 
+@contextmanager
+def serve_custom_content_bundle():
+    """
+    Serves the custom content bundle of the test files on /content/bundle of a local server, as Demisto does.
+    :return: The base url of the server
+    """
+    with open(DEMISTO_API_RESPONSE_PATH, 'r') as f:
+        bundle: bytes = ast.literal_eval(f.read())
+
+    class BundleHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path != '/content/bundle':
+                self.send_error(404)
+                return
+            self.send_response(200)
+            self.send_header('Content-Type', 'application/octet-stream')
+            self.send_header('Content-Length', str(len(bundle)))
+            self.end_headers()
+            self.wfile.write(bundle)
+
+        def log_message(self, format, *args):
+            pass
+
+    server = HTTPServer(('127.0.0.1', 0), BundleHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        yield f'http://127.0.0.1:{server.server_port}'
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
 class Environment:
     """
     Environment is class designed to spin up a virtual, temporary content repo and build all objects related to
@@ -278,6 +319,43 @@ class TestFlagHandlers:
             assert downloader.handle_list_files_flag()
 
 
+class TestFetchCustomContent:
+    def test_fetch_custom_content(self, monkeypatch):
+        """
+        GIVEN a Demisto instance serving the custom content bundle
+        WHEN fetching the custom content
+        THEN the bundle files should be extracted to the temporary dir as is
+        """
+        with serve_custom_content_bundle() as base_url:
+            monkeypatch.setenv('DEMISTO_BASE_URL', base_url)
+            monkeypatch.setenv('DEMISTO_API_KEY', 'API_KEY')
+            downloader = Downloader(output='', input='')
+            try:
+                assert downloader.fetch_custom_content()
+                custom_content_files = os.listdir(downloader.custom_content_temp_dir)
+                assert 'DummyPlaybook.yml' in custom_content_files
+                assert 'script-TestScript.yml' in custom_content_files
+                with open(os.path.join(downloader.custom_content_temp_dir, 'script-TestScript.yml'), 'rb') as f:
+                    assert b'name: TestScript' in f.read()
+            finally:
+                downloader.remove_traces()
+
+    def test_fetch_custom_content_server_error(self, monkeypatch):
+        """
+        GIVEN a Demisto instance which does not serve the custom content bundle
+        WHEN fetching the custom content
+        THEN the fetch should fail
+        """
+        with serve_custom_content_bundle() as base_url:
+            monkeypatch.setenv('DEMISTO_BASE_URL', f'{base_url}/missing')
+            monkeypatch.setenv('DEMISTO_API_KEY', 'API_KEY')
+            downloader = Downloader(output='', input='')
+            try:
+                assert not downloader.fetch_custom_content()
+            finally:
+                downloader.remove_traces()
+
+
 class TestBuildPackContent:
     def test_build_pack_content(self, tmp_path):
         env = Environment(tmp_path)
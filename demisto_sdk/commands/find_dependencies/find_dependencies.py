@@ -3,11 +3,12 @@ import json
 import os
 import sys
 from distutils.version import LooseVersion
+from typing import Dict, List, Set, Tuple, Union
 
 import click
 import networkx as nx
 from demisto_sdk.commands.common import constants
-from demisto_sdk.commands.common.tools import print_error
+from demisto_sdk.commands.common.tools import print_error, print_warning
 from demisto_sdk.commands.create_id_set.create_id_set import IDSetCreator
 
 MINIMUM_DEPENDENCY_VERSION = LooseVersion('6.0.0')
@@ -131,6 +132,100 @@ def update_pack_metadata_with_dependencies(pack_folder_name, first_level_depende
         pack_metadata_file.truncate()
 
 
+class IdSetSectionIndex:
+    """
+    Hash map lookups over an id set section, built in a single pass.
+    Items whose toversion is lower than MINIMUM_DEPENDENCY_VERSION are not indexed as dependency candidates.
+    """
+
+    def __init__(self, items_list: list):
+        self.items_by_pack: Dict[str, list] = {}
+        # packs of items which have a pack key, by item name
+        self.packs_by_name: Dict[str, set] = {}
+        # packs of items which belong to a pack, by item id and by item name
+        self.packs_by_id_with_pack: Dict[str, set] = {}
+        self.packs_by_name_with_pack: Dict[str, set] = {}
+        # packs of integrations which have a pack key, by command
+        self.packs_by_command: Dict[str, set] = {}
+
+        for item in items_list:
+            item_id, item_details = next(iter(item.items()))
+            pack = item_details.get('pack')
+            self.items_by_pack.setdefault(pack, []).append(item)
+
+            if LooseVersion(item_details.get('toversion', '99.99.99')) < MINIMUM_DEPENDENCY_VERSION:
+                continue
+
+            if 'pack' in item_details:
+                self.packs_by_name.setdefault(item_details.get('name', ''), set()).add(pack)
+                for command in item_details.get('commands', []):
+                    self.packs_by_command.setdefault(command, set()).add(pack)
+
+            if pack:
+                self.packs_by_id_with_pack.setdefault(item_id, set()).add(pack)
+                if 'name' in item_details:
+                    self.packs_by_name_with_pack.setdefault(item_details['name'], set()).add(pack)
+
+    def get_pack_items(self, pack_id: str) -> list:
+        return list(self.items_by_pack.get(pack_id, []))
+
+    def get_packs_by_names(self, items_names: List[str]) -> set:
+        return set().union(*(self.packs_by_name.get(item_name, set()) for item_name in items_names))
+
+    def get_packs_by_names_or_ids(self, items_names: List[str]) -> set:
+        packs: Set[str] = set()
+        for item_name in items_names:
+            # the item can be referenced by its name, or by its id which may have a prefix or suffix
+            for possible_id in (item_name, f'incident_{item_name}', f'indicator_{item_name}', f'{item_name}-mapper'):
+                packs.update(self.packs_by_id_with_pack.get(possible_id, set()))
+            packs.update(self.packs_by_name_with_pack.get(item_name, set()))
+
+        return packs
+
+    def get_packs_by_command(self, command: str) -> set:
+        return set(self.packs_by_command.get(command, set()))
+
+
+class IdSetIndex:
+    """
+    Indexed query layer over the id set, used by the dependencies calculation instead of scanning its sections.
+    A section index (or the index of several sections combined) is built on its first use.
+    """
+
+    def __init__(self, id_set: dict):
+        self.id_set = id_set
+        self._sections_indexes: Dict[Tuple[str, ...], IdSetSectionIndex] = {}
+
+    @staticmethod
+    def from_id_set(id_set: Union[dict, 'IdSetIndex']) -> 'IdSetIndex':
+        """
+        Args:
+            id_set (dict or IdSetIndex): id set json, or an already built index.
+
+        Returns:
+            IdSetIndex: index of the given id set.
+        """
+        return id_set if isinstance(id_set, IdSetIndex) else IdSetIndex(id_set)
+
+    def section(self, *sections_names: str) -> IdSetSectionIndex:
+        """
+        Args:
+            sections_names (str): id set sections names, several sections are indexed as one.
+
+        Returns:
+            IdSetSectionIndex: the sections index.
+        """
+        if sections_names not in self._sections_indexes:
+            items_list = sum((self.id_set.get(section_name, []) for section_name in sections_names), [])
+            self._sections_indexes[sections_names] = IdSetSectionIndex(items_list)
+
+        return self._sections_indexes[sections_names]
+
+
+def get_section_index(items_list: Union[list, IdSetSectionIndex]) -> IdSetSectionIndex:
+    return items_list if isinstance(items_list, IdSetSectionIndex) else IdSetSectionIndex(items_list)
+
+
 class PackDependencies:
     """
     Pack dependencies calculation class with relevant static methods.
@@ -143,12 +238,12 @@ class PackDependencies:
 
         Args:
             pack_id (str): pack id.
-            items_list (list): specific section of id set.
+            items_list (list or IdSetSectionIndex): specific section of id set.
 
         Returns:
             list: collection of content pack items.
         """
-        return list(filter(lambda s: next(iter(s.values())).get('pack') == pack_id, items_list))
+        return get_section_index(items_list).get_pack_items(pack_id)
 
     @staticmethod
     def _search_packs_by_items_names(items_names, items_list, exclude_ignored_dependencies=True):
@@ -157,7 +252,7 @@ class PackDependencies:
 
         Args:
             items_names (str or list): items names to search.
-            items_list (list): specific section of id set.
+            items_list (list or IdSetSectionIndex): specific section of id set.
             exclude_ignored_dependencies (bool): Determines whether to include unsupported dependencies or not.
 
         Returns:
@@ -167,12 +262,7 @@ class PackDependencies:
         if not isinstance(items_names, list):
             items_names = [items_names]
 
-        pack_names = set()
-        for item in items_list:
-            item_details = list(item.values())[0]
-            if item_details.get('name', '') in items_names and 'pack' in item_details and \
-                    LooseVersion(item_details.get('toversion', '99.99.99')) >= MINIMUM_DEPENDENCY_VERSION:
-                pack_names.add(item_details.get('pack'))
+        pack_names = get_section_index(items_list).get_packs_by_names(items_names)
 
         if not exclude_ignored_dependencies:
             return set(pack_names)
@@ -185,29 +275,21 @@ class PackDependencies:
 
         Args:
             items_names (str or list): items names to search.
-            items_list (list): specific section of id set.
+            items_list (list or IdSetSectionIndex): specific section of id set.
             exclude_ignored_dependencies (bool): Determines whether to include unsupported dependencies or not.
 
         Returns:
             set: found pack ids.
 
         """
-        packs = set()
         if not isinstance(items_names, list):
             items_names = [items_names]
 
-        for item_name in items_names:
-            item_possible_names = [item_name, f'incident_{item_name}', f'indicator_{item_name}', f'{item_name}-mapper']
-            for item_from_id_set in items_list:
-                machine_name = list(item_from_id_set.keys())[0]
-                item_details = list(item_from_id_set.values())[0]
-                if (machine_name in item_possible_names or item_name == item_details.get('name')) \
-                        and item_details.get('pack') \
-                        and LooseVersion(item_details.get('toversion', '99.99.99')) >= MINIMUM_DEPENDENCY_VERSION \
-                        and (item_details['pack'] not in constants.IGNORED_DEPENDENCY_CALCULATION or
-                             not exclude_ignored_dependencies):
-                    packs.add(item_details.get('pack'))
-        return packs
+        packs = get_section_index(items_list).get_packs_by_names_or_ids(items_names)
+
+        if not exclude_ignored_dependencies:
+            return packs
+        return {p for p in packs if p not in constants.IGNORED_DEPENDENCY_CALCULATION}
 
     @staticmethod
     def _search_packs_by_integration_command(command, id_set, exclude_ignored_dependencies=True):
@@ -216,18 +298,13 @@ class PackDependencies:
 
         Args:
             command (str): integration command.
-            id_set (dict): id set json.
+            id_set (dict or IdSetIndex): id set json.
             exclude_ignored_dependencies (bool): Determines whether to include unsupported dependencies or not.
 
         Returns:
             set: pack id without ignored packs.
         """
-        pack_names = set()
-        for item in id_set['integrations']:
-            item_details = list(item.values())[0]
-            if command in item_details.get('commands', []) and 'pack' in item_details and \
-                    LooseVersion(item_details.get('toversion', '99.99.99')) >= MINIMUM_DEPENDENCY_VERSION:
-                pack_names.add(item_details.get('pack'))
+        pack_names = IdSetIndex.from_id_set(id_set).section('integrations').get_packs_by_command(command)
 
         if not exclude_ignored_dependencies:
             return set(pack_names)
@@ -283,7 +360,7 @@ class PackDependencies:
 
         Args:
             pack_scripts (list): pack scripts collection.
-            id_set (dict): id set json.
+            id_set (dict or IdSetIndex): id set json, or its index.
             verbose_file (VerboseFile): path to dependency explanations file.
             exclude_ignored_dependencies (bool): Determines whether to include unsupported dependencies or not.
 
@@ -291,6 +368,7 @@ class PackDependencies:
             set: dependencies data that includes pack id and whether is mandatory or not.
 
         """
+        id_set_index = IdSetIndex.from_id_set(id_set)
         dependencies_packs = set()
         verbose_file.write('\n### Scripts')
 
@@ -307,7 +385,7 @@ class PackDependencies:
 
             for command in dependencies_commands:
                 # try to search dependency by scripts first
-                pack_name = PackDependencies._search_packs_by_items_names(command, id_set['scripts'],
+                pack_name = PackDependencies._search_packs_by_items_names(command, id_set_index.section('scripts'),
                                                                           exclude_ignored_dependencies)
 
                 if pack_name:  # found script dependency implementing pack name
@@ -317,7 +395,7 @@ class PackDependencies:
 
                 # try to search dependency by integration integration
                 pack_names = PackDependencies._search_packs_by_integration_command(
-                    command, id_set, exclude_ignored_dependencies)
+                    command, id_set_index, exclude_ignored_dependencies)
 
                 if pack_names:  # found integration dependency implementing pack name
                     pack_dependencies_data = PackDependencies._detect_generic_commands_dependencies(pack_names)
@@ -340,7 +418,8 @@ class PackDependencies:
         Args:
             implementing_objects (list): playbook object collection.
             skippable_tasks (set): playbook skippable tasks.
-            id_set_section (list): id set section corresponds to implementing_objects (scripts or playbooks).
+            id_set_section (list or IdSetSectionIndex): id set section corresponds to implementing_objects
+                (scripts or playbooks).
             exclude_ignored_dependencies (bool): Determines whether to include unsupported dependencies or not.
 
         Returns:
@@ -372,7 +451,7 @@ class PackDependencies:
 
         Args:
             pack_playbooks (list): collection of pack playbooks data.
-            id_set (dict): id set json.
+            id_set (dict or IdSetIndex): id set json, or its index.
             verbose_file (VerboseFile): path to dependency explanations file.
             exclude_ignored_dependencies (bool): Determines whether to include unsupported dependencies or not.
 
@@ -380,6 +459,7 @@ class PackDependencies:
             set: dependencies data that includes pack id and whether is mandatory or not.
 
         """
+        id_set_index = IdSetIndex.from_id_set(id_set)
         dependencies_packs = set()
         verbose_file.write('\n### Playbooks')
 
@@ -395,10 +475,10 @@ class PackDependencies:
             for command, integration_name in implementing_commands_and_integrations.items():
                 if integration_name:
                     packs_found_from_integration = PackDependencies._search_packs_by_items_names(
-                        integration_name, id_set['integrations'], exclude_ignored_dependencies)
+                        integration_name, id_set_index.section('integrations'), exclude_ignored_dependencies)
                 else:
                     packs_found_from_integration = PackDependencies._search_packs_by_integration_command(
-                        command, id_set, exclude_ignored_dependencies)
+                        command, id_set_index, exclude_ignored_dependencies)
 
                 if packs_found_from_integration:
                     if command in skippable_tasks:
@@ -412,7 +492,7 @@ class PackDependencies:
             playbook_dependencies.update(PackDependencies._differentiate_playbook_implementing_objects(
                 playbook_data.get('implementing_scripts', []),
                 skippable_tasks,
-                id_set['scripts'],
+                id_set_index.section('scripts'),
                 exclude_ignored_dependencies
             ))
 
@@ -420,14 +500,14 @@ class PackDependencies:
             playbook_dependencies.update(PackDependencies._differentiate_playbook_implementing_objects(
                 playbook_data.get('implementing_playbooks', []),
                 skippable_tasks,
-                id_set['playbooks'],
+                id_set_index.section('playbooks'),
                 exclude_ignored_dependencies
             ))
 
             # ---- incident fields packs ----
             incident_fields = playbook_data.get('incident_fields', [])
             packs_found_from_incident_fields = PackDependencies._search_packs_by_items_names_or_ids(
-                incident_fields, id_set['IncidentFields'], exclude_ignored_dependencies)
+                incident_fields, id_set_index.section('IncidentFields'), exclude_ignored_dependencies)
             if packs_found_from_incident_fields:
                 pack_dependencies_data = PackDependencies._label_as_mandatory(packs_found_from_incident_fields)
                 playbook_dependencies.update(pack_dependencies_data)
@@ -435,7 +515,7 @@ class PackDependencies:
             # ---- indicator fields packs ----
             indicator_fields = playbook_data.get('indicator_fields', [])
             packs_found_from_indicator_fields = PackDependencies._search_packs_by_items_names_or_ids(
-                indicator_fields, id_set['IndicatorFields'], exclude_ignored_dependencies)
+                indicator_fields, id_set_index.section('IndicatorFields'), exclude_ignored_dependencies)
             if packs_found_from_indicator_fields:
                 pack_dependencies_data = PackDependencies._label_as_mandatory(packs_found_from_indicator_fields)
                 playbook_dependencies.update(pack_dependencies_data)
@@ -457,7 +537,7 @@ class PackDependencies:
 
         Args:
             pack_layouts (list): collection of pack playbooks data.
-            id_set (dict): id set json.
+            id_set (dict or IdSetIndex): id set json, or its index.
             verbose_file (VerboseFile): path to dependency explanations file.
             exclude_ignored_dependencies (bool): Determines whether to include unsupported dependencies or not.
 
@@ -465,6 +545,7 @@ class PackDependencies:
             set: dependencies data that includes pack id and whether is mandatory or not.
 
         """
+        id_set_index = IdSetIndex.from_id_set(id_set)
         dependencies_packs = set()
         verbose_file.write('\n### Layouts')
 
@@ -474,7 +555,7 @@ class PackDependencies:
 
             related_incident_and_indicator_types = layout_data.get('incident_and_indicator_types', [])
             packs_found_from_incident_indicator_types = PackDependencies._search_packs_by_items_names(
-                related_incident_and_indicator_types, id_set['IncidentTypes'] + id_set['IndicatorTypes'],
+                related_incident_and_indicator_types, id_set_index.section('IncidentTypes', 'IndicatorTypes'),
                 exclude_ignored_dependencies)
 
             if packs_found_from_incident_indicator_types:
@@ -484,7 +565,7 @@ class PackDependencies:
 
             related_incident_and_indicator_fields = layout_data.get('incident_and_indicator_fields', [])
             packs_found_from_incident_indicator_fields = PackDependencies._search_packs_by_items_names_or_ids(
-                related_incident_and_indicator_fields, id_set['IncidentFields'] + id_set['IndicatorFields'],
+                related_incident_and_indicator_fields, id_set_index.section('IncidentFields', 'IndicatorFields'),
                 exclude_ignored_dependencies)
 
             if packs_found_from_incident_indicator_fields:
@@ -510,7 +591,7 @@ class PackDependencies:
 
         Args:
             pack_incidents_fields (list): collection of pack incidents fields data.
-            id_set (dict): id set json.
+            id_set (dict or IdSetIndex): id set json, or its index.
             verbose_file (VerboseFile): path to dependency explanations file.
             exclude_ignored_dependencies (bool): Determines whether to include unsupported dependencies or not.
 
@@ -518,6 +599,7 @@ class PackDependencies:
             set: dependencies data that includes pack id and whether is mandatory or not.
 
         """
+        id_set_index = IdSetIndex.from_id_set(id_set)
         dependencies_packs = set()
         verbose_file.write('\n### Incident Fields')
 
@@ -536,7 +618,7 @@ class PackDependencies:
 
             related_scripts = incident_field_data.get('scripts', [])
             packs_found_from_scripts = PackDependencies._search_packs_by_items_names(
-                related_scripts, id_set['scripts'], exclude_ignored_dependencies)
+                related_scripts, id_set_index.section('scripts'), exclude_ignored_dependencies)
 
             if packs_found_from_scripts:
                 pack_dependencies_data = PackDependencies. \
@@ -561,7 +643,7 @@ class PackDependencies:
 
         Args:
             pack_indicators_types (list): collection of pack indicators types data.
-            id_set (dict): id set json.
+            id_set (dict or IdSetIndex): id set json, or its index.
             verbose_file (VerboseFile): path to dependency explanations file.
             exclude_ignored_dependencies (bool): Determines whether to include unsupported dependencies or not.
 
@@ -569,6 +651,7 @@ class PackDependencies:
             set: dependencies data that includes pack id and whether is mandatory or not.
 
         """
+        id_set_index = IdSetIndex.from_id_set(id_set)
         dependencies_packs = set()
         verbose_file.write('\n### Indicator Types')
 
@@ -578,7 +661,7 @@ class PackDependencies:
 
             related_integrations = indicator_type_data.get('integrations', [])
             packs_found_from_integrations = PackDependencies._search_packs_by_items_names(
-                related_integrations, id_set['integrations'], exclude_ignored_dependencies)
+                related_integrations, id_set_index.section('integrations'), exclude_ignored_dependencies)
 
             if packs_found_from_integrations:
                 pack_dependencies_data = PackDependencies. \
@@ -587,7 +670,7 @@ class PackDependencies:
 
             related_scripts = indicator_type_data.get('scripts', [])
             packs_found_from_scripts = PackDependencies._search_packs_by_items_names(
-                related_scripts, id_set['scripts'], exclude_ignored_dependencies)
+                related_scripts, id_set_index.section('scripts'), exclude_ignored_dependencies)
 
             if packs_found_from_scripts:
                 pack_dependencies_data = PackDependencies. \
@@ -610,12 +693,13 @@ class PackDependencies:
         Collects integrations dependencies.
         Args:
             pack_integrations (list): collection of pack integrations data.
-            id_set (dict): id set json.
+            id_set (dict or IdSetIndex): id set json, or its index.
             verbose_file (VerboseFile): path to dependency explanations file.
 
         Returns:
             set: dependencies data that includes pack id and whether is mandatory or not.
         """
+        id_set_index = IdSetIndex.from_id_set(id_set)
         dependencies_packs = set()
         verbose_file.write('\n### Integrations')
 
@@ -625,7 +709,7 @@ class PackDependencies:
 
             related_classifiers = integration_data.get('classifiers', [])
             packs_found_from_classifiers = PackDependencies._search_packs_by_items_names_or_ids(
-                related_classifiers, id_set['Classifiers'], exclude_ignored_dependencies)
+                related_classifiers, id_set_index.section('Classifiers'), exclude_ignored_dependencies)
 
             if packs_found_from_classifiers:
                 pack_dependencies_data = PackDependencies. \
@@ -634,7 +718,7 @@ class PackDependencies:
 
             related_mappers = integration_data.get('mappers', [])
             packs_found_from_mappers = PackDependencies._search_packs_by_items_names_or_ids(
-                related_mappers, id_set['Mappers'], exclude_ignored_dependencies)
+                related_mappers, id_set_index.section('Mappers'), exclude_ignored_dependencies)
 
             if packs_found_from_mappers:
                 pack_dependencies_data = PackDependencies. \
@@ -643,7 +727,7 @@ class PackDependencies:
 
             related_incident_types = integration_data.get('incident_types', [])
             packs_found_from_incident_types = PackDependencies._search_packs_by_items_names(
-                related_incident_types, id_set['IncidentTypes'], exclude_ignored_dependencies)
+                related_incident_types, id_set_index.section('IncidentTypes'), exclude_ignored_dependencies)
 
             if packs_found_from_incident_types:
                 pack_dependencies_data = PackDependencies. \
@@ -675,7 +759,7 @@ class PackDependencies:
 
         Args:
             pack_incidents_types (list): collection of pack incidents types data.
-            id_set (dict): id set json.
+            id_set (dict or IdSetIndex): id set json, or its index.
             verbose_file (VerboseFile): path to dependency explanations file.
             exclude_ignored_dependencies (bool): Determines whether to include unsupported dependencies or not.
 
@@ -683,6 +767,7 @@ class PackDependencies:
             set: dependencies data that includes pack id and whether is mandatory or not.
 
         """
+        id_set_index = IdSetIndex.from_id_set(id_set)
         dependencies_packs = set()
         verbose_file.write('\n### Incident Types')
 
@@ -692,7 +777,7 @@ class PackDependencies:
 
             related_playbooks = incident_type_data.get('playbooks', [])
             packs_found_from_playbooks = PackDependencies._search_packs_by_items_names(
-                related_playbooks, id_set['playbooks'], exclude_ignored_dependencies)
+                related_playbooks, id_set_index.section('playbooks'), exclude_ignored_dependencies)
 
             if packs_found_from_playbooks:
                 pack_dependencies_data = PackDependencies. \
@@ -701,7 +786,7 @@ class PackDependencies:
 
             related_scripts = incident_type_data.get('scripts', [])
             packs_found_from_scripts = PackDependencies._search_packs_by_items_names(
-                related_scripts, id_set['scripts'], exclude_ignored_dependencies)
+                related_scripts, id_set_index.section('scripts'), exclude_ignored_dependencies)
 
             if packs_found_from_scripts:
                 pack_dependencies_data = PackDependencies. \
@@ -725,7 +810,7 @@ class PackDependencies:
 
         Args:
             pack_classifiers (list): collection of pack classifiers data.
-            id_set (dict): id set json.
+            id_set (dict or IdSetIndex): id set json, or its index.
             verbose_file (VerboseFile): path to dependency explanations file.
             exclude_ignored_dependencies (bool): Determines whether to include unsupported dependencies or not.
 
@@ -733,6 +818,7 @@ class PackDependencies:
             set: dependencies data that includes pack id and whether is mandatory or not.
 
         """
+        id_set_index = IdSetIndex.from_id_set(id_set)
         dependencies_packs = set()
         verbose_file.write('\n### Classifiers')
 
@@ -742,7 +828,7 @@ class PackDependencies:
 
             related_incident_types = classifier_data.get('incident_types', [])
             packs_found_from_incident_types = PackDependencies._search_packs_by_items_names(
-                related_incident_types, id_set['IncidentTypes'], exclude_ignored_dependencies)
+                related_incident_types, id_set_index.section('IncidentTypes'), exclude_ignored_dependencies)
 
             if packs_found_from_incident_types:
                 pack_dependencies_data = PackDependencies. \
@@ -766,7 +852,7 @@ class PackDependencies:
 
         Args:
             pack_mappers (list): collection of pack mappers data.
-            id_set (dict): id set json.
+            id_set (dict or IdSetIndex): id set json, or its index.
             verbose_file (VerboseFile): path to dependency explanations file.
             exclude_ignored_dependencies (bool): Determines whether to include unsupported dependencies or not.
 
@@ -774,6 +860,7 @@ class PackDependencies:
             set: dependencies data that includes pack id and whether is mandatory or not.
 
         """
+        id_set_index = IdSetIndex.from_id_set(id_set)
         dependencies_packs = set()
         verbose_file.write('\n### Mappers')
 
@@ -783,7 +870,7 @@ class PackDependencies:
 
             related_incident_types = mapper_data.get('incident_types', [])
             packs_found_from_incident_types = PackDependencies._search_packs_by_items_names(
-                related_incident_types, id_set['IncidentTypes'], exclude_ignored_dependencies)
+                related_incident_types, id_set_index.section('IncidentTypes'), exclude_ignored_dependencies)
 
             if packs_found_from_incident_types:
                 pack_dependencies_data = PackDependencies. \
@@ -792,7 +879,7 @@ class PackDependencies:
 
             related_incident_fields = mapper_data.get('incident_fields', [])
             packs_found_from_incident_fields = PackDependencies._search_packs_by_items_names_or_ids(
-                related_incident_fields, id_set['IncidentFields'], exclude_ignored_dependencies)
+                related_incident_fields, id_set_index.section('IncidentFields'), exclude_ignored_dependencies)
 
             if packs_found_from_incident_fields:
                 pack_dependencies_data = PackDependencies. \
@@ -816,7 +903,7 @@ class PackDependencies:
 
         Args:
             pack_widgets (list): collection of pack widget data.
-            id_set (dict): id set json.
+            id_set (dict or IdSetIndex): id set json, or its index.
             verbose_file (VerboseFile): path to dependency explanations file.
             exclude_ignored_dependencies (bool): Determines whether to include unsupported dependencies or not.
 
@@ -824,6 +911,7 @@ class PackDependencies:
             set: dependencies data that includes pack id and whether is mandatory or not.
 
         """
+        id_set_index = IdSetIndex.from_id_set(id_set)
         dependencies_packs = set()
         verbose_file.write('\n### Widgets')
 
@@ -833,7 +921,7 @@ class PackDependencies:
 
             related_scripts = widget_data.get('scripts', [])
             packs_found_from_scripts = PackDependencies._search_packs_by_items_names(
-                related_scripts, id_set['scripts'], exclude_ignored_dependencies)
+                related_scripts, id_set_index.section('scripts'), exclude_ignored_dependencies)
 
             if packs_found_from_scripts:
                 pack_dependencies_data = PackDependencies. \
@@ -857,23 +945,24 @@ class PackDependencies:
 
         Args:
             pack_id (str): pack id, currently pack folder name is in use.
-            id_set (dict): id set json.
+            id_set (dict or IdSetIndex): id set json, or its index.
 
         Returns:
             list, list: pack scripts and playbooks data.
         """
+        id_set_index = IdSetIndex.from_id_set(id_set)
         pack_items = dict()
 
-        pack_items['scripts'] = PackDependencies._search_for_pack_items(pack_id, id_set['scripts'])
-        pack_items['playbooks'] = PackDependencies._search_for_pack_items(pack_id, id_set['playbooks'])
-        pack_items['layouts'] = PackDependencies._search_for_pack_items(pack_id, id_set['Layouts'])
-        pack_items['incidents_fields'] = PackDependencies._search_for_pack_items(pack_id, id_set['IncidentFields'])
-        pack_items['indicators_types'] = PackDependencies._search_for_pack_items(pack_id, id_set['IndicatorTypes'])
-        pack_items['integrations'] = PackDependencies._search_for_pack_items(pack_id, id_set['integrations'])
-        pack_items['incidents_types'] = PackDependencies._search_for_pack_items(pack_id, id_set['IncidentTypes'])
-        pack_items['classifiers'] = PackDependencies._search_for_pack_items(pack_id, id_set['Classifiers'])
-        pack_items['mappers'] = PackDependencies._search_for_pack_items(pack_id, id_set['Mappers'])
-        pack_items['widgets'] = PackDependencies._search_for_pack_items(pack_id, id_set['Widgets'])
+        pack_items['scripts'] = PackDependencies._search_for_pack_items(pack_id, id_set_index.section('scripts'))
+        pack_items['playbooks'] = PackDependencies._search_for_pack_items(pack_id, id_set_index.section('playbooks'))
+        pack_items['layouts'] = PackDependencies._search_for_pack_items(pack_id, id_set_index.section('Layouts'))
+        pack_items['incidents_fields'] = PackDependencies._search_for_pack_items(pack_id, id_set_index.section('IncidentFields'))
+        pack_items['indicators_types'] = PackDependencies._search_for_pack_items(pack_id, id_set_index.section('IndicatorTypes'))
+        pack_items['integrations'] = PackDependencies._search_for_pack_items(pack_id, id_set_index.section('integrations'))
+        pack_items['incidents_types'] = PackDependencies._search_for_pack_items(pack_id, id_set_index.section('IncidentTypes'))
+        pack_items['classifiers'] = PackDependencies._search_for_pack_items(pack_id, id_set_index.section('Classifiers'))
+        pack_items['mappers'] = PackDependencies._search_for_pack_items(pack_id, id_set_index.section('Mappers'))
+        pack_items['widgets'] = PackDependencies._search_for_pack_items(pack_id, id_set_index.section('Widgets'))
 
         if not sum(pack_items.values(), []):
             raise ValueError(f"Couldn't find any items for pack '{pack_id}'. make sure your spelling is correct.")
@@ -887,7 +976,7 @@ class PackDependencies:
 
         Args:
             pack_id (str): pack id, currently pack folder name is in use.
-            id_set (dict): id set json.
+            id_set (dict or IdSetIndex): id set json, or its index.
             verbose_file (VerboseFile): path to dependency explanations file.
             exclude_ignored_dependencies (bool): Determines whether to include unsupported dependencies or not.
 
@@ -895,6 +984,7 @@ class PackDependencies:
             set: dependencies data that includes pack id and whether is mandatory or not.
         """
         verbose_file.write(f'\n\n# Pack ID: {pack_id}')
+        id_set = IdSetIndex.from_id_set(id_set)
         pack_items = PackDependencies._collect_pack_items(pack_id, id_set)
 
         scripts_dependencies = PackDependencies._collect_scripts_dependencies(
@@ -973,13 +1063,14 @@ class PackDependencies:
 
         Args:
             pack_id (str): pack id, currently pack folder name is in use.
-            id_set (dict): id set json.
+            id_set (dict or IdSetIndex): id set json, or its index.
             verbose_file (VerboseFile): path to dependency explanations file.
             exclude_ignored_dependencies (bool): Determines whether to include unsupported dependencies or not.
 
         Returns:
             DiGraph: all level dependencies of given pack.
         """
+        id_set = IdSetIndex.from_id_set(id_set)
         graph = nx.DiGraph()
         graph.add_node(pack_id)  # add pack id as root of the direct graph
         found_new_dependencies = True
@@ -1002,6 +1093,87 @@ class PackDependencies:
 
         return graph
 
+    @staticmethod
+    def build_all_packs_dependency_graph(pack_ids, id_set, verbose_file, exclude_ignored_dependencies=True):
+        """
+        Builds a single dependency graph of the given packs and of all the packs they depend on.
+        The first level dependencies of each pack are calculated only once.
+
+        Args:
+            pack_ids (list): packs ids, currently pack folder names are in use.
+            id_set (dict or IdSetIndex): id set json, or its index.
+            verbose_file (VerboseFile): path to dependency explanations file.
+            exclude_ignored_dependencies (bool): Determines whether to include unsupported dependencies or not.
+
+        Returns:
+            DiGraph: packs graph, an edge from a pack to its first level dependency is labeled with `mandatory`.
+        """
+        id_set = IdSetIndex.from_id_set(id_set)
+        graph = nx.DiGraph()
+        packs_to_process = list(pack_ids)
+        processed_packs = set()
+
+        while packs_to_process:
+            pack_id = packs_to_process.pop(0)
+            if pack_id in processed_packs:
+                continue
+            processed_packs.add(pack_id)
+            graph.add_node(pack_id)
+
+            try:
+                pack_dependencies = PackDependencies._find_pack_dependencies(
+                    pack_id, id_set, verbose_file=verbose_file, exclude_ignored_dependencies=exclude_ignored_dependencies)
+            except ValueError as exp:
+                print_warning(str(exp))
+                continue
+
+            for dependency_name, is_mandatory in pack_dependencies:
+                # the first found label of a dependency is kept, the same as in build_dependency_graph
+                if dependency_name != pack_id and not graph.has_edge(pack_id, dependency_name):
+                    graph.add_edge(pack_id, dependency_name, mandatory=is_mandatory)
+                    packs_to_process.append(dependency_name)
+
+        return graph
+
+    @staticmethod
+    def get_pack_dependency_graph(packs_graph, pack_id):
+        """
+        Derives the all levels dependency graph of a pack from the packs graph.
+
+        Args:
+            packs_graph (DiGraph): packs graph, as built by build_all_packs_dependency_graph.
+            pack_id (str): pack id, currently pack folder name is in use.
+
+        Returns:
+            DiGraph: all level dependencies of given pack, the same as built by build_dependency_graph.
+        """
+        graph = nx.DiGraph()
+        graph.add_node(pack_id)  # add pack id as root of the direct graph
+
+        for leaf, dependency_name in nx.bfs_edges(packs_graph, pack_id):
+            if dependency_name not in graph.nodes():
+                graph.add_node(dependency_name, mandatory=packs_graph.edges[leaf, dependency_name]['mandatory'])
+                graph.add_edge(leaf, dependency_name)
+
+        return graph
+
+    @staticmethod
+    def _load_id_set(id_set_path=''):
+        """
+        Loads the id set, or creates it if the id set path does not exist.
+
+        Args:
+            id_set_path (str): id set json.
+
+        Returns:
+            dict: id set json.
+        """
+        if not id_set_path or not os.path.isfile(id_set_path):
+            return IDSetCreator(print_logs=False).create_id_set()
+
+        with open(id_set_path, 'r') as id_set_file:
+            return json.load(id_set_file)
+
     @staticmethod
     def find_dependencies(pack_name, id_set_path='', exclude_ignored_dependencies=True, update_pack_metadata=True,
                           silent_mode=False, debug_file_path=''):
@@ -1020,11 +1192,7 @@ class PackDependencies:
             Dict: first level dependencies of a given pack.
 
         """
-        if not id_set_path or not os.path.isfile(id_set_path):
-            id_set = IDSetCreator(print_logs=False).create_id_set()
-        else:
-            with open(id_set_path, 'r') as id_set_file:
-                id_set = json.load(id_set_file)
+        id_set = PackDependencies._load_id_set(id_set_path)
 
         with VerboseFile(debug_file_path) as verbose_file:
             dependency_graph = PackDependencies.build_dependency_graph(
@@ -1039,3 +1207,44 @@ class PackDependencies:
             dependency_result = json.dumps(first_level_dependencies, indent=4)
             click.echo(click.style(dependency_result, bold=True))
         return first_level_dependencies
+
+    @staticmethod
+    def find_dependencies_for_all_packs(id_set_path='', exclude_ignored_dependencies=True, update_pack_metadata=True,
+                                        silent_mode=False, debug_file_path=''):
+        """
+        Main function for dependencies search and pack metadata update of all the packs in the content repo.
+        The first level dependencies of each pack are calculated once, and each pack dependencies are derived
+        from a single graph of all the packs.
+
+        Args:
+            id_set_path (str): id set json.
+            debug_file_path (str): path to dependency explanations file.
+            silent_mode (bool): Determines whether to echo the dependencies or not.
+            update_pack_metadata (bool): Determines whether to update to pack metadata or not.
+            exclude_ignored_dependencies (bool): Determines whether to include unsupported dependencies or not.
+
+        Returns:
+            Dict: pack id to the first level dependencies of the pack.
+
+        """
+        id_set = PackDependencies._load_id_set(id_set_path)
+        pack_metadata_paths = glob.glob(os.path.join(constants.PACKS_DIR, '*', constants.PACKS_PACK_META_FILE_NAME))
+        pack_names = sorted(os.path.basename(os.path.dirname(path)) for path in pack_metadata_paths)
+
+        with VerboseFile(debug_file_path) as verbose_file:
+            packs_graph = PackDependencies.build_all_packs_dependency_graph(
+                pack_ids=pack_names, id_set=id_set, verbose_file=verbose_file,
+                exclude_ignored_dependencies=exclude_ignored_dependencies)
+
+        all_packs_dependencies = {}
+        for pack_name in pack_names:
+            dependency_graph = PackDependencies.get_pack_dependency_graph(packs_graph, pack_name)
+            first_level_dependencies, _ = parse_for_pack_metadata(dependency_graph, pack_name)
+            if update_pack_metadata:
+                update_pack_metadata_with_dependencies(pack_name, first_level_dependencies)
+            if not silent_mode:
+                click.echo(click.style(f"Found dependencies result for {pack_name} pack:", bold=True))
+                click.echo(click.style(json.dumps(first_level_dependencies, indent=4), bold=True))
+            all_packs_dependencies[pack_name] = first_level_dependencies
+
+        return all_packs_dependencies
@@ -4,7 +4,7 @@ import os
 import pytest
 from demisto_sdk.commands.common.git_tools import git_path
 from demisto_sdk.commands.find_dependencies.find_dependencies import (
-    PackDependencies, VerboseFile)
+    IdSetIndex, PackDependencies, VerboseFile)
 from TestSuite.utils import IsEqualFunctions
 
 
@@ -1118,6 +1118,70 @@ def test_search_packs_by_items_names_or_ids(item_names, section_name, expected_r
     assert IsEqualFunctions.is_sets_equal(found_packs, expected_result)
 
 
+class TestIdSetIndex:
+    def test_section_index_is_built_once(self, id_set):
+        """
+        Given
+            - An id set index.
+        When
+            - Querying the same section, and the same combination of sections, twice.
+        Then
+            - Ensure the section indexes are reused.
+        """
+        id_set_index = IdSetIndex(id_set)
+
+        assert id_set_index.section('scripts') is id_set_index.section('scripts')
+        assert id_set_index.section('IncidentFields', 'IndicatorFields') is \
+            id_set_index.section('IncidentFields', 'IndicatorFields')
+        assert IdSetIndex.from_id_set(id_set_index) is id_set_index
+
+    @pytest.mark.parametrize('item_names, section_name, expected_result', SEARCH_PACKS_INPUT)
+    def test_search_packs_by_items_names_or_ids_with_index(self, item_names, section_name, expected_result, id_set):
+        """
+        Given
+            - Items names or ids and an id set section index.
+        When
+            - Searching for the packs of the items.
+        Then
+            - Ensure the same packs are found as when searching the id set section.
+        """
+        section_index = IdSetIndex(id_set).section(section_name)
+        found_packs = PackDependencies._search_packs_by_items_names_or_ids(item_names, section_index)
+
+        assert IsEqualFunctions.is_sets_equal(found_packs, expected_result)
+
+    def test_search_packs_by_integration_command_filter_toversion(self):
+        """
+        Given
+            - Two integrations implementing the same command, one of them with toversion lower than 6.0.0.
+        When
+            - Searching for the packs implementing the command.
+        Then
+            - Ensure only the pack of the integration supported in 6.0.0 and above is found.
+        """
+        id_set = {'integrations': [
+            {'Old': {'name': 'Old', 'commands': ['ip'], 'pack': 'OldPack', 'toversion': '5.9.9'}},
+            {'New': {'name': 'New', 'commands': ['ip'], 'pack': 'NewPack'}},
+        ]}
+
+        assert PackDependencies._search_packs_by_integration_command('ip', IdSetIndex(id_set)) == {'NewPack'}
+
+    @pytest.mark.parametrize("pack_id", ["CalculateTimeDifference", "Expanse", "HelloWorld"])
+    def test_find_pack_dependencies_with_index(self, pack_id, id_set):
+        """
+        Given
+            - A pack id.
+        When
+            - Finding the pack dependencies using the id set and using an index of the id set.
+        Then
+            - Ensure the same dependencies are found.
+        """
+        found_result = PackDependencies._find_pack_dependencies(pack_id, id_set, VerboseFile())
+        found_result_with_index = PackDependencies._find_pack_dependencies(pack_id, IdSetIndex(id_set), VerboseFile())
+
+        assert found_result == found_result_with_index
+
+
 class TestDependencyGraph:
     def test_build_dependency_graph(self, id_set):
         pack_name = "ImpossibleTraveler"
@@ -1153,3 +1217,28 @@ class TestDependencyGraph:
         assert root_of_graph == pack_name
         assert len(pack_dependencies) > 0
         assert 'NonSupported' not in pack_dependencies
+
+    @pytest.mark.parametrize('pack_name', ['ImpossibleTraveler', 'Expanse', 'HelloWorld'])
+    def test_get_pack_dependency_graph_from_all_packs_graph(self, pack_name, id_set):
+        """
+        Given
+            - A dependency graph of all the packs in the id set.
+        When
+            - Extracting the dependency graph of a single pack from it.
+        Then
+            - Ensure the extracted graph is the same as the one built for the pack alone.
+        """
+        pack_ids = {item['pack'] for section in id_set.values() for entry in section for item in entry.values()
+                    if isinstance(item, dict) and item.get('pack')}
+        all_packs_graph = PackDependencies.build_all_packs_dependency_graph(pack_ids=pack_ids,
+                                                                            id_set=id_set,
+                                                                            verbose_file=VerboseFile(),
+                                                                            )
+        found_graph = PackDependencies.get_pack_dependency_graph(all_packs_graph, pack_name)
+        expected_graph = PackDependencies.build_dependency_graph(pack_id=pack_name,
+                                                                 id_set=id_set,
+                                                                 verbose_file=VerboseFile(),
+                                                                 )
+
+        assert set(found_graph.nodes) == set(expected_graph.nodes)
+        assert set(found_graph.edges) == set(expected_graph.edges)
@@ -4,7 +4,6 @@ from copy import deepcopy
 from typing import Set, Union
 
 import click
-import yaml
 from demisto_sdk.commands.common.constants import FileType
 from demisto_sdk.commands.common.hook_validations.structure import \
     StructureValidator
@@ -12,7 +11,7 @@ from demisto_sdk.commands.common.tools import (LOG_COLORS, find_type,
                                                get_dict_from_file,
                                                get_remote_file,
                                                is_file_from_content_repo,
-                                               print_color)
+                                               print_color, yaml_safe_load)
 from demisto_sdk.commands.format.format_constants import (
     DEFAULT_VERSION, ERROR_RETURN_CODE, NEW_FILE_DEFAULT_5_FROMVERSION,
     OLD_FILE_DEFAULT_1_FROMVERSION, SKIP_RETURN_CODE, SUCCESS_RETURN_CODE)
@@ -96,7 +95,7 @@ class BaseUpdate:
     def remove_unnecessary_keys(self):
         """Removes keys that are in file but not in schema of file type"""
         with open(self.schema_path, 'r') as file_obj:
-            schema = yaml.safe_load(file_obj)
+            schema = yaml_safe_load(file_obj)
             extended_schema = self.recursive_extend_schema(schema, schema)
         if self.verbose:
             print('Removing Unnecessary fields from file')
@@ -238,7 +237,7 @@ class BaseUpdate:
             List of keys that should be deleted in file
         """
         with open(self.schema_path, 'r') as file_obj:
-            a = yaml.safe_load(file_obj)
+            a = yaml_safe_load(file_obj)
         schema_fields = a.get('mapping').keys()
         arguments_to_remove = set(self.data.keys()) - set(schema_fields)
         return arguments_to_remove
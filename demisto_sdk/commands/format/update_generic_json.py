@@ -2,8 +2,7 @@ from distutils.version import LooseVersion
 
 import click
 import ujson
-import yaml
-from demisto_sdk.commands.common.tools import print_error
+from demisto_sdk.commands.common.tools import print_error, yaml_safe_load
 from demisto_sdk.commands.format.format_constants import (
     ARGUMENTS_DEFAULT_VALUES, TO_VERSION_5_9_9)
 from demisto_sdk.commands.format.update_generic import BaseUpdate
@@ -71,7 +70,7 @@ class BaseUpdateJSON(BaseUpdate):
     def remove_null_fields(self):
         """Remove empty fields from file root."""
         with open(self.schema_path, 'r') as file_obj:
-            schema_data = yaml.safe_load(file_obj)
+            schema_data = yaml_safe_load(file_obj)
         schema_fields = schema_data.get('mapping').keys()
         for field in schema_fields:
             # We want to keep 'false' and 0 values, and avoid removing fields that are required in the schema.
@@ -4,10 +4,9 @@ from abc import ABC
 from typing import Tuple
 
 import click
-import yaml
 from demisto_sdk.commands.common.hook_validations.layout import LayoutValidator
 from demisto_sdk.commands.common.tools import (LOG_COLORS, print_color,
-                                               print_error)
+                                               print_error, yaml_safe_load)
 from demisto_sdk.commands.format.format_constants import (
     DEFAULT_VERSION, ERROR_RETURN_CODE, NEW_FILE_DEFAULT_5_FROMVERSION,
     SKIP_RETURN_CODE, SUCCESS_RETURN_CODE, VERSION_6_0_0)
@@ -171,7 +170,7 @@ class LayoutBaseFormat(BaseUpdateJSON, ABC):
                 be deleted as values.
         """
         with open(self.schema_path, 'r') as file_obj:
-            a = yaml.safe_load(file_obj)
+            a = yaml_safe_load(file_obj)
         schema_fields = a.get('mapping').keys()
         first_level_args = set(self.data.keys()) - set(schema_fields)
 
@@ -190,7 +189,7 @@ class LayoutBaseFormat(BaseUpdateJSON, ABC):
                 be deleted as values.
         """
         with open(self.schema_path, 'r') as file_obj:
-            a = yaml.safe_load(file_obj)
+            a = yaml_safe_load(file_obj)
         schema_fields = a.get('mapping').keys()
         first_level_args = set(self.data.keys()) - set(schema_fields)
 
@@ -1,5 +1,7 @@
 # STD python packages
+import hashlib
 import io
+import json
 import logging
 import os
 import re
@@ -7,10 +9,11 @@ import shlex
 import shutil
 import tarfile
 import textwrap
+import threading
 from contextlib import contextmanager
-from functools import lru_cache
+from functools import lru_cache, partial
 from pathlib import Path
-from typing import Dict, Generator, List, Optional, Union
+from typing import Dict, Generator, Iterable, List, Optional, Set, Union
 
 # Third party packages
 import docker
@@ -19,7 +22,9 @@ import git
 import requests
 # Local packages
 from demisto_sdk.commands.common.constants import TYPE_PWSH, TYPE_PYTHON
-from demisto_sdk.commands.common.tools import print_warning, run_command_os
+from demisto_sdk.commands.common.tools import (get_distribution_version,
+                                               get_docker_image_detail,
+                                               print_warning, run_command_os)
 from docker.models.containers import Container
 
 # Python2 requirements
@@ -52,6 +57,20 @@ PY_CHCEKS = ["flake8", "XSOAR_linter", "bandit", "mypy", "vulture", "pytest", "p
 # Line break
 RL = '\n'
 
+# Maximal number of files to lint in a single flake8 run on the files of many packages
+FLAKE8_BATCH_SIZE = 500
+
+# Lint results cache
+LINT_CACHE_FILE_NAME = ".lint_cache.json"
+# Bump whenever the meaning of the cached lint results changes, so stale cache entries are discarded.
+LINT_CACHE_VERSION = 1
+# Files created in the package by the lint checks themselves, which are not inputs of the checks.
+LINT_CACHE_IGNORED_NAMES = {"__pycache__", ".pytest_cache", ".mypy_cache", ".Dockerfile"}
+# Flake8 configuration files which are picked up from the content repository.
+LINT_CONFIG_FILE_NAMES = [".flake8", "setup.cfg", "tox.ini"]
+# Distributions whose versions affect the lint checks results - demisto-sdk and the lint tools which run on the host.
+LINT_CONFIG_DISTRIBUTIONS = ["demisto-sdk", "flake8", "bandit", "mypy", "vulture", "pylint"]
+
 logger = logging.getLogger('demisto-sdk')
 
 
@@ -271,21 +290,38 @@ def add_tmp_lint_files(content_repo: git.Repo, pack_path: Path, lint_files: List
 
 @lru_cache(maxsize=100)
 def get_python_version_from_image(image: str) -> float:
-    """ Get python version from docker image
+    """ Get python version from docker image, the version is cached on disk by the image name and id so a container
+    is run once per image.
+
+    Args:
+        image(str): Docker image id or name
+
+    Returns:
+        float: Python version X.Y (3.7, 3.6, ..), 2.7 if unable to get the python version
+    """
+    try:
+        return get_docker_image_detail(image, 'python_version', partial(_run_python_version_container, image))
+    except (docker.errors.APIError, ValueError):
+        return 2.7
+
+
+def _run_python_version_container(image: str) -> float:
+    """ Run a container of the docker image to get its python version
 
     Args:
         image(str): Docker image id or name
 
     Returns:
         float: Python version X.Y (3.7, 3.6, ..)
+
+    Raises:
+        docker.errors.APIError: If unable to run the container in both trials.
     """
     docker_client = docker.from_env()
-    py_num = 2.7
+    command = "python -c \"import sys; print('{}.{}'.format(sys.version_info[0], sys.version_info[1]))\""
     # Run two times
     for _ in range(2):
         try:
-            command = "python -c \"import sys; print('{}.{}'.format(sys.version_info[0], sys.version_info[1]))\""
-
             container_obj: Container = docker_client.containers.run(
                 image=image,
                 command=shlex.split(command),
@@ -295,10 +331,6 @@ def get_python_version_from_image(image: str) -> float:
             container_obj.wait(condition="exited")
             # Get python version
             py_num = container_obj.logs()
-            if isinstance(py_num, bytes):
-                py_num = float(py_num)
-            else:
-                raise docker.errors.ContainerError
             for _ in range(2):
                 # Try to remove the container two times.
                 try:
@@ -306,10 +338,11 @@ def get_python_version_from_image(image: str) -> float:
                     break
                 except docker.errors.APIError:
                     pass
-        except (docker.errors.APIError, docker.errors.ContainerError):
-            continue
+            return float(py_num)
+        except (docker.errors.APIError, docker.errors.ContainerError) as e:
+            logger.debug(f"Unable to get python version from image {image} - {e}")
 
-    return py_num
+    raise docker.errors.APIError(f"Unable to get python version from image {image}")
 
 
 def get_file_from_container(container_obj: Container, container_path: str, encoding: str = "") -> Union[str, bytes]:
@@ -355,12 +388,10 @@ def copy_dir_to_container(container_obj: Container, host_path: Path, container_p
     """
     excluded_regex = "(__init__.py|.*.back)"
     file_like_object = io.BytesIO()
-    old_cwd = os.getcwd()
+    # Packages are copied from several threads, so the archive paths are set by arcname instead of changing the cwd
     with tarfile.open(fileobj=file_like_object, mode='w:gz') as archive:
-        os.chdir(host_path)
-        archive.add('.', recursive=True, filter=lambda tarinfo: (
+        archive.add(str(host_path), arcname='.', recursive=True, filter=lambda tarinfo: (
             tarinfo if not re.search(excluded_regex, Path(tarinfo.name).name) else None))
-        os.chdir(old_cwd)
 
     for trial in range(2):
         status = container_obj.put_archive(path=container_path,
@@ -441,3 +472,261 @@ def split_warnings_errors(output: str):
             other_msg_list.append(msg)
 
     return error_list, warnings_list, other_msg_list
+
+
+def split_output_by_files(output: str, files: List[Path]) -> Optional[Dict[str, str]]:
+    """ Split the output of a linter which ran on many files to the output of each file.
+        Each message is expected to start with the path of its file, as flake8 reports it ('path:row:col: code msg'),
+        lines which do not start with a file path belong to the previous message.
+
+    Args:
+        output(str): The linter output.
+        files(List[Path]): The files the linter ran on.
+
+    Returns:
+        dict: The output lines of each file path (empty for files without messages), None if the output could not be
+            attributed to the files.
+    """
+    files_output: Dict[str, List[str]] = {str(file): [] for file in files}
+    file_output: Optional[List[str]] = None
+    for line in output.splitlines(keepends=True):
+        file_output = files_output.get(line.partition(':')[0], file_output)
+        if file_output is None:
+            return None
+        file_output.append(line)
+
+    return {file: ''.join(lines) for file, lines in files_output.items()}
+
+
+def _hash_files(files_hash, root: Path, files: Iterable[Path]):
+    """ Update a hash object with the relative paths and contents of the given files.
+
+    Args:
+        files_hash: The hashlib object to update.
+        root(Path): Root directory which the file paths are relative to.
+        files(Iterable[Path]): Files to hash.
+    """
+    for file_path in sorted(files):
+        if not file_path.is_file():
+            continue
+        files_hash.update(str(file_path.relative_to(root)).encode('utf-8'))
+        files_hash.update(file_path.read_bytes())
+
+
+def _get_package_files(pack_dir: Path) -> List[Path]:
+    """ Get all the files of a package, without the files created in it by the lint checks.
+
+    Args:
+        pack_dir(Path): Package directory.
+
+    Returns:
+        List[Path]: The package files.
+    """
+    files = []
+    for root, dirs, file_names in os.walk(pack_dir):
+        dirs[:] = [dir_name for dir_name in dirs if dir_name not in LINT_CACHE_IGNORED_NAMES]
+        files.extend(Path(root) / file_name for file_name in file_names
+                     if file_name not in LINT_CACHE_IGNORED_NAMES and not file_name.endswith('.pyc'))
+    return files
+
+
+@lru_cache(maxsize=None)
+def get_lint_config_hash(content_repo: Optional[Path]) -> str:
+    """ Calculates the hash of the lint configuration - the commands built by demisto-sdk, its lint resources
+    (Pipfiles, pylint plugins, certificates), the docker file template, the flake8 configuration of the content repo,
+    and the versions of demisto-sdk and the host lint tools (flake8, bandit, mypy, vulture, pylint).
+
+    Args:
+        content_repo(Path): Content repository path, None if not running in content repository.
+
+    Returns:
+        str: The md5 hex digest of the lint configuration.
+    """
+    lint_dir = Path(__file__).parent
+    config_hash = hashlib.md5()
+    config_files = [lint_dir / 'commands_builder.py']
+    config_files.extend(lint_dir.glob('resources/**/*'))
+    config_files.extend(lint_dir.glob('templates/**/*'))
+    _hash_files(config_hash, lint_dir, config_files)
+    if content_repo:
+        _hash_files(config_hash, content_repo, [content_repo / file_name for file_name in LINT_CONFIG_FILE_NAMES])
+    versions = {distribution: get_distribution_version(distribution) for distribution in LINT_CONFIG_DISTRIBUTIONS}
+    config_hash.update(json.dumps(versions, sort_keys=True).encode('utf-8'))
+
+    return config_hash.hexdigest()
+
+
+def get_lint_inputs_hash(pack_dir: Path, content_repo: Optional[Path], modules: Dict[Path, bytes],
+                         images: List[str], requirements: List[str]) -> str:
+    """ Calculates the hash of all the inputs of the lint checks of a package:
+        1. The package files.
+        2. The mandatory test modules - demistomock.py, CommonServerPython.py etc.
+        3. The lint configuration - see get_lint_config_hash.
+        4. The docker images and the requirements installed in the test images.
+
+    Args:
+        pack_dir(Path): Package directory.
+        content_repo(Path): Content repository path, None if not running in content repository.
+        modules(dict): Mandatory test modules and their contents.
+        images(list): Docker images of the package.
+        requirements(list): Pypi requirements installed in the test images.
+
+    Returns:
+        str: The md5 hex digest of the lint inputs.
+    """
+    inputs_hash = hashlib.md5()
+    _hash_files(inputs_hash, pack_dir, _get_package_files(pack_dir))
+    for module in sorted(modules):
+        inputs_hash.update(str(module).encode('utf-8'))
+        inputs_hash.update(modules[module])
+    inputs_hash.update(get_lint_config_hash(content_repo).encode('utf-8'))
+    inputs_hash.update(json.dumps([images, requirements]).encode('utf-8'))
+
+    return inputs_hash.hexdigest()
+
+
+class LintCache:
+    """ On disk cache of the lint checks which passed on a package, keyed by the package path and the hash of the
+    package lint inputs (see get_lint_inputs_hash).
+
+    Checks are cached only if they passed without errors and warnings. Packages are linted in different threads, so
+    the cache entries are guarded by a lock.
+    """
+
+    def __init__(self, cache_path: Path):
+        self.cache_path = cache_path
+        self._packages: Dict[str, dict] = {}
+        self._lock = threading.Lock()
+        self._load()
+
+    def _load(self):
+        if not self.cache_path.is_file():
+            return
+        try:
+            cache = json.loads(self.cache_path.read_text())
+        except (OSError, ValueError):
+            print_warning(f"Could not load the lint cache from {self.cache_path}, all the lint checks will run.")
+            return
+
+        if cache.get('version') == LINT_CACHE_VERSION:
+            self._packages = cache.get('packages', {})
+
+    def get_passed_checks(self, pkg: str, inputs_hash: str) -> Set[str]:
+        """ Get the checks which passed on the package on the same inputs.
+
+        Args:
+            pkg(str): Package path.
+            inputs_hash(str): Hash of the current package lint inputs.
+
+        Returns:
+            set: The passed checks, empty if the package inputs changed since the cached run.
+        """
+        with self._lock:
+            cached_pkg = self._packages.get(pkg)
+            if cached_pkg and cached_pkg.get('hash') == inputs_hash:
+                return set(cached_pkg.get('passed_checks', []))
+        return set()
+
+    def set_passed_checks(self, pkg: str, inputs_hash: str, passed_checks: Set[str]):
+        with self._lock:
+            self._packages[pkg] = {'hash': inputs_hash, 'passed_checks': sorted(passed_checks)}
+
+    def save(self):
+        with self._lock:
+            packages = {pkg: cached_pkg for pkg, cached_pkg in self._packages.items() if os.path.isdir(pkg)}
+            try:
+                self.cache_path.write_text(json.dumps({'version': LINT_CACHE_VERSION, 'packages': packages}))
+            except OSError as e:
+                print_warning(f"Could not save the lint cache to {self.cache_path} - {e}")
+
+
+class LintContainerPool:
+    """ Pool of long running containers of the lint test images, shared by the linters of all the packages.
+
+    Instead of building an image with the package copied into it and starting a new container for each check, the
+    package is copied to the work directory of an idle container of its test image and the checks are executed in it.
+    Containers are started when all the containers of a test image are in use, so the pool size is bounded by the
+    number of linters running in parallel.
+    """
+
+    def __init__(self, docker_client: docker.DockerClient):
+        self._docker_client = docker_client
+        self._idle_containers: Dict[str, List[Container]] = {}
+        self._containers: List[Container] = []
+        self._lock = threading.Lock()
+
+    def acquire(self, test_image: str, pack_path: Path) -> Container:
+        """ Get an idle container of the test image, or start a new one, and copy the package to its /devwork.
+
+        Args:
+            test_image(str): Test image name.
+            pack_path(Path): Package path to copy to the container.
+
+        Returns:
+            Container: The container, should be returned to the pool by release when the checks are done.
+
+        Raises:
+            docker.errors.APIError: If unable to start the container or copy the package to it.
+        """
+        with self._lock:
+            idle_containers = self._idle_containers.get(test_image)
+            container_obj = idle_containers.pop() if idle_containers else None
+        try:
+            if not container_obj:
+                container_obj = self._start_container(test_image)
+            self._exec_as_root(container_obj, "find /devwork -mindepth 1 -delete")
+            copy_dir_to_container(container_obj=container_obj, host_path=pack_path, container_path=Path('/devwork'))
+            self._exec_as_root(container_obj, "chown -R :4000 /devwork && chmod -R 775 /devwork")
+        except (docker.errors.APIError, requests.exceptions.ConnectionError) as e:
+            if container_obj:
+                self._remove_container(container_obj)
+            raise docker.errors.APIError(message=str(e))
+
+        return container_obj
+
+    def release(self, test_image: str, container_obj: Container):
+        """ Return a container to the pool, so it will be used for the next packages of the test image.
+
+        Args:
+            test_image(str): Test image name.
+            container_obj(Container): Container returned by acquire.
+        """
+        with self._lock:
+            self._idle_containers.setdefault(test_image, []).append(container_obj)
+
+    def _start_container(self, test_image: str) -> Container:
+        logger.info(f"Lint container pool - Starting container of image {test_image}")
+        container_obj = self._docker_client.containers.run(image=test_image,
+                                                           entrypoint=["/bin/sh", "-c"],
+                                                           command=["tail -f /dev/null"],
+                                                           user="root",
+                                                           detach=True)
+        with self._lock:
+            self._containers.append(container_obj)
+        self._exec_as_root(container_obj, "update-ca-certificates")
+
+        return container_obj
+
+    @staticmethod
+    def _exec_as_root(container_obj: Container, command: str):
+        exit_code, output = container_obj.exec_run(cmd=["/bin/sh", "-c", command], user="root")
+        if exit_code:
+            raise docker.errors.APIError(message=f"{command} failed in container {container_obj.name} - "
+                                                 f"{output.decode('utf-8', errors='replace')}")
+
+    def _remove_container(self, container_obj: Container):
+        with self._lock:
+            if container_obj in self._containers:
+                self._containers.remove(container_obj)
+        try:
+            container_obj.remove(force=True)
+        except (docker.errors.NotFound, docker.errors.APIError) as e:
+            logger.warning(f"Lint container pool - Unable to remove container {container_obj.name} - {e}")
+
+    def close(self):
+        """ Remove all the containers of the pool """
+        with self._lock:
+            containers = list(self._containers)
+            self._idle_containers.clear()
+        for container_obj in containers:
+            self._remove_container(container_obj)
@@ -6,7 +6,7 @@ import os
 import re
 import sys
 import textwrap
-from typing import Any, Dict, List, Set
+from typing import Any, Dict, List, Set, Tuple
 
 # Third party packages
 import docker
@@ -20,11 +20,18 @@ from demisto_sdk.commands.common.constants import (PACKS_PACK_META_FILE_NAME,
 # Local packages
 from demisto_sdk.commands.common.logger import Colors, logging_setup
 from demisto_sdk.commands.common.tools import (print_error, print_v,
-                                               print_warning)
-from demisto_sdk.commands.lint.helpers import (EXIT_CODES, FAIL, PWSH_CHECKS,
-                                               PY_CHCEKS,
+                                               print_warning, run_command_os)
+from demisto_sdk.commands.lint.commands_builder import (build_flake8_command,
+                                                        get_python_exec)
+from demisto_sdk.commands.lint.helpers import (EXIT_CODES, FAIL,
+                                               FLAKE8_BATCH_SIZE,
+                                               LINT_CACHE_FILE_NAME,
+                                               PWSH_CHECKS, PY_CHCEKS,
+                                               LintCache, LintContainerPool,
                                                build_skipped_exit_code,
-                                               get_test_modules, validate_env)
+                                               get_test_modules,
+                                               split_output_by_files,
+                                               validate_env)
 from demisto_sdk.commands.lint.linter import Linter
 from wcmatch.pathlib import Path
 
@@ -229,7 +236,7 @@ class LintManager:
     def run_dev_packages(self, parallel: int, no_flake8: bool, no_xsoar_linter: bool, no_bandit: bool, no_mypy: bool, no_pylint: bool,
                          no_vulture: bool, no_test: bool, no_pwsh_analyze: bool, no_pwsh_test: bool,
                          keep_container: bool,
-                         test_xml: str, failure_report: str) -> int:
+                         test_xml: str, failure_report: str, use_cache: bool = True) -> int:
         """ Runs the Lint command on all given packages.
 
         Args:
@@ -246,6 +253,7 @@ class LintManager:
             keep_container(bool): Whether to keep the test container
             test_xml(str): Path for saving pytest xml results
             failure_report(str): Path for store failed packs report
+            use_cache(bool): Whether to skip checks which already passed on unchanged packages
 
         Returns:
             int: exit code by fail exit codes by var EXIT_CODES
@@ -285,32 +293,44 @@ class LintManager:
                                                no_pylint=no_pylint, no_test=no_test, no_pwsh_analyze=no_pwsh_analyze,
                                                no_pwsh_test=no_pwsh_test, docker_engine=self._facts["docker_engine"])
 
+        content_repo = "" if not self._facts["content_repo"] else Path(self._facts["content_repo"].working_dir)
+        lint_cache = LintCache(cache_path=Path(content_repo or Path.cwd()) / LINT_CACHE_FILE_NAME) if use_cache else None
+        container_pool = LintContainerPool(docker_client=docker.from_env()) if self._facts["docker_engine"] else None
+
         with concurrent.futures.ThreadPoolExecutor(max_workers=parallel) as executor:
             return_exit_code: int = 0
             return_warning_code: int = 0
             results = []
-            # Executing lint checks in different threads
-            for pack in self._pkgs:
-                linter: Linter = Linter(pack_dir=pack,
-                                        content_repo="" if not self._facts["content_repo"] else
-                                        Path(self._facts["content_repo"].working_dir),
-                                        req_2=self._facts["requirements_2"],
-                                        req_3=self._facts["requirements_3"],
-                                        docker_engine=self._facts["docker_engine"])
-                results.append(executor.submit(fn=linter.run_dev_packages,
-                                               no_flake8=no_flake8,
-                                               no_bandit=no_bandit,
-                                               no_mypy=no_mypy,
-                                               no_vulture=no_vulture,
-                                               no_xsoar_linter=no_xsoar_linter,
-                                               no_pylint=no_pylint,
-                                               no_test=no_test,
-                                               no_pwsh_analyze=no_pwsh_analyze,
-                                               no_pwsh_test=no_pwsh_test,
-                                               modules=self._facts["test_modules"],
-                                               keep_container=keep_container,
-                                               test_xml=test_xml))
+            linters = [Linter(pack_dir=pack,
+                              content_repo=content_repo,
+                              req_2=self._facts["requirements_2"],
+                              req_3=self._facts["requirements_3"],
+                              docker_engine=self._facts["docker_engine"],
+                              lint_cache=lint_cache,
+                              container_pool=container_pool) for pack in self._pkgs]
             try:
+                # Run flake8 once on the files of all the packages instead of once per package
+                if not no_flake8 and len(linters) > 1:
+                    self._run_batched_flake8(executor=executor,
+                                             linters=linters,
+                                             content_repo=content_repo,
+                                             modules=self._facts["test_modules"],
+                                             test_xml=test_xml)
+                # Executing lint checks in different threads
+                for linter in linters:
+                    results.append(executor.submit(fn=linter.run_dev_packages,
+                                                   no_flake8=no_flake8,
+                                                   no_bandit=no_bandit,
+                                                   no_mypy=no_mypy,
+                                                   no_vulture=no_vulture,
+                                                   no_xsoar_linter=no_xsoar_linter,
+                                                   no_pylint=no_pylint,
+                                                   no_test=no_test,
+                                                   no_pwsh_analyze=no_pwsh_analyze,
+                                                   no_pwsh_test=no_pwsh_test,
+                                                   modules=self._facts["test_modules"],
+                                                   keep_container=keep_container,
+                                                   test_xml=test_xml))
                 for future in concurrent.futures.as_completed(results):
                     pkg_status = future.result()
                     pkgs_status[pkg_status["pkg"]] = pkg_status
@@ -342,6 +362,12 @@ class LintManager:
                 except Exception:
                     pass
                 return 1
+            finally:
+                if container_pool:
+                    container_pool.close()
+
+        if lint_cache:
+            lint_cache.save()
 
         self._report_results(lint_status=lint_status,
                              pkgs_status=pkgs_status,
@@ -357,6 +383,62 @@ class LintManager:
             return_exit_code = FAIL
         return return_exit_code
 
+    @staticmethod
+    def _run_batched_flake8(executor: concurrent.futures.ThreadPoolExecutor, linters: List[Linter],
+                            content_repo: Path, modules: dict, test_xml: str):
+        """ Run flake8 on the lint files of all the packages in a few large runs, one per python executable and up to
+        FLAKE8_BATCH_SIZE files each, and set the output of its files to each linter.
+        Files of runs which their output could not be split back to the files are linted by their package linter.
+
+        Args:
+            executor(ThreadPoolExecutor): Executor to prepare the linters and run flake8 in.
+            linters(List[Linter]): Linters of the packages.
+            content_repo(Path): Content repo path, flake8 runs in it as in the package linters.
+            modules(dict): Mandatory modules to locate in pack path (CommonServerPython.py etc)
+            test_xml(str): Path for saving pytest xml results
+        """
+        # Gather the packages facts, the linters use them later when running the rest of the checks
+        list(executor.map(lambda linter: linter.prepare(modules=modules, test_xml=test_xml), linters))
+        files_by_python: Dict[str, Tuple[float, List[Path]]] = {}
+        for linter in linters:
+            py_num, lint_files = linter.get_flake8_files()
+            if lint_files:
+                files_by_python.setdefault(get_python_exec(py_num), (py_num, []))[1].extend(lint_files)
+
+        batches = []
+        for py_num, lint_files in files_by_python.values():
+            for i in range(0, len(lint_files), FLAKE8_BATCH_SIZE):
+                batches.append(executor.submit(LintManager._run_flake8_batch,
+                                               py_num=py_num,
+                                               lint_files=lint_files[i:i + FLAKE8_BATCH_SIZE],
+                                               content_repo=content_repo))
+        batch_output: Dict[str, str] = {}
+        for batch in concurrent.futures.as_completed(batches):
+            batch_output.update(batch.result())
+        logger.info(f"Flake8 - Finished running on {len(batch_output)} files of {len(linters)} packages")
+        for linter in linters:
+            linter.set_flake8_batch_output(batch_output)
+
+    @staticmethod
+    def _run_flake8_batch(py_num: float, lint_files: List[Path], content_repo: Path) -> Dict[str, str]:
+        """ Run flake8 on files of many packages.
+
+        Args:
+            py_num(float): The python version of the packages.
+            lint_files(List[Path]): Files to run flake8 on.
+            content_repo(Path): Content repo path to run flake8 in.
+
+        Returns:
+            dict: Flake8 output of each file path, empty if flake8 failed to run on the files.
+        """
+        stdout, stderr, exit_code = run_command_os(command=build_flake8_command(lint_files, py_num), cwd=content_repo)
+        files_output = split_output_by_files(output=stdout, files=lint_files)
+        if stderr or files_output is None or (exit_code and not any(files_output.values())):
+            logger.info(f"Flake8 - Failed running on {len(lint_files)} files, linting them by package")
+            logger.debug(f"Flake8 - Finished exit-code: {exit_code}, stdout: {stdout}, stderr: {stderr}")
+            return {}
+        return files_output
+
     def _report_results(self, lint_status: dict, pkgs_status: dict, return_exit_code: int, return_warning_code: int,
                         skipped_code: int,
                         pkgs_type: list):
@@ -1,9 +1,11 @@
 # STD python packages
+import concurrent.futures
 import hashlib
 import io
 import json
 import logging
 import os
+import threading
 from copy import deepcopy
 from typing import Any, Dict, List, Optional, Tuple
 
@@ -24,10 +26,12 @@ from demisto_sdk.commands.lint.commands_builder import (
     build_pwsh_analyze_command, build_pwsh_test_command, build_pylint_command,
     build_pytest_command, build_vulture_command, build_xsoar_linter_command)
 from demisto_sdk.commands.lint.helpers import (EXIT_CODES, FAIL, RERUN, RL,
-                                               SUCCESS, WARNING,
+                                               SUCCESS, WARNING, LintCache,
+                                               LintContainerPool,
                                                add_tmp_lint_files,
                                                add_typing_module,
                                                get_file_from_container,
+                                               get_lint_inputs_hash,
                                                get_python_version_from_image,
                                                pylint_plugin,
                                                split_warnings_errors,
@@ -38,6 +42,11 @@ from wcmatch.pathlib import NEGATE, Path
 
 logger = logging.getLogger('demisto-sdk')
 
+# Test images pulled or built by the linters of this process, mapped to a future of the image creation errors.
+# Linters of packages which share a test image wait for the first linter to create it, instead of creating it again.
+_test_images: Dict[str, concurrent.futures.Future] = {}
+_test_images_lock = threading.Lock()
+
 
 class Linter:
     """ Linter used to activate lint command on single package
@@ -48,14 +57,26 @@ class Linter:
             req_2(list): requirements for docker using python2.
             req_3(list): requirements for docker using python3.
             docker_engine(bool):  Whether docker engine detected by docker-sdk.
+            lint_cache(LintCache): Cache of passed lint checks, None for running all the checks.
+            container_pool(LintContainerPool): Pool of test containers to run the docker checks in, None for building
+                an image of the package and running each check in a new container.
     """
 
-    def __init__(self, pack_dir: Path, content_repo: Path, req_3: list, req_2: list, docker_engine: bool):
+    def __init__(self, pack_dir: Path, content_repo: Path, req_3: list, req_2: list, docker_engine: bool,
+                 lint_cache: Optional[LintCache] = None, container_pool: Optional[LintContainerPool] = None):
         self._req_3 = req_3
         self._req_2 = req_2
         self._content_repo = content_repo
         self._pack_abs_dir = pack_dir
         self._pack_name = None
+        self._lint_cache = lint_cache
+        self._container_pool = container_pool
+        # Pooled container which the package was copied to, used by the docker checks
+        self._test_container: Optional[docker.models.containers.Container] = None
+        # Whether to skip the package, None until the package facts are gathered
+        self._skip: Optional[bool] = None
+        # Flake8 output of each lint file, from a flake8 run on the files of many packages
+        self._flake8_batch_output: Dict[str, str] = {}
         # Docker client init
         if docker_engine:
             self._docker_client: docker.DockerClient = docker.from_env()
@@ -71,7 +92,10 @@ class Linter:
             "is_long_running": False,
             "lint_unittest_files": [],
             "additional_requirements": [],
-            "docker_engine": docker_engine
+            "docker_engine": docker_engine,
+            "lint_inputs_hash": "",
+            "cached_checks": set(),
+            "executed_checks": set()
         }
         # Pack lint status object - visualize it
         self._pkg_lint_status: Dict = {
@@ -119,7 +143,7 @@ class Linter:
             dict: lint and test all status, pkg status)
         """
         # Gather information for lint check information
-        skip = self._gather_facts(modules)
+        skip = self.prepare(modules=modules, test_xml=test_xml)
         # If not python pack - skip pack
         if skip:
             return self._pkg_lint_status
@@ -132,11 +156,11 @@ class Linter:
                                 pack_type=self._pkg_lint_status["pack_type"]):
             # Run lint check on host - flake8, bandit, mypy
             if self._pkg_lint_status["pack_type"] == TYPE_PYTHON:
-                self._run_lint_in_host(no_flake8=no_flake8,
-                                       no_bandit=no_bandit,
-                                       no_mypy=no_mypy,
-                                       no_vulture=no_vulture,
-                                       no_xsoar_linter=no_xsoar_linter)
+                self._run_lint_in_host(no_flake8=no_flake8 or self._is_check_cached("flake8"),
+                                       no_bandit=no_bandit or self._is_check_cached("bandit"),
+                                       no_mypy=no_mypy or self._is_check_cached("mypy"),
+                                       no_vulture=no_vulture or self._is_check_cached("vulture"),
+                                       no_xsoar_linter=no_xsoar_linter or self._is_check_cached("XSOAR_linter"))
 
             # Run lint and test check on pack docker image
             if self._facts["docker_engine"]:
@@ -147,8 +171,91 @@ class Linter:
                                                keep_container=keep_container,
                                                test_xml=test_xml)
 
+        if self._lint_cache:
+            self._update_cached_checks()
+
         return self._pkg_lint_status
 
+    def prepare(self, modules: dict, test_xml: str) -> bool:
+        """ Gather the package facts and load its cached checks, if not done already.
+
+        Args:
+            modules(dict): Mandatory modules to locate in pack path (CommonServerPython.py etc)
+            test_xml(str): Path for saving pytest xml results
+
+        Returns:
+            bool: Whether to skip the package.
+        """
+        if self._skip is None:
+            self._skip = self._gather_facts(modules)
+            if not self._skip and self._lint_cache:
+                self._load_cached_checks(modules=modules, test_xml=test_xml)
+        return self._skip
+
+    def get_flake8_files(self) -> Tuple[float, List[Path]]:
+        """ Get the files which flake8 should run on, for running flake8 on the files of many packages at once.
+
+        Returns:
+            float: The python version of the package.
+            List[Path]: The package lint and unit test files, empty if flake8 should not run on the package.
+        """
+        if self._skip is not False or self._pkg_lint_status["pack_type"] != TYPE_PYTHON or not self._facts["images"] \
+                or self._is_check_cached("flake8"):
+            return 0, []
+        return self._facts["images"][0][1], self._facts["lint_files"] + self._facts["lint_unittest_files"]
+
+    def set_flake8_batch_output(self, batch_output: Dict[str, str]):
+        """ Set the flake8 output of the package files from a flake8 run on the files of many packages.
+
+        Args:
+            batch_output(dict): Flake8 output of each lint file path, files which are missing are linted by the package.
+        """
+        self._flake8_batch_output = batch_output
+
+    def _load_cached_checks(self, modules: dict, test_xml: str):
+        """ Calculate the package lint inputs hash and get the checks which already passed on the same inputs.
+
+        Args:
+            modules(dict): Mandatory modules to locate in pack path (CommonServerPython.py etc)
+            test_xml(str): Path for saving pytest xml results, cached pytest results are not used if specified.
+        """
+        requirements = self._req_2 + self._req_3 + self._facts["additional_requirements"]
+        self._facts["lint_inputs_hash"] = get_lint_inputs_hash(pack_dir=self._pack_abs_dir,
+                                                               content_repo=self._content_repo or None,
+                                                               modules=modules,
+                                                               images=[image[0] for image in self._facts["images"]],
+                                                               requirements=requirements)
+        cached_checks = self._lint_cache.get_passed_checks(pkg=str(self._pack_abs_dir),  # type: ignore
+                                                           inputs_hash=self._facts["lint_inputs_hash"])
+        if test_xml:
+            cached_checks = {check for check in cached_checks if not check.startswith("pytest")}
+        if cached_checks:
+            logger.info(f"{self._pack_name} - Cache - Checks passed on the same inputs: {sorted(cached_checks)}")
+        self._facts["cached_checks"] = cached_checks
+
+    def _is_check_cached(self, check: str, image: str = "") -> bool:
+        """ Whether the check already passed on the same package inputs.
+
+        Args:
+            check(str): Check name as in EXIT_CODES.
+            image(str): Docker image name, for checks which run in the package docker images.
+
+        Returns:
+            bool: True if the check passed, otherwise False.
+        """
+        cache_key = f"{check}@{image}" if image else check
+        return cache_key in self._facts["cached_checks"]
+
+    def _update_cached_checks(self):
+        """ Save to the cache the executed checks which passed without errors and warnings, in addition to the
+        cached checks which were not executed. """
+        failed_code = self._pkg_lint_status["exit_code"] | self._pkg_lint_status["warning_code"]
+        passed_checks = {check for check in self._facts["executed_checks"]
+                         if not failed_code & EXIT_CODES[check.split("@")[0]]}
+        self._lint_cache.set_passed_checks(pkg=str(self._pack_abs_dir),  # type: ignore
+                                           inputs_hash=self._facts["lint_inputs_hash"],
+                                           passed_checks=passed_checks | self._facts["cached_checks"])
+
     def _gather_facts(self, modules: dict) -> bool:
         """ Gathering facts about the package - python version, docker images, valid docker image, yml parsing
         Args:
@@ -302,6 +409,9 @@ class Linter:
                 elif lint_check == "vulture" and not no_vulture and self._facts["docker_engine"]:
                     exit_code, output = self._run_vulture(py_num=self._facts["python_version"],
                                                           lint_files=self._facts["lint_files"])
+                else:
+                    continue
+                self._facts["executed_checks"].add(lint_check)
 
                 # check for any exit code other than 0
                 if exit_code:
@@ -325,6 +435,7 @@ class Linter:
                 if lint_check == "flake8" and not no_flake8:
                     exit_code, output = self._run_flake8(py_num=self._facts["images"][0][1],
                                                          lint_files=self._facts["lint_unittest_files"])
+                    self._facts["executed_checks"].add(lint_check)
                 if exit_code:
                     error, warning, other = split_warnings_errors(output)
                 if exit_code & FAIL:
@@ -350,6 +461,11 @@ class Linter:
            str: Bandit errors
         """
         log_prompt = f"{self._pack_name} - Flake8"
+        if self._flake8_batch_output and all(str(lint_file) in self._flake8_batch_output for lint_file in lint_files):
+            stdout = "".join(self._flake8_batch_output[str(lint_file)] for lint_file in lint_files)
+            logger.info(f"{log_prompt} - Using the results of the flake8 run on all the packages")
+            logger.debug(f"{log_prompt} - Finished stdout: {RL if stdout else ''}{stdout}")
+            return (FAIL, stdout) if stdout else (SUCCESS, "")
         logger.info(f"{log_prompt} - Start")
         stdout, stderr, exit_code = run_command_os(command=build_flake8_command(lint_files, py_num),
                                                    cwd=self._content_repo)
@@ -522,6 +638,12 @@ class Linter:
             keep_container(bool): Whether to keep the test container
             test_xml(str): Path for saving pytest xml results
         """
+        docker_checks = self._get_docker_checks(no_pylint=no_pylint,
+                                                no_test=no_test,
+                                                no_pwsh_analyze=no_pwsh_analyze,
+                                                no_pwsh_test=no_pwsh_test)
+        # Kept containers are per package and check, so pooled containers are not used
+        use_container_pool = bool(self._container_pool) and not keep_container
         for image in self._facts["images"]:
             # Docker image status - visualize
             status = {
@@ -533,58 +655,103 @@ class Linter:
                 "pwsh_analyze_errors": "",
                 "pwsh_test_errors": ""
             }
+            checks = [check for check in docker_checks if not self._is_check_cached(check, image=image[0])]
+            # Skip image creation if all the checks passed on the same inputs
+            if docker_checks and not checks:
+                logger.info(f"{self._pack_name} - Image {image[0]} - All checks passed on the same inputs, skipping")
+                self._pkg_lint_status["images"].append(status)
+                continue
             # Creating image if pylint specified or found tests and tests specified
             image_id = ""
             errors = ""
             for trial in range(2):
-                image_id, errors = self._docker_image_create(docker_base_image=image)
+                image_id, errors = self._docker_image_create(docker_base_image=image, copy_pack=not use_container_pool)
                 if not errors:
                     break
 
+            # Copy the package to a pooled container of the test image
+            if image_id and not errors and use_container_pool:
+                try:
+                    self._test_container = self._container_pool.acquire(test_image=image_id,  # type: ignore
+                                                                        pack_path=self._pack_abs_dir)
+                except docker.errors.APIError as e:
+                    logger.info(f"{self._pack_name} - Unable to copy pack dir to container of image {image_id} {e}")
+                    errors = str(e)
+
             if image_id and not errors:
                 # Set image creation status
-                for check in ["pylint", "pytest", "pwsh_analyze", "pwsh_test"]:
+                for check in checks:
                     exit_code = SUCCESS
                     output = ""
                     for trial in range(2):
-                        if self._pkg_lint_status["pack_type"] == TYPE_PYTHON:
-                            # Perform pylint
-                            if not no_pylint and check == "pylint" and self._facts["lint_files"]:
-                                exit_code, output = self._docker_run_pylint(test_image=image_id,
-                                                                            keep_container=keep_container)
-                            # Perform pytest
-                            elif not no_test and self._facts["test"] and check == "pytest":
-                                exit_code, output, test_json = self._docker_run_pytest(test_image=image_id,
-                                                                                       keep_container=keep_container,
-                                                                                       test_xml=test_xml)
-                                status["pytest_json"] = test_json
-                        elif self._pkg_lint_status["pack_type"] == TYPE_PWSH:
-                            # Perform powershell analyze
-                            if not no_pwsh_analyze and check == "pwsh_analyze" and self._facts["lint_files"]:
-                                exit_code, output = self._docker_run_pwsh_analyze(test_image=image_id,
-                                                                                  keep_container=keep_container)
-                            # Perform powershell test
-                            elif not no_pwsh_test and check == "pwsh_test":
-                                exit_code, output = self._docker_run_pwsh_test(test_image=image_id,
-                                                                               keep_container=keep_container)
+                        # Perform pylint
+                        if check == "pylint":
+                            exit_code, output = self._docker_run_pylint(test_image=image_id,
+                                                                        keep_container=keep_container)
+                        # Perform pytest
+                        elif check == "pytest":
+                            exit_code, output, test_json = self._docker_run_pytest(test_image=image_id,
+                                                                                   keep_container=keep_container,
+                                                                                   test_xml=test_xml)
+                            status["pytest_json"] = test_json
+                        # Perform powershell analyze
+                        elif check == "pwsh_analyze":
+                            exit_code, output = self._docker_run_pwsh_analyze(test_image=image_id,
+                                                                              keep_container=keep_container)
+                        # Perform powershell test
+                        elif check == "pwsh_test":
+                            exit_code, output = self._docker_run_pwsh_test(test_image=image_id,
+                                                                           keep_container=keep_container)
                         # If lint check perfrom and failed on reason related to enviorment will run twice,
                         # But it failing in second time it will count as test failure.
                         if (exit_code == RERUN and trial == 1) or exit_code == FAIL or exit_code == SUCCESS:
                             if exit_code in [RERUN, FAIL]:
                                 self._pkg_lint_status["exit_code"] |= EXIT_CODES[check]
                                 status[f"{check}_errors"] = output
+                            self._facts["executed_checks"].add(f"{check}@{image[0]}")
                             break
+                if self._test_container:
+                    self._container_pool.release(test_image=image_id, container_obj=self._test_container)  # type: ignore
+                    self._test_container = None
             else:
                 status["image_errors"] = str(errors)
                 self._pkg_lint_status["exit_code"] += EXIT_CODES["image"]
 
             # Add image status to images
             self._pkg_lint_status["images"].append(status)
+            # Shared test images are kept for the linters of the other packages
+            if image_id in _test_images:
+                continue
             try:
                 self._docker_client.images.remove(image_id)
             except (docker.errors.ImageNotFound, docker.errors.APIError):
                 pass
 
+    def _get_docker_checks(self, no_pylint: bool, no_test: bool, no_pwsh_analyze: bool, no_pwsh_test: bool) -> List[str]:
+        """ Get the checks to run on the package docker images
+
+        Args:
+            no_pylint(bool): Whether to skip pylint
+            no_test(bool): Whether to skip pytest
+            no_pwsh_analyze(bool): Whether to skip powershell code analyzing
+            no_pwsh_test(bool): whether to skip powershell tests
+
+        Returns:
+            list: Checks names as in EXIT_CODES.
+        """
+        checks = []
+        if self._pkg_lint_status["pack_type"] == TYPE_PYTHON:
+            if not no_pylint and self._facts["lint_files"]:
+                checks.append("pylint")
+            if not no_test and self._facts["test"]:
+                checks.append("pytest")
+        elif self._pkg_lint_status["pack_type"] == TYPE_PWSH:
+            if not no_pwsh_analyze and self._facts["lint_files"]:
+                checks.append("pwsh_analyze")
+            if not no_pwsh_test:
+                checks.append("pwsh_test")
+        return checks
+
     def _docker_login(self) -> bool:
         """ Login to docker-hub using environment variables:
                 1. DOCKERHUB_USER - User for docker hub.
@@ -604,16 +771,19 @@ class Linter:
         except docker.errors.APIError:
             return False
 
-    def _docker_image_create(self, docker_base_image: List[Any]) -> Tuple[str, str]:
+    def _docker_image_create(self, docker_base_image: List[Any], copy_pack: bool = True) -> Tuple[str, str]:
         """ Create docker image:
             1. Installing 'build base' if required in alpine images version - https://wiki.alpinelinux.org/wiki/GCC
             2. Installing pypi packs - if only pylint required - only pylint installed otherwise all pytest and pylint
                installed, packages which being install can be found in path demisto_sdk/commands/lint/dev_envs
             3. The docker image build done by Dockerfile template located in
                 demisto_sdk/commands/lint/templates/dockerfile.jinja2
+            4. Copying the pack dir to the image, if required.
 
         Args:
             docker_base_image(list): docker image to use as base for installing dev deps and python version.
+            copy_pack(bool): Whether to build an image with the pack dir copied to it, otherwise the shared test image
+                is returned.
 
         Returns:
             str, str. image name to use and errors string.
@@ -639,8 +809,89 @@ class Linter:
             logger.debug(f"{log_prompt} - Error when build image - {e.message()}")
             return test_image_id, str(e)
         # Trying to pull image based on dockerfile hash, will check if something changed
-        errors = ""
         test_image_name = f'devtest{docker_base_image[0]}-{hashlib.md5(dockerfile.encode("utf-8")).hexdigest()}'
+        errors = self._get_shared_test_image(test_image_name=test_image_name,
+                                             dockerfile=dockerfile,
+                                             docker_base_image=docker_base_image)
+        if not copy_pack:
+            return test_image_name, errors
+        for trial in range(2):
+            dockerfile_path = Path(self._pack_abs_dir / ".Dockerfile")
+            try:
+                logger.info(f"{log_prompt} - Copy pack dir to image {test_image_name}")
+                dockerfile = template.render(image=test_image_name,
+                                             copy_pack=True)
+                with open(file=dockerfile_path, mode="+x") as file:
+                    file.write(str(dockerfile))
+
+                docker_image_final = self._docker_client.images.build(path=str(dockerfile_path.parent),
+                                                                      dockerfile=dockerfile_path.stem,
+                                                                      forcerm=True)
+                test_image_name = docker_image_final[0].short_id
+                break
+            except (docker.errors.ImageNotFound, docker.errors.APIError, urllib3.exceptions.ReadTimeoutError,
+                    exceptions.TemplateError) as e:
+                logger.info(f"{log_prompt} - errors occurred when copy pack dir {e}")
+                if trial == 2:
+                    errors = str(e)
+        if dockerfile_path.exists():
+            dockerfile_path.unlink()
+
+        if test_image_id:
+            logger.info(f"{log_prompt} - Image {test_image_id} created successfully")
+
+        return test_image_name, errors
+
+    def _get_shared_test_image(self, test_image_name: str, dockerfile: str, docker_base_image: List[Any]) -> str:
+        """ Pull or build the test image, the image is pulled or built once and shared by all the linters.
+        Linters which need an image which is being pulled or built by another linter wait for it to finish.
+
+        Args:
+            test_image_name(str): Test image name, based on the dockerfile hash.
+            dockerfile(str): Dockerfile of the test image.
+            docker_base_image(list): docker image to use as base for installing dev deps and python version.
+
+        Returns:
+            str: Errors string, empty if the test image is available.
+        """
+        with _test_images_lock:
+            test_image_future = _test_images.get(test_image_name)
+            is_image_creator = test_image_future is None
+            if is_image_creator:
+                test_image_future = _test_images[test_image_name] = concurrent.futures.Future()
+
+        if not is_image_creator:
+            logger.info(f"{self._pack_name} - Image create - Using image {test_image_name} created by another package")
+            return test_image_future.result()  # type: ignore
+
+        errors = "Test image creation was interrupted"
+        try:
+            errors = self._docker_test_image_pull_or_build(test_image_name=test_image_name,
+                                                           dockerfile=dockerfile,
+                                                           docker_base_image=docker_base_image)
+        finally:
+            # Failed images are removed from the registry, so they will be created again on the next trial
+            if errors:
+                with _test_images_lock:
+                    del _test_images[test_image_name]
+            test_image_future.set_result(errors)  # type: ignore
+
+        return errors
+
+    def _docker_test_image_pull_or_build(self, test_image_name: str, dockerfile: str,
+                                         docker_base_image: List[Any]) -> str:
+        """ Pull the test image from docker hub, or build it (and push it if logged in) if it doesn't exist.
+
+        Args:
+            test_image_name(str): Test image name, based on the dockerfile hash.
+            dockerfile(str): Dockerfile of the test image.
+            docker_base_image(list): docker image to use as base for installing dev deps and python version.
+
+        Returns:
+            str: Errors string, empty if the test image is available.
+        """
+        log_prompt = f"{self._pack_name} - Image create"
+        errors = ""
         test_image = None
         try:
             logger.info(f"{log_prompt} - Trying to pull existing image {test_image_name}")
@@ -674,32 +925,45 @@ class Linter:
                 errors = str(e)
         else:
             logger.info(f"{log_prompt} - Found existing image {test_image_name}")
-        for trial in range(2):
-            dockerfile_path = Path(self._pack_abs_dir / ".Dockerfile")
-            try:
-                logger.info(f"{log_prompt} - Copy pack dir to image {test_image_name}")
-                dockerfile = template.render(image=test_image_name,
-                                             copy_pack=True)
-                with open(file=dockerfile_path, mode="+x") as file:
-                    file.write(str(dockerfile))
 
-                docker_image_final = self._docker_client.images.build(path=str(dockerfile_path.parent),
-                                                                      dockerfile=dockerfile_path.stem,
-                                                                      forcerm=True)
-                test_image_name = docker_image_final[0].short_id
-                break
-            except (docker.errors.ImageNotFound, docker.errors.APIError, urllib3.exceptions.ReadTimeoutError,
-                    exceptions.TemplateError) as e:
-                logger.info(f"{log_prompt} - errors occurred when copy pack dir {e}")
-                if trial == 2:
-                    errors = str(e)
-        if dockerfile_path.exists():
-            dockerfile_path.unlink()
+        return errors
 
-        if test_image_id:
-            logger.info(f"{log_prompt} - Image {test_image_id} created successfully")
+    def _docker_run_check(self, test_image: str, container_name: str, command: str) \
+            -> Tuple[docker.models.containers.Container, int, str]:
+        """ Run a check command in the pooled container which the package was copied to if exists, otherwise in a new
+        container of the test image.
 
-        return test_image_name, errors
+        Args:
+            test_image(str): test image id/name
+            container_name(str): Name of the new container
+            command(str): Check command
+
+        Returns:
+            Container: The container which the command run in
+            int: Command exit code
+            str: Command output
+        """
+        if self._test_container:
+            container_exit_code, output = self._test_container.exec_run(cmd=["/bin/sh", "-c", command],
+                                                                        user=f"{os.getuid()}:4000",
+                                                                        environment=self._facts["env_vars"],
+                                                                        workdir="/devwork")
+            stream_docker_container_output(iter([output]))
+            return self._test_container, container_exit_code, output.decode("utf-8")
+
+        # Python test images entrypoint is /bin/sh -c, so the command is passed as a single argument
+        container_command = [command] if self._pkg_lint_status["pack_type"] == TYPE_PYTHON else command
+        container_obj = self._docker_client.containers.run(name=container_name,
+                                                           image=test_image,
+                                                           command=container_command,
+                                                           user=f"{os.getuid()}:4000",
+                                                           detach=True,
+                                                           environment=self._facts["env_vars"])
+        stream_docker_container_output(container_obj.logs(stream=True))
+        # wait for container to finish
+        container_status = container_obj.wait(condition="exited")
+        # Get container exit code and logs
+        return container_obj, container_status.get("StatusCode"), container_obj.logs().decode("utf-8")
 
     def _docker_run_pylint(self, test_image: str, keep_container: bool) -> Tuple[int, str]:
         """ Run Pylint in created test image
@@ -727,20 +991,10 @@ class Linter:
         exit_code = SUCCESS
         output = ""
         try:
-            container_obj = self._docker_client.containers.run(name=container_name,
-                                                               image=test_image,
-                                                               command=[
-                                                                   build_pylint_command(self._facts["lint_files"])],
-                                                               user=f"{os.getuid()}:4000",
-                                                               detach=True,
-                                                               environment=self._facts["env_vars"])
-            stream_docker_container_output(container_obj.logs(stream=True))
-            # wait for container to finish
-            container_status = container_obj.wait(condition="exited")
-            # Get container exit code
-            container_exit_code = container_status.get("StatusCode")
-            # Getting container logs
-            container_log = container_obj.logs().decode("utf-8")
+            container_obj, container_exit_code, container_log = self._docker_run_check(
+                test_image=test_image,
+                container_name=container_name,
+                command=build_pylint_command(self._facts["lint_files"]))
             logger.info(f"{log_prompt} - exit-code: {container_exit_code}")
             if container_exit_code in [1, 2]:
                 # 1-fatal message issued
@@ -760,10 +1014,10 @@ class Linter:
                 exit_code = RERUN
             else:
                 logger.info(f"{log_prompt} - Successfully finished")
-            # Keeping container if needed or remove it
+            # Keeping container if needed or remove it, pooled containers are kept for the next packages
             if keep_container:
                 print(f"{log_prompt} - container name {container_name}")
-            else:
+            elif not self._test_container:
                 try:
                     container_obj.remove(force=True)
                 except docker.errors.NotFound as e:
@@ -803,19 +1057,10 @@ class Linter:
         test_json = {}
         try:
             # Running pytest container
-            container_obj = self._docker_client.containers.run(name=container_name,
-                                                               image=test_image,
-                                                               command=[
-                                                                   build_pytest_command(test_xml=test_xml, json=True)],
-                                                               user=f"{os.getuid()}:4000",
-                                                               detach=True,
-                                                               environment=self._facts["env_vars"])
-            stream_docker_container_output(container_obj.logs(stream=True))
-            # Waiting for container to be finished
-            container_status: dict = container_obj.wait(condition="exited")
-            # Getting container exit code
-            container_exit_code = container_status.get("StatusCode")
-            # Getting container logs
+            container_obj, container_exit_code, container_log = self._docker_run_check(
+                test_image=test_image,
+                container_name=container_name,
+                command=build_pytest_command(test_xml=test_xml, json=True))
             logger.info(f"{log_prompt} - exit-code: {container_exit_code}")
             if container_exit_code in [0, 1, 2, 5]:
                 # 0-All tests passed
@@ -839,7 +1084,7 @@ class Linter:
                     logger.info(f"{log_prompt} - Successfully finished")
                     exit_code = SUCCESS
                 elif container_exit_code in [2]:
-                    output = container_obj.logs().decode('utf-8')
+                    output = container_log
                     exit_code = FAIL
                 else:
                     logger.info(f"{log_prompt} - Finished errors found")
@@ -849,11 +1094,11 @@ class Linter:
                 # 4-pytest command line usage error
                 logger.critical(f"{log_prompt} - Usage error")
                 exit_code = RERUN
-                output = container_obj.logs().decode('utf-8')
-            # Remove container if not needed
+                output = container_log
+            # Remove container if not needed, pooled containers are kept for the next packages
             if keep_container:
                 print(f"{log_prompt} - Container name {container_name}")
-            else:
+            elif not self._test_container:
                 try:
                     container_obj.remove(force=True)
                 except docker.errors.NotFound as e:
@@ -890,20 +1135,10 @@ class Linter:
         exit_code = SUCCESS
         output = ""
         try:
-            container_obj = self._docker_client.containers.run(name=container_name,
-                                                               image=test_image,
-                                                               command=build_pwsh_analyze_command(
-                                                                   self._facts["lint_files"][0]),
-                                                               user=f"{os.getuid()}:4000",
-                                                               detach=True,
-                                                               environment=self._facts["env_vars"])
-            stream_docker_container_output(container_obj.logs(stream=True))
-            # wait for container to finish
-            container_status = container_obj.wait(condition="exited")
-            # Get container exit code
-            container_exit_code = container_status.get("StatusCode")
-            # Getting container logs
-            container_log = container_obj.logs().decode("utf-8")
+            container_obj, container_exit_code, container_log = self._docker_run_check(
+                test_image=test_image,
+                container_name=container_name,
+                command=build_pwsh_analyze_command(self._facts["lint_files"][0]))
             logger.info(f"{log_prompt} - exit-code: {container_exit_code}")
             if container_exit_code:
                 # 1-fatal message issued
@@ -913,10 +1148,10 @@ class Linter:
                 exit_code = FAIL
             else:
                 logger.info(f"{log_prompt} - Successfully finished")
-            # Keeping container if needed or remove it
+            # Keeping container if needed or remove it, pooled containers are kept for the next packages
             if keep_container:
                 print(f"{log_prompt} - container name {container_name}")
-            else:
+            elif not self._test_container:
                 try:
                     container_obj.remove(force=True)
                 except docker.errors.NotFound as e:
@@ -961,19 +1196,10 @@ class Linter:
         exit_code = SUCCESS
         output = ""
         try:
-            container_obj = self._docker_client.containers.run(name=container_name,
-                                                               image=test_image,
-                                                               command=build_pwsh_test_command(),
-                                                               user=f"{os.getuid()}:4000",
-                                                               detach=True,
-                                                               environment=self._facts["env_vars"])
-            stream_docker_container_output(container_obj.logs(stream=True))
-            # wait for container to finish
-            container_status = container_obj.wait(condition="exited")
-            # Get container exit code
-            container_exit_code = container_status.get("StatusCode")
-            # Getting container logs
-            container_log = container_obj.logs().decode("utf-8")
+            container_obj, container_exit_code, container_log = self._docker_run_check(
+                test_image=test_image,
+                container_name=container_name,
+                command=build_pwsh_test_command())
             logger.info(f"{log_prompt} - exit-code: {container_exit_code}")
             if container_exit_code:
                 # 1-fatal message issued
@@ -983,10 +1209,10 @@ class Linter:
                 exit_code = FAIL
             else:
                 logger.info(f"{log_prompt} - Successfully finished")
-            # Keeping container if needed or remove it
+            # Keeping container if needed or remove it, pooled containers are kept for the next packages
             if keep_container:
                 print(f"{log_prompt} - container name {container_name}")
-            else:
+            elif not self._test_container:
                 try:
                     container_obj.remove(force=True)
                 except docker.errors.NotFound as e:
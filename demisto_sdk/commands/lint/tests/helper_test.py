@@ -1,7 +1,9 @@
 import os
+from pathlib import Path
 
 import pytest
-from demisto_sdk.commands.lint.helpers import split_warnings_errors
+from demisto_sdk.commands.lint.helpers import (split_output_by_files,
+                                               split_warnings_errors)
 
 
 def test_validate_env(mocker) -> None:
@@ -60,6 +62,27 @@ def test_get_python_version_from_image(image: str, output: bytes, expected: floa
     assert expected == helpers.get_python_version_from_image(image)
 
 
+def test_get_python_version_from_image_runs_container_once(mocker):
+    """
+        Given:
+            - A docker image which is not in the docker images cache.
+
+        When:
+            - Getting the python version of the image.
+
+        Then:
+            - Ensure a single container is run when the first trial succeeds.
+    """
+    from demisto_sdk.commands.common import tools
+    from demisto_sdk.commands.lint import helpers
+    mocker.patch.object(tools, 'get_docker_image_id', return_value=None)
+    mocker.patch.object(helpers.docker, 'from_env')
+    helpers.docker.from_env().containers.run().logs.return_value = b'3.8\n'
+    helpers.docker.from_env().containers.run.reset_mock()
+    assert helpers.get_python_version_from_image('demisto/python3:3.8.6.12176') == 3.8
+    assert helpers.docker.from_env().containers.run.call_count == 1
+
+
 @pytest.mark.parametrize(argnames="archive_response, expected_count, expected_exception",
                          argvalues=[
                              ([False, True], 2, False),
@@ -146,3 +169,183 @@ def test_split_warnings_errors(linter_name, input_msg, output_error, output_warn
     assert error == output_error
     assert warning == output_warning
     assert other == output_other
+
+
+def test_split_output_by_files():
+    """
+        Given:
+            - Flake8 output of a run on the files of two packages, with a message spanning two lines.
+            - Output which does not start with a linted file path.
+
+        When:
+            - Splitting the output to the output of each file.
+
+        Then:
+            - Ensure each file gets its own messages and a file without messages gets an empty output.
+            - Ensure None is returned when the output can not be attributed to the files.
+    """
+    files = [Path('/content/Packs/A/Integrations/A/A.py'), Path('/content/Packs/B/Integrations/B/B.py'),
+             Path('/content/Packs/C/Integrations/C/C.py')]
+    output = "/content/Packs/A/Integrations/A/A.py:1:1: F401 'os' imported but unused\n" \
+             "/content/Packs/B/Integrations/B/B.py:2:2: E225 missing whitespace around operator\n" \
+             "    x=1\n" \
+             "/content/Packs/A/Integrations/A/A.py:3:1: E302 expected 2 blank lines, found 1\n"
+    assert split_output_by_files(output, files) == {
+        '/content/Packs/A/Integrations/A/A.py': "/content/Packs/A/Integrations/A/A.py:1:1: F401 'os' imported but unused\n"
+                                                "/content/Packs/A/Integrations/A/A.py:3:1: E302 expected 2 blank lines, found 1\n",
+        '/content/Packs/B/Integrations/B/B.py': "/content/Packs/B/Integrations/B/B.py:2:2: E225 missing whitespace around operator\n"
+                                                "    x=1\n",
+        '/content/Packs/C/Integrations/C/C.py': ""
+    }
+    assert split_output_by_files("There was a critical error during execution of Flake8\n", files) is None
+
+
+def test_get_lint_inputs_hash(tmp_path):
+    """
+        Given:
+            - A package with a code file and a test module.
+
+        When:
+            - Running get_lint_inputs_hash before and after the lint checks created cache files in the package,
+              and after changing the package code, the test module or the docker image.
+
+        Then:
+            - Ensure the hash does not change due to the files created by the lint checks.
+            - Ensure the hash changes when any of the lint inputs changes.
+    """
+    from demisto_sdk.commands.lint.helpers import get_lint_inputs_hash
+    pack_dir = tmp_path / 'Sample'
+    pack_dir.mkdir()
+    (pack_dir / 'Sample.py').write_text('print("hello")')
+    modules = {Path('CommonServerPython.py'): b'def demisto(): pass'}
+    inputs = {'pack_dir': pack_dir, 'content_repo': None, 'modules': modules,
+              'images': ['demisto/python3:3.8.6.12176'], 'requirements': ['pytest==6.1.1']}
+    inputs_hash = get_lint_inputs_hash(**inputs)
+
+    (pack_dir / '__pycache__').mkdir()
+    (pack_dir / '__pycache__' / 'Sample.cpython-38.pyc').write_bytes(b'0000')
+    (pack_dir / '.pytest_cache').mkdir()
+    assert get_lint_inputs_hash(**inputs) == inputs_hash
+
+    (pack_dir / 'Sample.py').write_text('print("hello world")')
+    changed_code_hash = get_lint_inputs_hash(**inputs)
+    assert changed_code_hash != inputs_hash
+
+    modules[Path('CommonServerPython.py')] = b'def demisto(): return'
+    changed_modules_hash = get_lint_inputs_hash(**inputs)
+    assert changed_modules_hash != changed_code_hash
+
+    inputs['images'] = ['demisto/python3:3.9.0.12345']
+    assert get_lint_inputs_hash(**inputs) != changed_modules_hash
+
+
+def test_get_lint_config_hash_tools_versions(mocker):
+    """
+        Given:
+            - Installed versions of demisto-sdk and the host lint tools.
+
+        When:
+            - Running get_lint_config_hash before and after upgrading flake8.
+
+        Then:
+            - Ensure the hash changes, so cached passed checks are not reused.
+    """
+    from demisto_sdk.commands.lint import helpers
+    versions = {'demisto-sdk': '1.2.8', 'flake8': '3.8.3', 'bandit': '1.6.2', 'mypy': '0.790', 'vulture': '2.1',
+                'pylint': '2.6.0'}
+    mocker.patch.object(helpers, 'get_distribution_version', side_effect=lambda name: versions[name])
+    helpers.get_lint_config_hash.cache_clear()
+    try:
+        config_hash = helpers.get_lint_config_hash(None)
+        versions['flake8'] = '3.9.0'
+        helpers.get_lint_config_hash.cache_clear()
+        assert helpers.get_lint_config_hash(None) != config_hash
+    finally:
+        helpers.get_lint_config_hash.cache_clear()
+
+
+def test_lint_cache(tmp_path):
+    """
+        Given:
+            - A lint cache which was saved with passed checks of a package.
+
+        When:
+            - Loading the cache and getting the passed checks of the package with the same and with a different hash.
+
+        Then:
+            - Ensure the passed checks are returned only for the same hash.
+            - Ensure packages which no longer exist are not saved.
+    """
+    from demisto_sdk.commands.lint.helpers import LintCache
+    cache_path = tmp_path / '.lint_cache.json'
+    pack_dir = tmp_path / 'Sample'
+    pack_dir.mkdir()
+    lint_cache = LintCache(cache_path=cache_path)
+    lint_cache.set_passed_checks(pkg=str(pack_dir), inputs_hash='hash', passed_checks={'flake8', 'pytest@image'})
+    lint_cache.set_passed_checks(pkg=str(tmp_path / 'Deleted'), inputs_hash='hash', passed_checks={'flake8'})
+    lint_cache.save()
+
+    lint_cache = LintCache(cache_path=cache_path)
+    assert lint_cache.get_passed_checks(pkg=str(pack_dir), inputs_hash='hash') == {'flake8', 'pytest@image'}
+    assert lint_cache.get_passed_checks(pkg=str(pack_dir), inputs_hash='changed-hash') == set()
+    assert lint_cache.get_passed_checks(pkg=str(tmp_path / 'Deleted'), inputs_hash='hash') == set()
+
+
+def test_lint_container_pool(mocker, tmp_path):
+    """
+        Given:
+            - A lint container pool of a test image.
+
+        When:
+            - Acquiring two containers at the same time, releasing them and acquiring a container again.
+            - Closing the pool.
+
+        Then:
+            - Ensure a new container is started only when all the containers of the image are in use.
+            - Ensure the package is copied to the container on each acquire.
+            - Ensure all the containers are removed when the pool is closed.
+    """
+    from demisto_sdk.commands.lint import helpers
+    mocker.patch.object(helpers, 'copy_dir_to_container')
+    docker_client = mocker.MagicMock()
+    docker_client.containers.run.side_effect = lambda **kwargs: mocker.MagicMock(**{'exec_run.return_value': (0, b'')})
+    container_pool = helpers.LintContainerPool(docker_client=docker_client)
+
+    first_container = container_pool.acquire(test_image='devtest-image', pack_path=tmp_path)
+    second_container = container_pool.acquire(test_image='devtest-image', pack_path=tmp_path)
+    assert first_container is not second_container
+    container_pool.release(test_image='devtest-image', container_obj=first_container)
+    container_pool.release(test_image='devtest-image', container_obj=second_container)
+    assert container_pool.acquire(test_image='devtest-image', pack_path=tmp_path) in (first_container, second_container)
+
+    assert docker_client.containers.run.call_count == 2
+    assert helpers.copy_dir_to_container.call_count == 3
+    container_pool.close()
+    first_container.remove.assert_called_once_with(force=True)
+    second_container.remove.assert_called_once_with(force=True)
+
+
+def test_lint_container_pool_copy_failure(mocker, tmp_path):
+    """
+        Given:
+            - A lint container pool of a test image.
+
+        When:
+            - Copying the package to the container fails.
+
+        Then:
+            - Ensure an APIError is raised and the failed container is removed from the pool.
+    """
+    import docker
+    from demisto_sdk.commands.lint import helpers
+    mocker.patch.object(helpers, 'copy_dir_to_container',
+                        side_effect=docker.errors.APIError(message="unable to copy dir to container"))
+    docker_client = mocker.MagicMock()
+    docker_client.containers.run.return_value.exec_run.return_value = (0, b'')
+    container_pool = helpers.LintContainerPool(docker_client=docker_client)
+
+    with pytest.raises(docker.errors.APIError):
+        container_pool.acquire(test_image='devtest-image', pack_path=tmp_path)
+    docker_client.containers.run.return_value.remove.assert_called_once_with(force=True)
+    container_pool.close()
+    docker_client.containers.run.return_value.remove.assert_called_once_with(force=True)
@@ -344,3 +344,42 @@ def test_report_summary_no_warnings(capsys):
     assert "Packages PASS: \x1b[32m1\x1b[0m" in captured.out
     assert "Packages WARNING (can either PASS or FAIL): \x1b[33m0\x1b[0m" in captured.out
     assert "Packages FAIL: [31m0[0m" in captured.out
+
+
+def test_run_batched_flake8(mocker):
+    """
+    Given:
+        - Linters of two python3 packages and a python2 package.
+
+    When:
+        - Running flake8 on the files of all the packages.
+
+    Then:
+        - Ensure flake8 runs once per python executable.
+        - Ensure each linter gets the output of the files flake8 ran on, and files of failed runs are left out.
+    """
+    import concurrent.futures
+    from demisto_sdk.commands.lint import lint_manager
+    files = {'A': [PosixPath('/Packs/A/A.py')], 'B': [PosixPath('/Packs/B/B.py')], 'C': [PosixPath('/Packs/C/C.py')]}
+    linters = []
+    for pkg, py_num in [('A', 3.7), ('B', 3.8), ('C', 2.7)]:
+        linter = MagicMock()
+        linter.get_flake8_files.return_value = (py_num, files[pkg])
+        linters.append(linter)
+
+    def run_command_os(command, cwd):
+        if command.startswith('python3'):
+            return '/Packs/B/B.py:1:1: F401 unused import\n', '', 1
+        return '', 'flake8 is not installed', 1
+
+    mocker.patch.object(lint_manager, 'logger', create=True)
+    mocker.patch.object(lint_manager, 'run_command_os', side_effect=run_command_os)
+    with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
+        lint_manager.LintManager._run_batched_flake8(executor=executor, linters=linters, content_repo=PosixPath('/'),
+                                                     modules={}, test_xml='')
+
+    assert lint_manager.run_command_os.call_count == 2
+    expected_output = {'/Packs/A/A.py': '', '/Packs/B/B.py': '/Packs/B/B.py:1:1: F401 unused import\n'}
+    for linter in linters:
+        linter.prepare.assert_called_once_with(modules={}, test_xml='')
+        linter.set_flake8_batch_output.assert_called_once_with(expected_output)
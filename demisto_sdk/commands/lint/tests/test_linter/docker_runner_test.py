@@ -41,6 +41,42 @@ class TestCreateImage:
         assert act_test_image_id == exp_test_image_id
         assert act_errors == exp_errors
 
+    def test_shared_test_image_created_once(self, mocker, linter_obj: Linter):
+        """
+        Given:
+            - Several packages which use the same test image, the first creation of the image fails.
+
+        When:
+            - Getting the test image from several threads at the same time, and again after the failure.
+
+        Then:
+            - Ensure the image is created once and the failure is returned to all the threads.
+            - Ensure the failed image is created again on the next trial and then shared.
+        """
+        import time
+        from concurrent.futures import ThreadPoolExecutor
+
+        def pull_or_build(**kwargs):
+            time.sleep(0.1)
+            return "build error" if linter_obj._docker_test_image_pull_or_build.call_count == 1 else ""
+
+        mocker.patch.object(linter_obj, '_docker_test_image_pull_or_build', side_effect=pull_or_build)
+        mocker.patch.dict(linter._test_images, clear=True)
+
+        def get_shared_test_image():
+            return linter_obj._get_shared_test_image(test_image_name='devtestimage-hash',
+                                                     dockerfile='FROM image',
+                                                     docker_base_image=['image', 3.7])
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            assert list(executor.map(lambda _: get_shared_test_image(), range(4))) == ["build error"] * 4
+        assert linter_obj._docker_test_image_pull_or_build.call_count == 1
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            assert list(executor.map(lambda _: get_shared_test_image(), range(4))) == [""] * 4
+        assert linter_obj._docker_test_image_pull_or_build.call_count == 2
+        assert 'devtestimage-hash' in linter._test_images
+
 
 class TestPylint:
     def test_run_pylint_no_errors(self, mocker, linter_obj: Linter):
@@ -77,6 +113,30 @@ class TestPylint:
         assert act_exit_code == exp_exit_code
         assert act_output == exp_output
 
+    def test_run_pylint_in_pooled_container(self, mocker, linter_obj: Linter):
+        """
+        Given:
+            - A pooled container which the package was copied to.
+
+        When:
+            - Running pylint.
+
+        Then:
+            - Ensure pylint is executed in the pooled container instead of a new container.
+            - Ensure the pooled container is not removed.
+        """
+        mocker.patch.object(linter_obj, '_docker_client')
+        pooled_container = mocker.MagicMock()
+        pooled_container.exec_run.return_value = (1, b'pylint error')
+        linter_obj._test_container = pooled_container
+        act_exit_code, act_output = linter_obj._docker_run_pylint(test_image='test-image', keep_container=False)
+
+        assert act_exit_code == 0b1
+        assert act_output == 'pylint error'
+        assert pooled_container.exec_run.call_args[1]['workdir'] == '/devwork'
+        linter_obj._docker_client.containers.run.assert_not_called()
+        pooled_container.remove.assert_not_called()
+
 
 class TestPytest:
     @pytest.mark.parametrize(argnames="exp_container_exit_code, exp_exit_code",
@@ -149,3 +209,78 @@ class TestRunLintInContainer:
             linter_obj._docker_run_pwsh_analyze.assert_called_once()
         elif not no_pwsh_test and pack_type == TYPE_PWSH:
             linter_obj._docker_run_pwsh_test.assert_called_once()
+
+    def test_run_lint_in_pooled_container(self, mocker, linter_obj, lint_files):
+        """
+        Given:
+            - A python package and a lint container pool.
+
+        When:
+            - Running the lint checks on the package docker image.
+
+        Then:
+            - Ensure the shared test image is used without copying the package to a new image.
+            - Ensure the package container is acquired from the pool and released after the checks.
+        """
+        mocker.patch.dict(linter_obj._facts, {
+            "images": [["image", 3.7]],
+            "test": True,
+            "lint_files": lint_files,
+        })
+        mocker.patch.dict(linter_obj._pkg_lint_status, {
+            "pack_type": TYPE_PYTHON,
+        })
+        linter_obj._container_pool = mocker.MagicMock()
+        mocker.patch.object(linter_obj, '_docker_image_create', return_value=("devtest-image", ""))
+        mocker.patch.object(linter_obj, '_docker_run_pytest', return_value=(0b0, '', {}))
+        mocker.patch.object(linter_obj, '_docker_run_pylint', return_value=(0b0, ''))
+        linter_obj._run_lint_on_docker_image(no_pylint=False,
+                                             no_test=False,
+                                             no_pwsh_analyze=True,
+                                             no_pwsh_test=True,
+                                             test_xml="",
+                                             keep_container=False)
+        assert linter_obj._pkg_lint_status.get("exit_code") == 0b0
+        linter_obj._docker_image_create.assert_called_once_with(docker_base_image=["image", 3.7], copy_pack=False)
+        linter_obj._container_pool.acquire.assert_called_once_with(test_image="devtest-image",
+                                                                   pack_path=linter_obj._pack_abs_dir)
+        linter_obj._container_pool.release.assert_called_once_with(
+            test_image="devtest-image", container_obj=linter_obj._container_pool.acquire.return_value)
+        assert linter_obj._test_container is None
+
+    def test_run_lint_skips_cached_checks(self, mocker, linter_obj, lint_files):
+        """
+        Given:
+            - A python package with two docker images, pylint and pytest already passed on the first image.
+
+        When:
+            - Running the lint checks on the package docker images.
+
+        Then:
+            - Ensure the first image is not created and the checks run only on the second image.
+            - Ensure the checks which run on the second image are recorded as executed.
+        """
+        mocker.patch.dict(linter_obj._facts, {
+            "images": [["image", 3.7], ["other-image", 3.8]],
+            "test": True,
+            "lint_files": lint_files,
+            "cached_checks": {"pylint@image", "pytest@image"},
+            "executed_checks": set()
+        })
+        mocker.patch.dict(linter_obj._pkg_lint_status, {
+            "pack_type": TYPE_PYTHON,
+        })
+        mocker.patch.object(linter_obj, '_docker_image_create', return_value=("test-image", ""))
+        mocker.patch.object(linter_obj, '_docker_run_pytest', return_value=(0b0, '', {}))
+        mocker.patch.object(linter_obj, '_docker_run_pylint', return_value=(0b0, ''))
+        linter_obj._run_lint_on_docker_image(no_pylint=False,
+                                             no_test=False,
+                                             no_pwsh_analyze=True,
+                                             no_pwsh_test=True,
+                                             test_xml="",
+                                             keep_container=False)
+        assert linter_obj._pkg_lint_status.get("exit_code") == 0b0
+        linter_obj._docker_image_create.assert_called_once_with(docker_base_image=["other-image", 3.8], copy_pack=True)
+        linter_obj._docker_run_pylint.assert_called_once()
+        linter_obj._docker_run_pytest.assert_called_once()
+        assert linter_obj._facts["executed_checks"] == {"pylint@other-image", "pytest@other-image"}
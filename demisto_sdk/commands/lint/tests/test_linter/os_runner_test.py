@@ -41,6 +41,29 @@ class TestFlake8:
         assert exit_code == 0b1, "Exit code should be 1"
         assert output == expected_output, "Output should be empty"
 
+    def test_run_flake8_batch_output(self, linter_obj: Linter, lint_files: List[Path], mocker):
+        """
+        Given:
+            - Flake8 output of the package lint files from a flake8 run on all the packages.
+
+        When:
+            - Running flake8 on the package lint files.
+
+        Then:
+            - Ensure flake8 is not run again and the batch output is returned.
+        """
+        from demisto_sdk.commands.lint import linter
+
+        mocker.patch.object(linter, 'run_command_os')
+        expected_output = f'{lint_files[0]}:1:1: F401 \'os\' imported but unused\n'
+        linter_obj.set_flake8_batch_output({str(lint_files[0]): expected_output})
+
+        exit_code, output = linter_obj._run_flake8(lint_files=lint_files, py_num=3.7)
+
+        assert exit_code == 0b1, "Exit code should be 1"
+        assert output == expected_output
+        assert not linter.run_command_os.called
+
 
 class TestBandit:
     def test_run_bandit_success(self, linter_obj: Linter, lint_files: List[Path], mocker):
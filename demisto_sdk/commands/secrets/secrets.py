@@ -3,8 +3,9 @@ import json
 import math
 import os
 import string
-from collections import defaultdict
-from typing import DefaultDict
+from collections import Counter, defaultdict
+from functools import lru_cache
+from typing import DefaultDict, Dict, FrozenSet, Iterable, Pattern
 
 import PyPDF2
 from bs4 import BeautifulSoup
@@ -56,8 +57,8 @@ IPV4_REGEX = r'\b(?:(?:25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)\.){3}(?:25[0-5]|2[0
 DATES_REGEX = r'((\d{4}[/.-]\d{2}[/.-]\d{2})[T\s](\d{2}:?\d{2}:?\d{2}:?(\.\d{5,10})?([+-]\d{2}:?\d{2})?Z?)?)'
 # false positives
 UUID_REGEX = r'([\w]{8}-[\w]{4}-[\w]{4}-[\w]{4}-[\w]{8,12})'
-# find any substring
-WHILEIST_REGEX = r'\S*{}\S*'
+# find any substring, from the start of the string it is contained in
+WHILEIST_REGEX = r'(?<!\S)\S*(?:{})\S*'
 
 
 # disable-secrets-detection-end
@@ -174,12 +175,21 @@ class SecretsValidator(object):
         :return: dictionary(filename: (list)secrets) of strings sorted by file name for secrets found in files
         """
         secret_to_location_mapping: DefaultDict[str, defaultdict] = defaultdict(lambda: defaultdict(list))
+        # white lists are loaded and compiled once per pack
+        white_lists: Dict[tuple, tuple] = {}
         for file_path in secrets_file_paths:
             # Get if file path in pack and pack name
             is_pack = is_file_path_in_pack(file_path)
             pack_name = get_pack_name(file_path)
             # Get generic/ioc/files white list sets based on if pack or not
-            secrets_white_list, ioc_white_list, files_white_list = self.get_white_listed_items(is_pack, pack_name)
+            if (is_pack, pack_name) not in white_lists:
+                secrets_white_list, ioc_white_list, files_white_list = self.get_white_listed_items(is_pack, pack_name)
+                # the white list is matched against the lower case strings with a single regex
+                white_list_regex = self.compile_white_list_regex(
+                    frozenset(white_list_string.lower() for white_list_string in secrets_white_list))
+                white_lists[(is_pack, pack_name)] = (secrets_white_list, ioc_white_list, files_white_list,
+                                                     white_list_regex)
+            secrets_white_list, ioc_white_list, files_white_list, white_list_regex = white_lists[(is_pack, pack_name)]
             # Skip white listed files
 
             if file_path in files_white_list:
@@ -198,9 +208,11 @@ class SecretsValidator(object):
 
             yml_file_contents = self.get_related_yml_contents(file_path)
             # Add all context output paths keywords to whitelist temporary
+            temp_white_list = set()
             if file_extension == YML_FILE_EXTENSION or yml_file_contents:
                 temp_white_list = self.create_temp_white_list(yml_file_contents if yml_file_contents else file_contents)
-                secrets_white_list = secrets_white_list.union(temp_white_list)
+            # Strings to calculate their entropy, with their line numbers
+            entropy_strings = []
             # Search by lines after strings with high entropy / IoCs regex as possibly suspicious
             for line_num, line in enumerate(file_contents.split('\n')):
                 # REGEX scanning for IOCs and false positive groups
@@ -210,7 +222,7 @@ class SecretsValidator(object):
                         secret_to_location_mapping[file_path][line_num + 1].append(regex_secret)
                 # added false positives into white list array before testing the strings in line
 
-                secrets_white_list = secrets_white_list.union(false_positives)
+                temp_white_list = temp_white_list.union(false_positive.lower() for false_positive in false_positives)
 
                 if not ignore_entropy:
                     # due to nature of eml files, skip string by string secret detection - only regex
@@ -221,13 +233,16 @@ class SecretsValidator(object):
                     # calculate entropy for each string in the file
                     for string_ in line.split():
                         # compare the lower case of the string against both generic whitelist & temp white list
-                        if not any(
-                                white_list_string.lower() in string_.lower()
-                                for white_list_string in secrets_white_list):
+                        lower_string = string_.lower()
+                        if not white_list_regex.search(lower_string) and not any(
+                                white_list_string in lower_string for white_list_string in temp_white_list):
+                            entropy_strings.append((line_num, string_))
 
-                            entropy = self.calculate_shannon_entropy(string_)
-                            if entropy >= ENTROPY_THRESHOLD:
-                                secret_to_location_mapping[file_path][line_num + 1].append(string_)
+            # calculate the entropy of all the strings of the file at once
+            entropies = self.calculate_shannon_entropies(string_ for _, string_ in entropy_strings)
+            for line_num, string_ in entropy_strings:
+                if entropies[string_] >= ENTROPY_THRESHOLD:
+                    secret_to_location_mapping[file_path][line_num + 1].append(string_)
 
         return secret_to_location_mapping
 
@@ -242,14 +257,31 @@ class SecretsValidator(object):
         Returns:
             str: The file content with the whitelisted items removed.
         """
-        for item in secrets_white_list:
-            try:
-                file_content = re.sub(WHILEIST_REGEX.format(re.escape(item)), '', file_content)
-            except re.error as err:
-                error_string = f"Could not use secrets with item: {item}"
-                print_error(error_string)
-                raise re.error(error_string, err)
-        return file_content
+        try:
+            white_list_regex = SecretsValidator.compile_white_list_regex(frozenset(secrets_white_list), WHILEIST_REGEX)
+        except re.error as err:
+            error_string = f"Could not use secrets with items: {secrets_white_list}"
+            print_error(error_string)
+            raise re.error(error_string, err)
+        return white_list_regex.sub('', file_content)
+
+    @staticmethod
+    @lru_cache(None)
+    def compile_white_list_regex(white_list: FrozenSet[str], regex_format: str = '{}') -> Pattern:
+        """Compiles a white list into a single regex which matches any of its items, once per white list
+
+        Arguments:
+            white_list (frozenset): The white listed strings.
+            regex_format (str): The regex to format the alternation of the white listed strings into.
+
+        Returns:
+            Pattern: The compiled regex, which matches nothing for an empty white list.
+        """
+        if not white_list:
+            return re.compile(r'(?!)')
+        # longer items first, so an item is preferred over its prefixes
+        items = sorted(white_list, key=lambda item: (-len(item), item))
+        return re.compile(regex_format.format('|'.join(re.escape(item) for item in items)))
 
     @staticmethod
     def create_temp_white_list(file_contents):
@@ -334,15 +366,26 @@ class SecretsValidator(object):
         if not data:
             return 0
         entropy = 0
-        # each unicode code representation of all characters which are considered printable
-        for char in (ord(c) for c in string.printable):
-            # probability of event X
-            p_x = float(data.count(chr(char))) / len(data)
-            if p_x > 0:
+        # count all the characters in a single pass over the data
+        char_counts = Counter(data)
+        # sum over the characters which are considered printable, in a fixed order to get the same score for the
+        # same characters distribution
+        for char in string.printable:
+            if char in char_counts:
+                # probability of event X
+                p_x = float(char_counts[char]) / len(data)
                 # the information in every possible news, in bits
                 entropy += - p_x * math.log(p_x, 2)
         return entropy
 
+    @staticmethod
+    def calculate_shannon_entropies(strings: Iterable[str]) -> Dict[str, float]:
+        """Calculates the entropy of many strings, for example all the strings of a file, once per distinct string.
+        :param strings: the strings to calculate their entropy.
+        :return: entropies: the entropy score of each distinct string.
+        """
+        return {string_: SecretsValidator.calculate_shannon_entropy(string_) for string_ in set(strings)}
+
     def get_white_listed_items(self, is_pack, pack_name):
         final_white_list, ioc_white_list, files_white_list = self.get_generic_white_list(self.white_list_path)
         if is_pack:
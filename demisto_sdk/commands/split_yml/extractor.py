@@ -3,25 +3,29 @@ import os
 import shutil
 import subprocess
 import tempfile
+from functools import partial
 from io import open
 
-import yaml
 from demisto_sdk.commands.common.configuration import Configuration
 from demisto_sdk.commands.common.constants import (TYPE_PWSH, TYPE_PYTHON,
                                                    TYPE_TO_EXTENSION)
 from demisto_sdk.commands.common.tools import (LOG_COLORS,
                                                get_all_docker_images,
+                                               get_docker_image_detail,
                                                get_pipenv_dir,
                                                get_python_version, pascal_case,
-                                               print_color, print_error)
+                                               print_color, print_error,
+                                               yaml_safe_load)
 from ruamel.yaml import YAML
 from ruamel.yaml.scalarstring import SingleQuotedScalarString
 
 
 def get_pip_requirements(docker_image: str):
-    return subprocess.check_output(["docker", "run", "--rm", docker_image,
-                                    "pip", "freeze", "--disable-pip-version-check"],
-                                   universal_newlines=True, stderr=subprocess.DEVNULL).strip()
+    return get_docker_image_detail(docker_image, 'pip_requirements',
+                                   partial(subprocess.check_output,
+                                           ["docker", "run", "--rm", docker_image,
+                                            "pip", "freeze", "--disable-pip-version-check"],
+                                           universal_newlines=True, stderr=subprocess.DEVNULL)).strip()
 
 
 class Extractor:
@@ -59,7 +63,7 @@ class Extractor:
             self.config = configuration
         self.autocreate_dir = not no_auto_create_dir
         with open(self.input, 'rb') as yml_file:
-            self.yml_data = yaml.safe_load(yml_file)
+            self.yml_data = yaml_safe_load(yml_file)
 
     def get_output_path(self):
         """Get processed output path
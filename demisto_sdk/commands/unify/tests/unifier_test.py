@@ -525,6 +525,43 @@ final test: hi
         assert export_yml_path == expected_yml_path
         os.remove(expected_yml_path)
 
+    def test_unify_package_data(self):
+        """
+        Given
+        - Integration package yml which was already loaded, and the content of its code, image and description files.
+
+        When
+        - Unifying it in memory.
+
+        Then
+        - Ensure no file is written until the unified yml is written.
+        - Ensure the unified yml is the same as unified from the package files.
+        """
+        create_test_package(
+            test_dir=self.test_dir_path,
+            package_name=self.package_name,
+            base_yml='demisto_sdk/tests/test_files/Unifier/SampleIntegPackage/SampleIntegPackage.yml',
+            script_code=TEST_VALID_CODE,
+            detailed_description=TEST_VALID_DETAILED_DESCRIPTION,
+            image_file='demisto_sdk/tests/test_files/Unifier/SampleIntegPackage/SampleIntegPackage_image.png',
+        )
+        unifier = Unifier(input=self.export_dir_path, output=self.test_dir_path)
+        with open('demisto_sdk/tests/test_files/Unifier/SampleIntegPackage/SampleIntegPackage_image.png', 'rb') as f:
+            image_data = f.read()
+
+        unifier = Unifier(input=self.export_dir_path, output=self.test_dir_path, yml_data=unifier.yml_data)
+        output_map = unifier.unify_package_data(script_code=TEST_VALID_CODE.encode('utf-8'), image_data=image_data,
+                                                desc_data=TEST_VALID_DETAILED_DESCRIPTION.encode('utf-8'))
+
+        assert list(output_map) == [self.expected_yml_path]
+        assert not os.path.exists(self.expected_yml_path)
+
+        unifier.write_yaml_files(output_map)
+
+        expected_yml = get_yaml('demisto_sdk/tests/test_files/Unifier/SampleIntegPackage/'
+                                'integration-SampleIntegPackageSanity.yml')
+        assert expected_yml == get_yaml(self.expected_yml_path)
+
 
 class TestMergeScriptPackageToYMLScript:
     @pytest.fixture(autouse=True)
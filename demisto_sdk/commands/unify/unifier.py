@@ -5,7 +5,7 @@ import io
 import json
 import os
 import re
-from typing import Dict, Tuple
+from typing import Callable, Dict, Optional, Tuple
 
 import click
 from demisto_sdk.commands.common.constants import (DEFAULT_IMAGE_PREFIX,
@@ -45,7 +45,7 @@ INTEGRATIONS_DOCS_REFERENCE = 'https://xsoar.pan.dev/docs/reference/integrations
 class Unifier:
 
     def __init__(self, input: str, dir_name=INTEGRATIONS_DIR, output: str = '',
-                 image_prefix=DEFAULT_IMAGE_PREFIX, force: bool = False):
+                 image_prefix=DEFAULT_IMAGE_PREFIX, force: bool = False, yml_data: Optional[dict] = None):
 
         directory_name = ''
         # Changing relative path to current abspath fixed problem with default output file name.
@@ -67,6 +67,17 @@ class Unifier:
 
         self.dest_path = output
 
+        self.ryaml = YAML()
+        self.ryaml.preserve_quotes = True
+        self.ryaml.width = 50000  # make sure long lines will not break (relevant for code section)
+        if yml_data is not None:
+            # The package yml was already loaded by the caller, no need to find and read it again.
+            self.yml_path = ''
+            self.yml_data = yml_data
+            self.is_script_package = isinstance(self.yml_data.get('script'), str)
+            self.dir_name = SCRIPTS_DIR if self.is_script_package else dir_name
+            return
+
         yml_paths, self.yml_path = get_yml_paths_in_dir(self.package_path, Errors.no_yml_file(self.package_path))
         for path in yml_paths:
             # The plugin creates a unified YML file for the package.
@@ -78,9 +89,6 @@ class Unifier:
                 self.yml_path = path
                 break
 
-        self.ryaml = YAML()
-        self.ryaml.preserve_quotes = True
-        self.ryaml.width = 50000  # make sure long lines will not break (relevant for code section)
         if self.yml_path:
             with io.open(self.yml_path, 'r', encoding='utf8') as yml_file:
                 self.yml_data = self.ryaml.load(yml_file)
@@ -104,6 +112,24 @@ class Unifier:
             yml_data {dict} -- yml object
             script_obj {dict} -- script object
 
+        Returns:
+            dict -- dictionary mapping output path to unified data
+        """
+        output_map = self.split_yaml_with_docker(yml_unified, yml_data, script_obj)
+        self.write_yaml_files(output_map)
+
+        return output_map
+
+    def split_yaml_with_docker(self, yml_unified, yml_data, script_obj):
+        """Split the unified yml in memory taking into account the dockerimage45 tag.
+        If it is present will split to 2 integrations
+        One for 4.5 and below and one for 5.0.
+
+        Arguments:
+            yml_unified {dict} -- unified yml dict
+            yml_data {dict} -- yml object
+            script_obj {dict} -- script object
+
         Returns:
             dict -- dictionary mapping output path to unified data
         """
@@ -143,6 +169,15 @@ class Unifier:
                 self.dest_path: yml_unified,
                 output_path45: yml_unified45,
             }
+
+        return output_map
+
+    def write_yaml_files(self, output_map):
+        """Write out the unified yml files.
+
+        Arguments:
+            output_map {dict} -- dictionary mapping output path to unified data
+        """
         for file_path, file_data in output_map.items():
             if os.path.isfile(file_path) and self.use_force is False:
                 raise ValueError(f'Output file already exists: {self.dest_path}.'
@@ -152,28 +187,12 @@ class Unifier:
             with io.open(file_path, mode='w', encoding='utf-8') as file_:
                 self.ryaml.dump(file_data, file_)
 
-        return output_map
-
     def merge_script_package_to_yml(self, file_name_suffix=None):
         """Merge the various components to create an output yml file
         """
         print("Merging package: {}".format(self.package_path))
-        package_dir_name = os.path.basename(self.package_path)
-        output_filename = '{}-{}.yml'.format(DIR_TO_PREFIX[self.dir_name], package_dir_name)
-
-        if file_name_suffix:
-            # append suffix to output file name
-            output_filename = file_name_suffix.join(os.path.splitext(output_filename))
-
-        if self.dest_path:
-            self.dest_path = os.path.join(self.dest_path, output_filename)
-        else:
-            self.dest_path = os.path.join(self.package_path, output_filename)
-
-        script_obj = self.yml_data
-
-        if not self.is_script_package:
-            script_obj = self.yml_data['script']
+        self.dest_path = self.get_output_path(file_name_suffix)
+        script_obj = self.get_script_obj()
         script_type = TYPE_TO_EXTENSION[script_obj['type']]
 
         yml_unified = copy.deepcopy(self.yml_data)
@@ -185,13 +204,7 @@ class Unifier:
             yml_unified, image_path = self.insert_image_to_yml(self.yml_data, yml_unified)
             yml_unified, desc_path = self.insert_description_to_yml(self.yml_data, yml_unified)
             contributor_type, metadata_data = self.get_contributor_data()
-
-            if self.is_contributor_pack(contributor_type):
-                contributor_email = metadata_data.get('email', '')
-                contributor_url = metadata_data.get('url', '')
-                author = metadata_data.get('author')
-                yml_unified = self.add_contributors_support(yml_unified, contributor_type, contributor_email,
-                                                            contributor_url, author)
+            yml_unified = self.insert_contributor_support_to_yml(yml_unified, contributor_type, metadata_data)
 
         output_map = self.write_yaml_with_docker(yml_unified, self.yml_data, script_obj)
         unifier_outputs = list(output_map.keys()), self.yml_path, script_path, image_path, desc_path
@@ -199,8 +212,71 @@ class Unifier:
 
         return unifier_outputs[0]
 
+    def unify_package_data(self, script_code: bytes, image_data: Optional[bytes] = None,
+                           desc_data: Optional[bytes] = None, has_readme: bool = False,
+                           pack_metadata_data: Optional[bytes] = None, file_name_suffix=None,
+                           code_transform: Optional[Callable[[str], str]] = None) -> Dict[str, dict]:
+        """Merge the already loaded package yml with the data of the package files in memory,
+        Without reading or writing any file - The caller writes each output once (See write_yaml_files).
+
+        Args:
+            script_code: Content of the code file (See get_code_file).
+            image_data: Content of the integration image file.
+            desc_data: Content of the integration detailed description file.
+            has_readme: Whether the integration has a non empty README.md.
+            pack_metadata_data: Content of the pack metadata file.
+            file_name_suffix: Suffix to append to the output file name.
+            code_transform: Modification of the code in the unified yml only (The code file is not changed).
+
+        Returns:
+            Dict[str, dict]: Output path to the unified yml data (2 outputs if split by dockerimage45).
+        """
+        self.dest_path = self.get_output_path(file_name_suffix)
+        script_obj = self.get_script_obj()
+        script_type = TYPE_TO_EXTENSION[script_obj['type']]
+
+        yml_unified = copy.deepcopy(self.yml_data)
+        # Decode as the code file is read in text mode - Including universal newlines.
+        script_code_text = io.TextIOWrapper(io.BytesIO(script_code), encoding='utf-8').read()
+        if code_transform:
+            script_code_text = code_transform(script_code_text)
+        yml_unified = self.insert_script_code_to_yml(script_code_text, script_type, yml_unified, self.yml_data)
+        if not self.is_script_package:
+            yml_unified = self.insert_image_data_to_yml(image_data, self.yml_data, yml_unified)
+            yml_unified = self.insert_description_data_to_yml(desc_data, self.yml_data, yml_unified, has_readme)
+            contributor_type, metadata_data = self.parse_contributor_data(pack_metadata_data)
+            yml_unified = self.insert_contributor_support_to_yml(yml_unified, contributor_type, metadata_data)
+
+        return self.split_yaml_with_docker(yml_unified, self.yml_data, script_obj)
+
+    def get_output_path(self, file_name_suffix=None) -> str:
+        """Unified yml output path - <prefix>-<package dir name>.yml in the output dir (package dir by default)"""
+        package_dir_name = os.path.basename(self.package_path)
+        output_filename = '{}-{}.yml'.format(DIR_TO_PREFIX[self.dir_name], package_dir_name)
+
+        if file_name_suffix:
+            # append suffix to output file name
+            output_filename = file_name_suffix.join(os.path.splitext(output_filename))
+
+        if self.dest_path:
+            return os.path.join(self.dest_path, output_filename)
+
+        return os.path.join(self.package_path, output_filename)
+
+    def get_script_obj(self) -> dict:
+        """Script object - The yml itself for scripts, the script key for integrations"""
+        if self.is_script_package:
+            return self.yml_data
+
+        return self.yml_data['script']
+
     def insert_image_to_yml(self, yml_data, yml_unified):
         image_data, found_img_path = self.get_data(self.package_path, "*png")
+        yml_unified = self.insert_image_data_to_yml(image_data, yml_data, yml_unified)
+
+        return yml_unified, found_img_path
+
+    def insert_image_data_to_yml(self, image_data, yml_data, yml_unified):
         if image_data:
             image_data = self.image_prefix + base64.b64encode(image_data).decode('utf-8')
 
@@ -212,11 +288,15 @@ class Unifier:
         else:
             click.secho(f'Failed getting image data for {self.package_path}', fg="yellow")
 
-        return yml_unified, found_img_path
+        return yml_unified
 
     def insert_description_to_yml(self, yml_data, yml_unified):
         desc_data, found_desc_path = self.get_data(self.package_path, '*_description.md')
+        yml_unified = self.insert_description_data_to_yml(desc_data, yml_data, yml_unified)
 
+        return yml_unified, found_desc_path
+
+    def insert_description_data_to_yml(self, desc_data, yml_data, yml_unified, has_readme=None):
         if yml_data.get('detaileddescription') and self.use_force is False:
             raise ValueError('Please move the detailed description from the yml to a description file (.md)'
                              f' in the package: {self.package_path}')
@@ -225,7 +305,7 @@ class Unifier:
         if desc_data:
             detailed_description = FoldedScalarString(desc_data.decode('utf-8'))
 
-        integration_doc_link = self.get_integration_doc_link(yml_data)
+        integration_doc_link = self.get_integration_doc_link(yml_data, has_readme)
         if integration_doc_link:
             if detailed_description:
                 detailed_description += '\n---\n' + integration_doc_link
@@ -233,19 +313,24 @@ class Unifier:
                 detailed_description += integration_doc_link
         if detailed_description:
             yml_unified['detaileddescription'] = detailed_description
-        return yml_unified, found_desc_path
+        return yml_unified
 
     def get_data(self, path, extension):
-        data_path = glob.glob(os.path.join(path, extension))
         data = None
-        found_data_path = None
-        if not self.is_script_package and data_path:
-            found_data_path = data_path[0]
+        found_data_path = self.get_data_path(path, extension)
+        if found_data_path:
             with open(found_data_path, 'rb') as data_file:
                 data = data_file.read()
 
         return data, found_data_path
 
+    def get_data_path(self, path, extension):
+        data_path = glob.glob(os.path.join(path, extension))
+        if not self.is_script_package and data_path:
+            return data_path[0]
+
+        return None
+
     def get_code_file(self, script_type):
         """Return the first code file in the specified directory path
         :param script_type: script type: .py, .js, .ps1
@@ -276,6 +361,11 @@ class Unifier:
         with io.open(script_path, mode='r', encoding='utf-8') as script_file:
             script_code = script_file.read()
 
+        yml_unified = self.insert_script_code_to_yml(script_code, script_type, yml_unified, yml_data)
+
+        return yml_unified, script_path
+
+    def insert_script_code_to_yml(self, script_code, script_type, yml_unified, yml_data):
         # Check if the script imports an API module. If it does,
         # the API module code will be pasted in place of the import.
         module_import, module_name = self.check_api_module_imports(script_code)
@@ -304,7 +394,7 @@ class Unifier:
 
             yml_unified['script']['script'] = FoldedScalarString(clean_code)
 
-        return yml_unified, script_path
+        return yml_unified
 
     def get_script_or_integration_package_data(self):
         # should be static method
@@ -416,12 +506,44 @@ class Unifier:
         pack_path = self.get_pack_path()
         pack_metadata_data, pack_metadata_path = self.get_data(pack_path, PACK_METADATA_PATH)
 
+        return self.parse_contributor_data(pack_metadata_data)
+
+    @staticmethod
+    def parse_contributor_data(pack_metadata_data):
+        """Parses contributor data from the pack metadata file content.
+
+        Args:
+            pack_metadata_data (bytes): The pack metadata file content.
+
+        Returns:
+            (str, dict). Contributor type and file data.
+        """
         if pack_metadata_data:
             json_pack_metadata = json.loads(pack_metadata_data)
             support_field = json_pack_metadata.get('support')
             return support_field, json_pack_metadata
         return None, None
 
+    def insert_contributor_support_to_yml(self, yml_unified, contributor_type, metadata_data):
+        """Adds contributor support to the unified yml if the pack is a contribution.
+
+        Args:
+            yml_unified (dict): The unified yaml file.
+            contributor_type (str): The contributor type.
+            metadata_data (dict): The pack metadata.
+
+        Returns:
+            The unified yaml file (dict).
+        """
+        if self.is_contributor_pack(contributor_type):
+            contributor_email = metadata_data.get('email', '')
+            contributor_url = metadata_data.get('url', '')
+            author = metadata_data.get('author')
+            yml_unified = self.add_contributors_support(yml_unified, contributor_type, contributor_email,
+                                                        contributor_url, author)
+
+        return yml_unified
+
     def add_contributors_support(self, unified_yml: Dict, contributor_type: str, contributor_email: str,
                                  contributor_url: str, author: str = '') -> Dict:
         """Add contributor support to the unified file - text in the display name and detailed description.
@@ -450,11 +572,12 @@ class Unifier:
 
         return unified_yml
 
-    def get_integration_doc_link(self, unified_yml: Dict) -> str:
+    def get_integration_doc_link(self, unified_yml: Dict, has_readme: Optional[bool] = None) -> str:
         """Generates the integration link to the integration documentation
 
         Args:
             unified_yml (Dict): The integration YAML dictionary object
+            has_readme (bool): Whether the integration has a non empty README, checked in the package if not given
 
         Returns:
             str: The integration doc markdown link to add to the detailed description (if reachable)
@@ -462,8 +585,10 @@ class Unifier:
         normalized_integration_id = self.normalize_integration_id(unified_yml['commonfields']['id'])
         integration_doc_link = INTEGRATIONS_DOCS_REFERENCE + normalized_integration_id
 
-        readme_path = os.path.join(self.package_path, 'README.md')
-        if os.path.isfile(readme_path) and os.stat(readme_path).st_size != 0:
+        if has_readme is None:
+            readme_path = os.path.join(self.package_path, 'README.md')
+            has_readme = os.path.isfile(readme_path) and os.stat(readme_path).st_size != 0
+        if has_readme:
             # verify README file exists and is not empty
             return f'[View Integration Documentation]({integration_doc_link})'
         else:
@@ -366,6 +366,36 @@ def test_upload_pack(demisto_client_configure, mocker):
         assert entity in print.call_args_list[-1][0][0]
 
 
+def test_upload_pack_in_parallel(demisto_client_configure, mocker):
+    """
+    Given
+        - A pack called DummyPack
+
+    When
+        - Uploading the pack, 4 content items at a time
+
+    Then
+        - Ensure all the content items are uploaded, each entity type after the entity types it depends on
+        - Ensure the integration and script packages are unified ahead and their temporary files are removed
+    """
+    mocker.patch("builtins.print")
+    pack_path = f"{git_path()}/demisto_sdk/tests/test_files/Packs/DummyPack"
+    uploader = Uploader(input=pack_path, insecure=False, verbose=False, parallel=4)
+    mocker.patch.object(uploader, 'client')
+    unify_package = mocker.spy(uploader, '_unify_package')
+    assert uploader.upload() == 0
+    uploaded_types = [file_type for _, file_type in uploader.successfully_uploaded_files]
+    assert len(uploaded_types) == 14
+    assert max(uploaded_types.index('Integration'), uploaded_types.index('Script')) < uploaded_types.index('Playbook')
+    assert uploaded_types.index('Incident Type') < uploaded_types.index('Incident Field') < uploaded_types.index(
+        'Classifier')
+    assert unify_package.call_count == 2
+    for package_dir in ('Integrations/UploadTest', 'Scripts/DummyScript'):
+        _, yml_path = get_yml_paths_in_dir(f'{pack_path}/{package_dir}')
+        assert not os.path.exists(os.path.join(os.path.dirname(yml_path), f'integration-{os.path.basename(yml_path)}'))
+        assert not os.path.exists(os.path.join(os.path.dirname(yml_path), f'script-{os.path.basename(yml_path)}'))
+
+
 def test_upload_invalid_path(demisto_client_configure):
     script_dir_path = f'{git_path()}/demisto_sdk/tests/test_files/content_repo_not_exists/Scripts/'
     script_dir_uploader = Uploader(input=script_dir_path, insecure=False, verbose=False)
@@ -1,7 +1,8 @@
 import json
 import os
+from concurrent.futures import Future, ThreadPoolExecutor
 from tempfile import NamedTemporaryFile
-from typing import List, Tuple
+from typing import Callable, Dict, List, Tuple
 
 import demisto_client
 from demisto_client.demisto_api.rest import ApiException
@@ -26,17 +27,21 @@ class Uploader:
         Attributes:
             path (str): The path of a pack / directory / file to upload.
             verbose (bool): Whether to output a detailed response.
+            parallel (int): The number of content items of the same entity type to upload at a time.
             client (DefaultApi): Demisto-SDK client object.
         """
 
-    def __init__(self, input: str, insecure: bool = False, verbose: bool = False):
+    def __init__(self, input: str, insecure: bool = False, verbose: bool = False, parallel: int = 1):
         self.path = input
         self.log_verbose = verbose
+        self.parallel = parallel
         verify = (not insecure) if insecure else None  # set to None so demisto_client will use env var DEMISTO_VERIFY_SSL
         self.client = demisto_client.configure(verify_ssl=verify)
         self.status_code = 0
         self.successfully_uploaded_files: List[Tuple[str, str]] = []
         self.failed_uploaded_files: List[Tuple[str, str]] = []
+        # Unified yml files of the integration and script packages of a pack, created ahead of their upload
+        self._unified_packages: Dict[str, Future] = {}
 
     def upload(self):
         """Upload the pack / directory / file to the remote Cortex XSOAR instance.
@@ -119,12 +124,26 @@ class Uploader:
         return self.status_code
 
     def pack_uploader(self):
-        """Extracts the directories of the pack and upload them by directory_uploader
+        """Extracts the directories of the pack and upload them by directory_uploader.
+        The integration and script packages are unified by a separate worker, ahead of their upload.
         """
         list_directories = get_child_directories(self.path)
         ordered_directories_list = self._sort_directories_based_on_dependencies(list_directories)
-        for directory in ordered_directories_list:
-            self.directory_uploader(directory)
+        with ThreadPoolExecutor(max_workers=1) as unify_executor:
+            for directory in ordered_directories_list:
+                if is_path_of_integration_directory(directory) or is_path_of_script_directory(directory):
+                    for package in get_child_directories(directory):
+                        self._unified_packages[package] = unify_executor.submit(self._unify_package, package)
+            try:
+                for directory in ordered_directories_list:
+                    self.directory_uploader(directory)
+            finally:
+                # Remove the temporary files of packages which were unified but not uploaded
+                for unified_package in self._unified_packages.values():
+                    if not unified_package.cancel() and not unified_package.exception():
+                        for unified_path in unified_package.result():
+                            self._remove_temp_file(unified_path)
+                self._unified_packages.clear()
 
     def directory_uploader(self, path: str):
         """Uploads directories by path
@@ -132,17 +151,18 @@ class Uploader:
         Args:
             path (str): Path for directory to upload.
         """
+        upload_items: List[Tuple[Callable[[str], None], str]] = []
         if is_path_of_integration_directory(path):
             # Upload unified integration files
             list_unified_integrations = get_child_files(path)
             for unified_integration in list_unified_integrations:
                 file_type = find_type(unified_integration)
                 if file_type == FileType.INTEGRATION:
-                    self.integration_uploader(unified_integration)
+                    upload_items.append((self.integration_uploader, unified_integration))
             # Upload spliced integration files
             list_integrations = get_child_directories(path)
             for integration in list_integrations:
-                self.integration_uploader(integration)
+                upload_items.append((self.integration_uploader, integration))
 
         elif is_path_of_script_directory(path):
             # Upload unified scripts files
@@ -150,53 +170,93 @@ class Uploader:
             for unified_script in list_unified_scripts:
                 file_type = find_type(unified_script)
                 if file_type in (FileType.SCRIPT, FileType.TEST_SCRIPT):
-                    self.script_uploader(unified_script)
+                    upload_items.append((self.script_uploader, unified_script))
             # Upload spliced scripts
             list_script = get_child_directories(path)
             for script in list_script:
-                self.script_uploader(script)
+                upload_items.append((self.script_uploader, script))
 
         elif is_path_of_playbook_directory(path) or is_path_of_test_playbook_directory(path):
             list_playbooks = get_child_files(path)
             for playbook in list_playbooks:
                 if playbook.endswith('.yml'):
-                    self.playbook_uploader(playbook)
+                    upload_items.append((self.playbook_uploader, playbook))
 
         elif is_path_of_incident_field_directory(path):
             list_incident_fields = get_child_files(path)
             for incident_field in list_incident_fields:
                 if incident_field.endswith('.json'):
-                    self.incident_field_uploader(incident_field)
+                    upload_items.append((self.incident_field_uploader, incident_field))
 
         elif is_path_of_widget_directory(path):
             list_widgets = get_child_files(path)
             for widget in list_widgets:
                 if widget.endswith('.json'):
-                    self.widget_uploader(widget)
+                    upload_items.append((self.widget_uploader, widget))
 
         elif is_path_of_dashboard_directory(path):
             list_dashboards = get_child_files(path)
             for dashboard in list_dashboards:
                 if dashboard.endswith('.json'):
-                    self.dashboard_uploader(dashboard)
+                    upload_items.append((self.dashboard_uploader, dashboard))
 
         elif is_path_of_layout_directory(path):
             list_layouts = get_child_files(path)
             for layout in list_layouts:
                 if layout.endswith('.json'):
-                    self.layout_uploader(layout)
+                    upload_items.append((self.layout_uploader, layout))
 
         elif is_path_of_incident_type_directory(path):
             list_incident_types = get_child_files(path)
             for incident_type in list_incident_types:
                 if incident_type.endswith('.json'):
-                    self.incident_type_uploader(incident_type)
+                    upload_items.append((self.incident_type_uploader, incident_type))
 
         elif is_path_of_classifier_directory(path):
             list_classifiers = get_child_files(path)
             for classifiers in list_classifiers:
                 if classifiers.endswith('.json'):
-                    self.classifier_uploader(classifiers)
+                    upload_items.append((self.classifier_uploader, classifiers))
+
+        self._upload_items(upload_items)
+
+    def _upload_items(self, upload_items: List[Tuple[Callable[[str], None], str]]):
+        """Uploads the content items of a directory, up to `parallel` items at a time.
+        All the items are uploaded before returning, so directories are uploaded in the order of their dependencies.
+
+        Args:
+            upload_items (List): Tuples of the uploader method and path of each content item.
+        """
+        with ThreadPoolExecutor(max_workers=self.parallel) as executor:
+            futures = [executor.submit(uploader, item_path) for uploader, item_path in upload_items]
+            for future in futures:
+                future.result()
+
+    def _unify_package(self, path: str) -> List[str]:
+        """Creates the temporary unified yml files of an integration or a script package.
+
+        Args:
+            path (str): Path of the package directory.
+
+        Returns:
+            List. The unified yml file paths.
+        """
+        unifier = Unifier(input=path, output=path)
+        return unifier.merge_script_package_to_yml()
+
+    def _get_unified_package(self, path: str) -> List[str]:
+        """Gets the unified yml files of an integration or a script package, created ahead or now.
+
+        Args:
+            path (str): Path of the package directory.
+
+        Returns:
+            List. The unified yml file paths.
+        """
+        unified_package = self._unified_packages.pop(path, None)
+        if unified_package:
+            return unified_package.result()
+        return self._unify_package(path)
 
     def integration_uploader(self, path: str):
         is_dir = False
@@ -207,8 +267,7 @@ class Uploader:
             if os.path.isdir(path):  # Create a temporary unified yml file
                 try:
                     is_dir = True
-                    unifier = Unifier(input=path, output=path)
-                    unified_paths = unifier.merge_script_package_to_yml()
+                    unified_paths = self._get_unified_package(path)
                     path = unified_paths[0]
                     docker45_path = unified_paths[1] if len(unified_paths) > 1 else ''
                     file_name = os.path.basename(path)
@@ -256,8 +315,7 @@ class Uploader:
             if os.path.isdir(path):  # Create a temporary unified yml file
                 is_dir = True
                 try:
-                    unifier = Unifier(input=path, output=path)
-                    unified_paths = unifier.merge_script_package_to_yml()
+                    unified_paths = self._get_unified_package(path)
                     path = unified_paths[0]
                     docker45_path = unified_paths[1] if len(unified_paths) > 1 else ''
                     file_name = os.path.basename(path)
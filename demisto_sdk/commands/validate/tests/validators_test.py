@@ -1122,3 +1122,46 @@ def test_should_raise_pack_version(pack_name, expected):
     validate_manager = ValidateManager()
     res = validate_manager.should_raise_pack_version(pack_name)
     assert res == expected
+
+
+def mock_run_validations_on_pack(self, pack_path):
+    if pack_path.endswith('1'):
+        error_list = demisto_sdk.commands.validate.validate_manager.FOUND_FILES_AND_IGNORED_ERRORS
+    else:
+        error_list = demisto_sdk.commands.validate.validate_manager.FOUND_FILES_AND_ERRORS
+    BaseValidator.add_to_report_error_list('BA100', pack_path, error_list)
+    BaseValidator.add_to_report_error_list('BA100', 'Packs/Common/pack_metadata.json', error_list)
+    self.ignored_files.add(os.path.join(pack_path, 'ignored_file'))
+    return pack_path.endswith('1')
+
+
+@pytest.mark.parametrize('workers', [1, 3])
+def test_run_validation_on_all_packs_with_workers(workers, mocker, tmpdir):
+    """
+    Given
+        - A content repo with several packs, some of them invalid.
+    When
+        - Running validations on all the packs, sequentially and with several worker processes.
+    Then
+        - Ensure the found errors, ignored errors and ignored files are collected back in the packs order.
+        - Ensure the validation result is False.
+    """
+    mocker.patch.object(ValidateManager, 'run_validations_on_pack', new=mock_run_validations_on_pack)
+    mocker.patch.object(demisto_sdk.commands.validate.validate_manager, 'FOUND_FILES_AND_ERRORS', new=[])
+    mocker.patch.object(demisto_sdk.commands.validate.validate_manager, 'FOUND_FILES_AND_IGNORED_ERRORS', new=[])
+    packs_dir = tmpdir.mkdir('Packs')
+    for pack_name in ['Pack1', 'Pack2', 'Pack3', 'Pack4', 'Pack5']:
+        packs_dir.mkdir(pack_name)
+    packs = [os.path.join('Packs', pack_name) for pack_name in os.listdir(packs_dir)]
+    invalid_packs = [pack for pack in packs if not pack.endswith('1')]
+    validate_manager = ValidateManager(validate_all=True, skip_conf_json=True, workers=workers)
+
+    with ChangeCWD(tmpdir):
+        assert not validate_manager.run_validation_on_all_packs()
+
+    expected_errors = [f'{pack} - [BA100]' for pack in invalid_packs]
+    expected_errors.insert(1, 'Packs/Common/pack_metadata.json - [BA100]')
+    assert demisto_sdk.commands.validate.validate_manager.FOUND_FILES_AND_ERRORS == expected_errors
+    assert demisto_sdk.commands.validate.validate_manager.FOUND_FILES_AND_IGNORED_ERRORS == \
+        ['Packs/Pack1 - [BA100]', 'Packs/Common/pack_metadata.json - [BA100]']
+    assert validate_manager.ignored_files == {os.path.join(pack, 'ignored_file') for pack in packs}
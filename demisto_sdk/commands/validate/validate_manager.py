@@ -1,7 +1,10 @@
 import json
 import os
 import re
+import sys
 from configparser import ConfigParser, MissingSectionHeaderError
+from glob import glob
+from multiprocessing import Pool
 from typing import Optional
 
 import click
@@ -65,13 +68,49 @@ from demisto_sdk.commands.common.tools import (filter_packagify_changes,
                                                run_command)
 from demisto_sdk.commands.create_id_set.create_id_set import IDSetCreator
 
+# The validate manager used by the validation worker processes, set by _init_validation_worker.
+_worker_validate_manager = None
+
+
+def _init_validation_worker(validate_manager):
+    """Sets the validate manager used by a validation worker process.
+
+    Args:
+        validate_manager (ValidateManager): the validate manager which started the workers.
+    """
+    global _worker_validate_manager
+    _worker_validate_manager = validate_manager
+
+
+def _run_validation_in_worker(validation):
+    """Runs a single validation of the validate manager in a worker process.
+
+    Args:
+        validation (tuple): the name of the validate manager method to run, its args and its kwargs.
+
+    Returns:
+        tuple. the validation result, the found errors, the found ignored errors and the ignored files.
+    """
+    method_name, args, kwargs = validation
+    del FOUND_FILES_AND_ERRORS[:]
+    del FOUND_FILES_AND_IGNORED_ERRORS[:]
+    _worker_validate_manager.ignored_files = set()
+
+    is_valid = getattr(_worker_validate_manager, method_name)(*args, **kwargs)
+
+    # the worker output is buffered, flush it before handing the result back to the parent
+    sys.stdout.flush()
+    return is_valid, list(FOUND_FILES_AND_ERRORS), list(FOUND_FILES_AND_IGNORED_ERRORS), \
+        _worker_validate_manager.ignored_files
+
 
 class ValidateManager:
     def __init__(
         self, is_backward_check=True, prev_ver=None, use_git=False, only_committed_files=False,
         print_ignored_files=False, skip_conf_json=True, validate_id_set=False, file_path=None,
         validate_all=False, is_external_repo=False, skip_pack_rn_validation=False, print_ignored_errors=False,
-        silence_init_prints=False, no_docker_checks=False, skip_dependencies=False, id_set_path=None, staged=False
+        silence_init_prints=False, no_docker_checks=False, skip_dependencies=False, id_set_path=None, staged=False,
+        workers=1
     ):
         # General configuration
         self.skip_docker_checks = False
@@ -89,6 +128,7 @@ class ValidateManager:
         self.skip_dependencies = skip_dependencies or not use_git
         self.compare_type = '...'
         self.staged = staged
+        self.workers = workers
 
         # Class constants
         self.handle_error = BaseValidator(print_as_warnings=print_ignored_errors).handle_error
@@ -204,12 +244,60 @@ class ValidateManager:
             conf_json_validator = ConfJsonValidator()
             all_packs_valid.add(conf_json_validator.is_valid_conf_json())
 
-        for pack_name in os.listdir(PACKS_DIR):
-            pack_path = os.path.join(PACKS_DIR, pack_name)
-            all_packs_valid.add(self.run_validations_on_pack(pack_path))
+        # Parse the README files of all the packs as mdx in batches, ahead of their validation
+        ReadMeValidator.parse_mdx_files(self.get_content_entities_readme_files(), workers=self.workers)
+
+        packs_validations = [((os.path.join(PACKS_DIR, pack_name),), {}) for pack_name in os.listdir(PACKS_DIR)]
+        all_packs_valid.update(self.run_validations_in_workers('run_validations_on_pack', packs_validations))
 
         return all(all_packs_valid)
 
+    @staticmethod
+    def get_content_entities_readme_files():
+        """Gets the README files of the content entities of all the packs in repo, which are validated in -a mode.
+
+        Returns:
+            list. the README files paths.
+        """
+        readme_files = []
+        for content_dir in CONTENT_ENTITIES_DIRS:
+            readme_files.extend(glob(os.path.join(PACKS_DIR, '*', content_dir, '*', 'README.md')))
+        return sorted(readme_files)
+
+    def run_validations_in_workers(self, method_name, validations):
+        """Runs a validate manager method once per given arguments, sharded across a pool of worker processes.
+        The errors found by the workers are collected back in order, so the final report is the same as the one of
+        a sequential run.
+
+        Args:
+            method_name (str): the name of the validate manager method to run.
+            validations (list): (args, kwargs) tuple per method call.
+
+        Returns:
+            list. the results of the method calls, in the order of the given validations.
+        """
+        if self.workers <= 1 or len(validations) <= 1:
+            return [getattr(self, method_name)(*args, **kwargs) for args, kwargs in validations]
+
+        results = []
+        pool = Pool(processes=self.workers, initializer=_init_validation_worker, initargs=(self,))
+        try:
+            for is_valid, errors, ignored_errors, ignored_files in pool.imap(
+                    _run_validation_in_worker, [(method_name, args, kwargs) for args, kwargs in validations]):
+                FOUND_FILES_AND_ERRORS.extend(error for error in errors if error not in FOUND_FILES_AND_ERRORS)
+                FOUND_FILES_AND_IGNORED_ERRORS.extend(error for error in ignored_errors
+                                                      if error not in FOUND_FILES_AND_IGNORED_ERRORS)
+                self.ignored_files.update(ignored_files)
+                results.append(is_valid)
+            pool.close()
+        except BaseException:
+            pool.terminate()
+            raise
+        finally:
+            pool.join()
+
+        return results
+
     def run_validations_on_pack(self, pack_path):
         """Runs validation on all files in given pack. (i,g,a)
 
@@ -607,7 +695,7 @@ class ValidateManager:
     def validate_modified_files(self, modified_files):
         click.secho(f'\n================= Running validation on modified files =================',
                     fg="bright_cyan")
-        valid_files = set()
+        files_validations = []
         for file_path in modified_files:
             # handle renamed files
             if isinstance(file_path, tuple):
@@ -618,20 +706,24 @@ class ValidateManager:
                 old_file_path = None
 
             pack_name = get_pack_name(file_path)
-            valid_files.add(self.run_validations_on_file(file_path, self.get_error_ignore_list(pack_name),
-                                                         is_modified=True, old_file_path=old_file_path))
+            files_validations.append(((file_path, self.get_error_ignore_list(pack_name)),
+                                      {'is_modified': True, 'old_file_path': old_file_path}))
+
+        valid_files = set(self.run_validations_in_workers('run_validations_on_file', files_validations))
         return all(valid_files)
 
     def validate_added_files(self, added_files, modified_files):
         click.secho(f'\n================= Running validation on newly added files =================',
                     fg="bright_cyan")
 
-        valid_files = set()
+        files_validations = []
         for file_path in added_files:
             pack_name = get_pack_name(file_path)
-            valid_files.add(self.run_validations_on_file(file_path, self.get_error_ignore_list(pack_name),
-                                                         is_modified=False, modified_files=modified_files,
-                                                         added_files=added_files))
+            files_validations.append(((file_path, self.get_error_ignore_list(pack_name)),
+                                      {'is_modified': False, 'modified_files': modified_files,
+                                       'added_files': added_files}))
+
+        valid_files = set(self.run_validations_in_workers('run_validations_on_file', files_validations))
         return all(valid_files)
 
     @staticmethod
@@ -4,24 +4,19 @@ import pytest
 from click.testing import CliRunner
 from demisto_sdk.__main__ import main
 from demisto_sdk.commands.common.git_tools import git_path
-from demisto_sdk.commands.download.tests.downloader_test import Environment
+from demisto_sdk.commands.download.tests.downloader_test import (
+    Environment, serve_custom_content_bundle)
 
 DOWNLOAD_COMMAND = "download"
 DEMISTO_SDK_PATH = join(git_path(), "demisto_sdk")
 
 
 @pytest.fixture
-def demisto_client(mocker):
-    mocker.patch(
-        "demisto_sdk.commands.download.downloader.demisto_client",
-        return_valure="object"
-    )
-    with open('demisto_sdk/tests/test_files/download_command/demisto_api_response', 'r') as f:
-        api_response = f.read()
-    mocker.patch(
-        "demisto_sdk.commands.download.downloader.demisto_client.generic_request_func",
-        return_value=(api_response, None, None)
-    )
+def demisto_client(monkeypatch):
+    with serve_custom_content_bundle() as base_url:
+        monkeypatch.setenv('DEMISTO_BASE_URL', base_url)
+        monkeypatch.setenv('DEMISTO_API_KEY', 'API_KEY')
+        yield
 
 
 def test_integration_download_no_force(demisto_client, tmp_path):